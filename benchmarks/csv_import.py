@@ -0,0 +1,94 @@
+import argparse
+import csv
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from database_manager import DatabaseManager
+
+def create_synthetic_csv(csv_path, rows, duplicate_ratio, seed=0):
+    """용어 rows개짜리 CSV 생성 (duplicate_ratio만큼은 앞선 용어를 공백/대소문자만 바꿔 반복, 100행마다 필드 누락 1행)
+
+    Returns:
+        int: 중복과 필드 누락을 뺀 고유 용어 수
+    """
+    rng = random.Random(seed)
+    unique_terms = []
+    with open(csv_path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file, quoting=csv.QUOTE_MINIMAL)
+        writer.writerow(['term', 'short_description', 'description'])
+        for index in range(rows):
+            if index % 100 == 99:
+                writer.writerow([f"누락 {index}", '요약'])
+                continue
+            if unique_terms and rng.random() < duplicate_ratio:
+                term = rng.choice(unique_terms)
+                writer.writerow([f" {term.upper()} ", '요약 (중복)', '설명 (중복)'])
+                continue
+            term = f"Term {index} 용어"
+            unique_terms.append(term)
+            writer.writerow([term, f"요약 {index}", f"설명, \"{index}\" " * 10])
+    return len(unique_terms)
+
+def import_row_by_row(db_path, csv_path):
+    """기존 방식: 행마다 COUNT(*)로 중복 확인 후 INSERT (term 인덱스 없음)"""
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+        CREATE TABLE term_list (
+            idx INTEGER PRIMARY KEY AUTOINCREMENT,
+            term TEXT,
+            short_description TEXT,
+            description TEXT,
+            file_name TEXT,
+            open_yn INTEGER DEFAULT 1,
+            reg_date TEXT
+        )
+        ''')
+        with open(csv_path, 'r', encoding='utf-8') as file:
+            csv_reader = csv.reader(file, quoting=csv.QUOTE_MINIMAL)
+            next(csv_reader)
+            for row in csv_reader:
+                if len(row) == 3:
+                    cursor.execute('SELECT COUNT(*) FROM term_list WHERE term = ?', (row[0],))
+                    if cursor.fetchone()[0] == 0:
+                        cursor.execute('INSERT INTO term_list (term, short_description, description) VALUES (?, ?, ?)',
+                                       (row[0], row[1], row[2]))
+
+def count_terms(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute('SELECT COUNT(*) FROM term_list').fetchone()[0]
+
+def main():
+    parser = argparse.ArgumentParser(description='CSV 초기 임포트 방식 비교 (합성 CSV)')
+    parser.add_argument('--rows', type=int, default=100_000, help='합성 CSV 행 수')
+    parser.add_argument('--old-rows', type=int, default=10_000, help='기존 방식(O(n²))으로 임포트할 행 수')
+    parser.add_argument('--duplicate-ratio', type=float, default=0.05, help='중복 용어 비율')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='csv_import_') as temp_dir:
+        for rows in dict.fromkeys((args.old_rows, args.rows)):
+            csv_path = os.path.join(temp_dir, f"term_{rows}.csv")
+            unique = create_synthetic_csv(csv_path, rows, args.duplicate_ratio)
+            print(f"\n[{rows:,}행, 고유 용어 {unique:,}개, CSV {os.path.getsize(csv_path) / 1024 / 1024:.1f}MB]")
+
+            db_path = os.path.join(temp_dir, f"bulk_{rows}.db")
+            start = time.perf_counter()
+            DatabaseManager(db_path=db_path, csv_path=csv_path).close()
+            bulk_elapsed = time.perf_counter() - start
+            imported = count_terms(db_path)
+            print(f"  DatabaseManager : {bulk_elapsed:.2f}초 (초당 {rows / bulk_elapsed:,.0f}행), "
+                  f"임포트 {imported:,}개 {'[OK]' if imported == unique else '[FAIL] 고유 용어 수와 다름'}")
+
+            if rows == args.old_rows:
+                db_path = os.path.join(temp_dir, f"row_by_row_{rows}.db")
+                start = time.perf_counter()
+                import_row_by_row(db_path, csv_path)
+                old_elapsed = time.perf_counter() - start
+                # 기존 방식은 공백/대소문자만 다른 용어를 중복으로 보지 못함
+                print(f"  행별 COUNT(*)   : {old_elapsed:.2f}초 (초당 {rows / old_elapsed:,.0f}행), "
+                      f"임포트 {count_terms(db_path):,}개 ({old_elapsed / bulk_elapsed:.0f}배)")
+
+if __name__ == "__main__":
+    main()
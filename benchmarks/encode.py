@@ -0,0 +1,66 @@
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+from database_manager import DatabaseManager
+from image_processor import ImageProcessor
+from utils.image_encoder import ImageEncoder
+
+# 스크립트가 있는 폴더의 상위(루트 경로)를 기본 디렉토리로 설정
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 현재 출력 (보관용 기본 PNG, 업로드용 최적화 PNG)
+BASELINE_PROFILE = 'png'
+
+def render_cards(limit):
+    """term.db 앞쪽 용어의 카드를 메모리에 렌더링 (캐시 미사용)"""
+    processor = ImageProcessor()
+    processor.use_plan_cache = False
+    with DatabaseManager(db_path=os.path.join(BASE_DIR, 'term.db'), read_only=True) as db:
+        cursor = db.conn.cursor()
+        cursor.execute("SELECT term, short_description, description FROM term_list ORDER BY idx LIMIT ?", (limit,))
+        rows = cursor.fetchall()
+    return [processor.render_plan(processor.plan_card(f"{index % 3 + 1:02}", *row)) for index, row in enumerate(rows)]
+
+def measure(images, profile, upload):
+    """프로필별 카드 한 장당 평균 인코딩 시간(ms)과 평균 바이트"""
+    encoder = ImageEncoder(upload_profile=profile)
+    total_bytes = 0
+    start = time.perf_counter()
+    for img in images:
+        if upload:
+            total_bytes += len(encoder.encode_upload(img, 'card').data)
+        else:
+            total_bytes += len(encoder.encode_profile(img, profile))
+    elapsed = time.perf_counter() - start
+    return {'ms': elapsed * 1000 / len(images), 'bytes': total_bytes / len(images)}
+
+def main():
+    parser = argparse.ArgumentParser(description='출력 프로필별 인코딩 시간과 용량 비교')
+    parser.add_argument('--limit', type=int, default=30, help='렌더링할 카드 수 (기본값: 30)')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로 (기본값: bench_results/encode_<시각>.json)')
+    args = parser.parse_args()
+
+    images = render_cards(args.limit)
+    report = {'created_at': datetime.now().isoformat(timespec='seconds'), 'cards': len(images), 'archive': {}, 'upload': {}}
+
+    for target, upload in (('archive', False), ('upload', True)):
+        label = '보관용 (원본 크기)' if target == 'archive' else f"업로드용 (최대 너비 {ImageEncoder().max_width}px)"
+        print(f"\n{label}, 카드 {len(images)}장 평균")
+        print(f"{'프로필':<16}{'인코딩(ms)':>12}{'크기(KB)':>12}{'기준 대비':>10}")
+        for profile in ImageEncoder.PROFILES:
+            report[target][profile] = measure(images, profile, upload)
+        baseline = report[target]['png_optimized' if upload else BASELINE_PROFILE]
+        for profile, stats in report[target].items():
+            ratio = stats['bytes'] / baseline['bytes']
+            print(f"{profile:<16}{stats['ms']:>12.1f}{stats['bytes'] / 1024:>12.1f}{ratio:>10.0%}")
+
+    output_path = args.output or os.path.join(BASE_DIR, 'bench_results', f"encode_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output_path}")
+
+if __name__ == "__main__":
+    main()
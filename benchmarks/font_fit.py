@@ -0,0 +1,62 @@
+import os
+import time
+from database_manager import DatabaseManager
+from image_processor import ImageProcessor
+from utils.font_cache import FontCache
+from utils.font_fitter import FontFitter
+
+# 스크립트가 있는 폴더의 상위(루트 경로)를 기본 디렉토리로 설정
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_terms(db_path):
+    """term.db의 모든 용어 조회"""
+    with DatabaseManager(db_path=db_path, read_only=True) as db:
+        cursor = db.conn.cursor()
+        cursor.execute("SELECT term, short_description, description FROM term_list ORDER BY idx")
+        return cursor.fetchall()
+
+def run(strategy, rows):
+    """주어진 탐색 방식으로 전체 용어의 폰트 크기를 맞추고 (결과, 통계, 소요 시간) 반환"""
+    processor = ImageProcessor()
+    processor.font_fitter = FontFitter(strategy=strategy)
+    processor.preload_fonts(all_sizes=True)
+
+    results = []
+    start = time.perf_counter()
+    for term, short_description, description in rows:
+        for name, text in (('term', term), ('short_description', short_description), ('description', description)):
+            font, wrapped_text = processor.fit_text_field(name, text)
+            results.append((getattr(font, 'size', None), wrapped_text))
+    elapsed = time.perf_counter() - start
+    return results, processor.font_fitter.get_stats(), elapsed
+
+def main():
+    rows = load_terms(os.path.join(BASE_DIR, 'term.db'))
+    print(f"용어 {len(rows)}개, 텍스트 영역 {len(rows) * 3}개")
+
+    linear_results, linear_stats, linear_elapsed = run('linear', rows)
+    bisect_results, bisect_stats, bisect_elapsed = run('bisect', rows)
+
+    for label, stats, elapsed in (('linear', linear_stats, linear_elapsed), ('bisect', bisect_stats, bisect_elapsed)):
+        print(f"[{label}] 반복 {stats['iterations']}회, 측정 {stats['measurements']}회 "
+              f"(탐색당 평균 {stats['measurements_per_search']:.1f}회, 최대 {stats['max_measurements']}회), 소요 시간 {elapsed:.2f}초")
+
+    # 긴 용어처럼 초기 크기에서 들어가지 않는 경우만 따로 비교
+    long_rows = [(term * 3, short_description * 2, description * 2) for term, short_description, description in rows[:50]]
+    long_linear_results, long_linear_stats, _ = run('linear', long_rows)
+    long_bisect_results, long_bisect_stats, _ = run('bisect', long_rows)
+    print(f"[긴 텍스트] linear 측정 {long_linear_stats['measurements']}회 / bisect 측정 {long_bisect_stats['measurements']}회")
+
+    mismatches = sum(1 for a, b in zip(linear_results, bisect_results) if a != b)
+    long_mismatches = sum(1 for a, b in zip(long_linear_results, long_bisect_results) if a != b)
+    print(f"측정 횟수 {linear_stats['measurements'] / max(bisect_stats['measurements'], 1):.1f}배 감소, "
+          f"속도 {linear_elapsed / max(bisect_elapsed, 1e-9):.1f}배")
+    print(f"결과 불일치: {mismatches}건 (긴 텍스트 {long_mismatches}건)")
+    print(f"폰트 캐시: {FontCache().get_stats()}")
+
+    # bisect는 linear와 같은 결과를 내야 함
+    if mismatches or long_mismatches:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
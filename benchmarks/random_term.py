@@ -0,0 +1,105 @@
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from collections import Counter
+from database_manager import DatabaseManager
+
+def create_synthetic_db(db_path, rows, published_ratio, closed_ratio, seed=0):
+    """term_list에 합성 용어 rows개 생성 (published_ratio만큼 게시됨, closed_ratio만큼 비공개)"""
+    rng = random.Random(seed)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute('''
+        CREATE TABLE term_list (
+            idx INTEGER PRIMARY KEY AUTOINCREMENT,
+            term TEXT NOT NULL,
+            short_description TEXT,
+            description TEXT,
+            file_name TEXT,
+            open_yn INTEGER DEFAULT 1,
+            reg_date TEXT
+        )
+        ''')
+
+        def generate():
+            for index in range(rows):
+                published = rng.random() < published_ratio
+                yield (f"용어 {index}", f"요약 {index}", f"설명 {index} " * 10,
+                       f"output/{index}.png" if published else None, 0 if rng.random() < closed_ratio else 1)
+
+        conn.executemany('''
+        INSERT INTO term_list (term, short_description, description, file_name, open_yn) VALUES (?, ?, ?, ?, ?)
+        ''', generate())
+
+def order_by_random(db_path, count=3):
+    """기존 방식: 조건에 맞는 모든 행을 무작위 정렬"""
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute('''
+            SELECT idx, term, short_description, description
+            FROM term_list
+            WHERE open_yn = 1 AND file_name IS NULL
+            ORDER BY RANDOM()
+            LIMIT ?
+        ''', (count,)).fetchall()
+
+def measure(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2], timings[int(len(timings) * 0.95)]
+
+def check_uniformity(temp_dir, draws):
+    """작은 DB에서 여러 번 뽑아 행별 선택 횟수의 편차 확인 (기각 샘플링 / 위치 샘플링 각각)"""
+    db_path = os.path.join(temp_dir, 'uniform.db')
+    create_synthetic_db(db_path, rows=1000, published_ratio=0.9, closed_ratio=0.05, seed=1)
+    manager = DatabaseManager(db_path=db_path)
+    with sqlite3.connect(db_path) as conn:
+        eligible = [row[0] for row in conn.execute(f"SELECT idx FROM term_list WHERE {DatabaseManager.UNPUBLISHED}")]
+        cursor = conn.cursor()
+        for label, sample in (('기각 샘플링', manager._sample_by_rowid), ('위치 샘플링', manager._sample_by_offset)):
+            counter = Counter()
+            for _ in range(draws):
+                rows = sample(cursor, 3) or manager._sample_by_offset(cursor, 3)
+                counter.update(row[0] for row in rows)
+            expected = draws * 3 / len(eligible)
+            chi_square = sum((counter[idx] - expected) ** 2 / expected for idx in eligible)
+            print(f"  {label}: 대상 {len(eligible)}개, 행당 기대 {expected:.1f}회, "
+                  f"최소 {min(counter[idx] for idx in eligible)}회 / 최대 {max(counter[idx] for idx in eligible)}회, "
+                  f"카이제곱 {chi_square:.0f} (자유도 {len(eligible) - 1}), 대상 밖 선택 {len(set(counter) - set(eligible))}개")
+
+def main():
+    parser = argparse.ArgumentParser(description='무작위 용어 선택 방식 비교 (합성 DB)')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='합성 용어 수')
+    parser.add_argument('--repeat', type=int, default=20, help='방식별 반복 횟수')
+    parser.add_argument('--draws', type=int, default=20000, help='균등성 확인 추첨 횟수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='random_term_') as temp_dir:
+        # 게시된 비율별 (대부분 미게시 / 절반 / 거의 모두 게시되어 기각 샘플링이 포기하는 경우)
+        for published_ratio in (0.1, 0.5, 0.999):
+            db_path = os.path.join(temp_dir, f"synthetic_{published_ratio}.db")
+            start = time.perf_counter()
+            create_synthetic_db(db_path, args.rows, published_ratio, closed_ratio=0.02)
+            manager = DatabaseManager(db_path=db_path)
+            build_elapsed = time.perf_counter() - start
+            with sqlite3.connect(db_path) as conn:
+                eligible = conn.execute(f"SELECT COUNT(*) FROM term_list WHERE {DatabaseManager.UNPUBLISHED}").fetchone()[0]
+
+            print(f"\n[{args.rows:,}행, 게시 {published_ratio:.1%}, 선택 대상 {eligible:,}개] (생성 {build_elapsed:.1f}초)")
+            random_p50, random_p95 = measure(lambda: order_by_random(db_path), args.repeat)
+            indexed_p50, indexed_p95 = measure(lambda: manager.get_random_term(), args.repeat)
+            print(f"  ORDER BY RANDOM(): p50 {random_p50:.2f}ms, p95 {random_p95:.2f}ms")
+            print(f"  get_random_term : p50 {indexed_p50:.2f}ms, p95 {indexed_p95:.2f}ms "
+                  f"({random_p50 / max(indexed_p50, 1e-9):.1f}배)")
+            os.remove(db_path)
+
+        print("\n[균등성 확인]")
+        check_uniformity(temp_dir, args.draws)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+import argparse
+import glob
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+import PIL
+from database_manager import DatabaseManager
+from image_processor import ImageProcessor
+
+# 스크립트가 있는 폴더의 상위(루트 경로)를 기본 디렉토리로 설정
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STAGES = ['template', 'card_store', 'font_fitting', 'drawing', 'encode', 'save']
+
+def load_corpus():
+    """term.db의 모든 용어와 source/*.json의 모든 항목"""
+    corpus = []
+    with DatabaseManager(db_path=os.path.join(BASE_DIR, 'term.db'), read_only=True) as db:
+        cursor = db.conn.cursor()
+        cursor.execute("SELECT term, short_description, description FROM term_list ORDER BY idx")
+        for term, short_description, description in cursor.fetchall():
+            corpus.append({'source': 'term.db', 'term': term, 'short_description': short_description, 'description': description})
+
+    for json_path in sorted(glob.glob(os.path.join(BASE_DIR, 'source', '*.json'))):
+        with open(json_path, 'r', encoding='utf-8') as f:
+            for item in json.load(f):
+                corpus.append({
+                    'source': os.path.basename(json_path),
+                    'term': item['term'],
+                    'short_description': item['short_description'],
+                    'description': item['description']
+                })
+    return corpus
+
+def percentile(values, percent):
+    """정렬된 값의 백분위수 (선형 보간)"""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    position = (len(values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+def summarize(values):
+    """소요 시간 목록의 요약 (밀리초)"""
+    return {
+        'count': len(values),
+        'p50_ms': percentile(values, 50) * 1000,
+        'p95_ms': percentile(values, 95) * 1000,
+        'max_ms': max(values) * 1000 if values else 0.0,
+        'total_s': sum(values)
+    }
+
+def run_benchmark(corpus, workers=1, use_cache=False, sizes=()):
+    """임시 디렉토리에 전체 코퍼스를 렌더링하고 카드별/단계별 소요 시간 반환"""
+    with tempfile.TemporaryDirectory(prefix='card_bench_') as temp_dir:
+        processor = ImageProcessor(cache_dir=os.path.join(temp_dir, 'cache'))
+        if not use_cache:
+            processor.use_plan_cache = False
+            processor.card_store = None
+
+        items = []
+        for index, entry in enumerate(corpus):
+            items.append({
+                'no': f"{index % 3 + 1:02}",
+                'term': entry['term'],
+                'short_description': entry['short_description'],
+                'description': entry['description'],
+                'output_path': os.path.join(temp_dir, f"{index:04}.png")
+            })
+
+        start = time.perf_counter()
+        results = processor.create_cards(items, workers=workers, sizes=sizes)
+        wall_time = time.perf_counter() - start
+
+    return results, wall_time
+
+def build_report(corpus, results, wall_time, workers, use_cache, sizes):
+    card_times = [sum(result.timings.values()) for result in results]
+    stage_times = {stage: [result.timings[stage] for result in results if stage in result.timings] for stage in STAGES}
+    slowest = sorted(zip(card_times, corpus), key=lambda pair: pair[0], reverse=True)[:5]
+
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'pillow': PIL.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        },
+        'settings': {'workers': workers, 'use_cache': use_cache, 'sizes': list(sizes)},
+        'cards': len(results),
+        'wall_time_s': wall_time,
+        'cards_per_second': len(results) / wall_time if wall_time else 0.0,
+        'per_card': summarize(card_times),
+        'stages': {stage: summarize(values) for stage, values in stage_times.items() if values},
+        'slowest': [{'term': entry['term'], 'source': entry['source'], 'ms': seconds * 1000} for seconds, entry in slowest]
+    }
+
+def print_report(report):
+    print(f"카드 {report['cards']}장, 전체 {report['wall_time_s']:.2f}초 ({report['cards_per_second']:.1f}장/초, "
+          f"작업 프로세스 {report['settings']['workers']}개, 캐시 {'사용' if report['settings']['use_cache'] else '미사용'})")
+    print(f"{'단계':<14}{'p50(ms)':>10}{'p95(ms)':>10}{'max(ms)':>10}{'합계(s)':>10}")
+    rows = [('card', report['per_card'])] + list(report['stages'].items())
+    for name, stats in rows:
+        print(f"{name:<14}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['max_ms']:>10.2f}{stats['total_s']:>10.2f}")
+    print("가장 느린 카드:")
+    for entry in report['slowest']:
+        print(f"  {entry['ms']:.1f}ms {entry['term']} ({entry['source']})")
+
+def compare_reports(report, baseline, threshold):
+    """이전 결과와 p50/p95를 비교해 threshold 비율 이상 느려진 항목 목록 반환"""
+    regressions = []
+    rows = [('card', report['per_card'], baseline.get('per_card'))]
+    rows += [(stage, stats, baseline.get('stages', {}).get(stage)) for stage, stats in report['stages'].items()]
+
+    print(f"\n비교 기준: {baseline.get('created_at', '알 수 없음')}")
+    for name, stats, base in rows:
+        if not base:
+            continue
+        for metric in ('p50_ms', 'p95_ms'):
+            if base[metric] <= 0:
+                continue
+            change = stats[metric] / base[metric] - 1
+            marker = ' <- 느려짐' if change > threshold else ''
+            print(f"  {name:<14}{metric:<8}{base[metric]:>9.2f} -> {stats[metric]:>9.2f}ms ({change:+.1%}){marker}")
+            if change > threshold:
+                regressions.append((name, metric, change))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='카드 렌더링 벤치마크 (term.db + source/*.json 전체)')
+    parser.add_argument('--workers', type=int, default=1, help='작업 프로세스 수 (기본값: 1, 카드별 시간 측정에 적합)')
+    parser.add_argument('--use-cache', action='store_true', help='레이아웃 계획 캐시와 카드 저장소 사용')
+    parser.add_argument('--sizes', default='', help='함께 인코딩할 출력 크기 이름 (쉼표 구분, 예: upload)')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로 (기본값: bench_results/render_<시각>.json)')
+    parser.add_argument('--compare', default=None, help='비교할 이전 결과 JSON 경로')
+    parser.add_argument('--threshold', type=float, default=0.2, help='회귀로 판단할 느려짐 비율 (기본값: 0.2)')
+    args = parser.parse_args()
+
+    sizes = [name for name in args.sizes.split(',') if name]
+    corpus = load_corpus()
+    results, wall_time = run_benchmark(corpus, workers=args.workers, use_cache=args.use_cache, sizes=sizes)
+    report = build_report(corpus, results, wall_time, args.workers, args.use_cache, sizes)
+    print_report(report)
+
+    output_path = args.output or os.path.join(
+        BASE_DIR, 'bench_results', f"render_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output_path}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_reports(report, baseline, args.threshold)
+        if regressions:
+            print(f"성능 회귀 {len(regressions)}건")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import os
+import subprocess
+import sys
+
+# 스크립트가 있는 폴더의 상위(루트 경로)에서 각 검사를 실행
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHECKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def main():
+    """checks/ 의 모든 검사를 각각 별도 프로세스로 실행하고 결과 요약 (인자로 이름을 주면 그 검사만)"""
+    names = sys.argv[1:] or sorted(
+        os.path.splitext(name)[0] for name in os.listdir(CHECKS_DIR)
+        if name.endswith('.py') and name not in ('__main__.py', 'common.py')
+    )
+    failed = []
+    for name in names:
+        print(f"\n===== {name} =====", flush=True)
+        if subprocess.run([sys.executable, '-m', f"checks.{name}"], cwd=BASE_DIR).returncode != 0:
+            failed.append(name)
+
+    print(f"\n검사 {len(names) - len(failed)}/{len(names)}개 통과" + (f" (실패: {', '.join(failed)})" if failed else ''))
+    if failed:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import io
+import json
+import time
+from email import policy
+from email.parser import BytesParser
+from PIL import Image
+from checks.common import check, report, StandInHandler, StandInServer
+from utils.api_util import ApiUtil, ApiError
+from utils.image_encoder import EncodedImage
+
+class BoardStandInHandler(StandInHandler):
+    """게시판 API(/api/board-content) 대역: 받은 요청을 기록하고 성공 응답 반환"""
+    requests_log = []
+
+    def do_POST(self):
+        if self.path.startswith('/slow'):
+            time.sleep(1.5)
+
+        body = self.read_body()
+        record = {
+            'client_port': self.client_address[1],
+            'content_length': self.headers.get('Content-Length'),
+            'transfer_encoding': self.headers.get('Transfer-Encoding'),
+            'content_type': self.headers.get('Content-Type'),
+            'fields': {},
+            'files': {}
+        }
+        if record['content_type'].startswith('multipart/form-data'):
+            message = BytesParser(policy=policy.HTTP).parsebytes(
+                f"Content-Type: {record['content_type']}\r\n\r\n".encode('utf-8') + body
+            )
+            for part in message.iter_parts():
+                name = part.get_param('name', header='content-disposition')
+                filename = part.get_filename()
+                if filename is None:
+                    record['fields'][name] = part.get_payload(decode=True).decode('utf-8')
+                else:
+                    record['files'][name] = (filename, part.get_content_type(), part.get_payload(decode=True))
+        else:
+            record['fields'] = json.loads(body)
+        BoardStandInHandler.requests_log.append(record)
+
+        images = [f"http://localhost/{record['files'][name][0]}" for name in record['files'] if name.startswith('image')]
+        try:
+            self.respond(200, {'success': True, 'data': {'image_urls': images}})
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+def make_image(color, filename):
+    buffer = io.BytesIO()
+    Image.new('RGB', (900, 900), color).save(buffer, format='PNG')
+    return EncodedImage(filename, buffer.getvalue(), 'png')
+
+def main():
+    log = BoardStandInHandler.requests_log
+    results = []
+
+    with StandInServer(BoardStandInHandler) as server:
+        api = ApiUtil(base_url=f"{server.base_url}/api", connect_timeout=2, read_timeout=5)
+        images = [make_image((174, 151, 116), '20250101_01.png'), make_image((255, 255, 255), '20250101_02.png')]
+        post = dict(title='제목', content='<p>내용 "따옴표"</p>', category='경제용어', writer='admin')
+
+        # 이미지 포함 게시글 2번 + 이미지 없는 게시글 1번
+        api.create_post(**post, image_paths=images, thumbnail_image_path='img/main.png')
+        api.create_post(**post, image_paths=[images[0]])
+        api.create_post(**post)
+
+        first = log[0]
+        results.append(check(first['transfer_encoding'] is None and first['content_length'] is not None,
+                             "multipart 본문을 청크 전송 없이 Content-Length로 전송"))
+        results.append(check(first['fields'] == post, "폼 필드 전송"))
+        results.append(check(first['files']['image[0]'] == ('20250101_01.png', 'image/png', images[0].data)
+                             and first['files']['image[1]'][2] == images[1].data, "EncodedImage 바이트를 그대로 전송"))
+        results.append(check(first['files']['thumbnail_image'][0] == 'img/main.png', "썸네일 이미지 경로를 압축해 전송"))
+        results.append(check(log[2]['fields'] == post, "이미지 없는 게시글은 JSON으로 전송"))
+        results.append(check(len({record['client_port'] for record in log}) == 1,
+                             f"연결 재사용 (요청 {len(log)}번, 연결 {len({record['client_port'] for record in log})}개)"))
+
+        # 응답 대기 타임아웃
+        slow_api = ApiUtil(base_url=f"{server.base_url}/slow/api", connect_timeout=2, read_timeout=0.5)
+        for label, kwargs in (('이미지 포함', {'image_paths': [images[0]]}), ('이미지 없음', {})):
+            start = time.perf_counter()
+            try:
+                slow_api.create_post(**post, **kwargs)
+                timed_out = False
+            except ApiError:
+                timed_out = True
+            results.append(check(timed_out and time.perf_counter() - start < 1.5, f"응답 대기 타임아웃 ({label})"))
+
+        api.close()
+        slow_api.close()
+
+    report(results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import time
+from checks.common import check, report
+from utils.card_store import CardStore
+
+ENTRY_BYTES = 4 * 1024
+
+def fill(store, start, count):
+    """store에 ENTRY_BYTES 크기 항목 count개를 저장하고 한 번 저장하는 데 걸린 평균 시간(ms) 반환"""
+    data = os.urandom(ENTRY_BYTES)
+    begin = time.perf_counter()
+    for index in range(start, start + count):
+        store.put_data(f"{index:064x}", data, '.variant')
+    return (time.perf_counter() - begin) * 1000 / count
+
+def count_scans(store):
+    """store의 저장소 순회 횟수를 세도록 감싸고 횟수 목록 반환"""
+    scans = []
+    scan = store._scan
+
+    def counted():
+        scans.append(1)
+        return scan()
+
+    store._scan = counted
+    return scans
+
+def stored_bytes(store_dir):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(store_dir) for name in files)
+
+def main():
+    results = []
+    with tempfile.TemporaryDirectory(prefix='card_store_') as temp_dir:
+        # 1. 저장 비용이 저장소 크기와 상관없이 일정 (순회는 처음 저장할 때 한 번)
+        store = CardStore(os.path.join(temp_dir, 'large'), max_bytes=1024 * 1024 * 1024)
+        scans = count_scans(store)
+        first = fill(store, 0, 200)
+        fill(store, 200, 4600)
+        later = fill(store, 4800, 200)
+        results.append(check(len(scans) == 1 and later < max(first * 3, 1.0),
+                             f"저장 1번 평균 {first:.2f}ms (항목 200개) / {later:.2f}ms (항목 5,000개), 저장소 순회 {len(scans)}번"))
+        results.append(check(store._total_bytes == stored_bytes(store.store_dir), "누적한 전체 크기가 실제 크기와 같음"))
+
+        # 2. 새 인스턴스(다음 실행)는 처음 저장할 때 기존 파일을 셈
+        reopened = CardStore(store.store_dir, max_bytes=store.max_bytes)
+        fill(reopened, 5000, 1)
+        results.append(check(reopened._total_bytes == stored_bytes(store.store_dir), "다시 열면 기존 파일 크기부터 셈"))
+
+        # 3. max_bytes를 넘으면 낮은 기준(LOW_WATER_RATIO)까지 정리해 다음 정리까지 여유를 둠
+        capacity = 100
+        store = CardStore(os.path.join(temp_dir, 'small'), max_bytes=capacity * ENTRY_BYTES)
+        scans = count_scans(store)
+        fill(store, 0, 500)
+        total = stored_bytes(store.store_dir)
+        low_water = int(capacity * CardStore.LOW_WATER_RATIO)
+        results.append(check(total <= store.max_bytes and store._total_bytes == total,
+                             f"저장소 크기 {total // ENTRY_BYTES}개 분량 (상한 {capacity}개)"))
+        results.append(check(len(scans) <= 1 + (500 - capacity) // (capacity - low_water) + 1,
+                             f"저장 500번에 저장소 순회 {len(scans)}번 (정리할 때만)"))
+        results.append(check(store.get_data(f"{499:064x}", '.variant') is not None
+                             and store.get_data(f"{0:064x}", '.variant') is None, "오래된 항목부터 삭제"))
+
+    report(results)
+
+if __name__ == "__main__":
+    main()
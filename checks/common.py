@@ -0,0 +1,52 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+def check(condition, message):
+    """확인 결과 한 줄 출력 후 condition 반환"""
+    print(f"[{'OK' if condition else 'FAIL'}] {message}")
+    return condition
+
+def report(results):
+    """통과한 확인 수를 출력하고, 하나라도 실패했으면 종료 코드 1로 종료"""
+    print(f"\n{sum(results)}/{len(results)} 통과")
+    if not all(results):
+        raise SystemExit(1)
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """외부 API 대역 서버의 요청 처리기 기본 클래스 (연결 유지, 요청 로그 출력 안 함)"""
+    protocol_version = 'HTTP/1.1'
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def read_body(self):
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def respond(self, status, body=b'', content_type='application/json'):
+        """상태 코드와 본문으로 응답 (bytes가 아니면 JSON으로 인코딩, HEAD 요청은 본문 없이)"""
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+
+class StandInServer:
+    """요청 처리기로 빈 포트에 대역 서버를 띄워 백그라운드 스레드에서 실행 (with 문 안에서만 동작)"""
+
+    def __init__(self, handler, host='127.0.0.1'):
+        self.server = ThreadingHTTPServer((host, 0), handler)
+        self.port = self.server.server_port
+        self.base_url = f"http://{host}:{self.port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.server.shutdown()
+        self.server.server_close()
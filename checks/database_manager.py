@@ -0,0 +1,161 @@
+import os
+import sqlite3
+import tempfile
+import time
+from checks.common import check, report
+from database_manager import DatabaseManager
+from publish_outbox import PublishOutbox
+
+def count_rows(db_path):
+    """다른 연결에서 본 term_list 행 수 (커밋된 내용만 보임)"""
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute('SELECT COUNT(*) FROM term_list').fetchone()[0]
+
+def main():
+    results = []
+    with tempfile.TemporaryDirectory(prefix='database_manager_') as temp_dir:
+        db_path = os.path.join(temp_dir, 'term.db')
+        db = DatabaseManager(db_path=db_path)
+
+        # 1. 연결 설정
+        pragmas = {name: db.execute(f"PRAGMA {name}").fetchone()[0] for name in DatabaseManager.PRAGMAS}
+        results.append(check(pragmas['journal_mode'] == 'wal' and pragmas['synchronous'] == 1
+                             and pragmas['cache_size'] == -16000 and pragmas['mmap_size'] == 256 * 1024 * 1024,
+                             f"연결 설정 {pragmas}"))
+        connection = db.conn
+        db.get_random_term()
+        db.update_term_list(1, 'output/x.png')
+        results.append(check(db.conn is connection, "메서드 호출마다 같은 연결을 재사용"))
+
+        # 2. 트랜잭션 범위: 커밋 전에는 다른 연결에 보이지 않고, 예외가 나면 롤백
+        insert = 'INSERT INTO term_list (term, short_description, description) VALUES (?, ?, ?)'
+        before = count_rows(db_path)
+        with db.transaction():
+            db.execute(insert, ('용어1', '요약', '설명'))
+            db.execute(insert, ('용어2', '요약', '설명'))
+            visible_inside = count_rows(db_path)
+        results.append(check(visible_inside == before and count_rows(db_path) == before + 2,
+                             "트랜잭션 안의 변경은 끝날 때 한 번에 커밋"))
+
+        try:
+            with db.transaction():
+                db.execute(insert, ('용어3', '요약', '설명'))
+                raise RuntimeError("중간 실패")
+        except RuntimeError:
+            pass
+        results.append(check(count_rows(db_path) == before + 2 and not db.conn.in_transaction, "예외가 나면 롤백"))
+
+        # 3. 중첩 트랜잭션: 안쪽 실패는 안쪽만 롤백, 커밋은 바깥 범위가 끝날 때
+        with db.transaction():
+            db.execute(insert, ('용어4', '요약', '설명'))
+            try:
+                with db.transaction():
+                    db.execute(insert, ('용어5', '요약', '설명'))
+                    raise RuntimeError("안쪽 실패")
+            except RuntimeError:
+                pass
+            with db.transaction():
+                db.execute(insert, ('용어6', '요약', '설명'))
+            visible_inside = count_rows(db_path)
+        terms = {row[0] for row in db.execute("SELECT term FROM term_list WHERE term LIKE '용어%'")}
+        results.append(check(visible_inside == before + 2 and terms == {'용어1', '용어2', '용어4', '용어6'},
+                             f"중첩 트랜잭션은 SAVEPOINT로 바깥에 합류 ({sorted(terms)})"))
+
+        # 4. 건별 커밋과 한 트랜잭션 비교
+        rows = [(f"속도 {index}", '요약', '설명') for index in range(2000)]
+        start = time.perf_counter()
+        for row in rows[:1000]:
+            db.execute(insert, row)
+        autocommit_elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        with db.transaction():
+            for row in rows[1000:]:
+                db.execute(insert, row)
+        transaction_elapsed = time.perf_counter() - start
+        print(f"    INSERT 1000건: 건별 커밋 {autocommit_elapsed * 1000:.0f}ms, 한 트랜잭션 {transaction_elapsed * 1000:.0f}ms")
+
+        # 5. 게시 표시: 아웃박스 작업 등록과 함께 한 번만 커밋
+        outbox = PublishOutbox(db, store_dir=os.path.join(temp_dir, 'store'))
+        statements = []
+        db.conn.set_trace_callback(statements.append)
+        with db.transaction():
+            for channel in ('board', 'telegram'):
+                outbox.enqueue(channel, {'title': '제목'})
+            updated = db.mark_published([(2, 'output/a.png'), (3, 'output/b.png'), (4, 'output/c.png')])
+        db.conn.set_trace_callback(None)
+        commits = sum(statement == 'COMMIT' for statement in statements)
+        with sqlite3.connect(db_path) as conn:
+            marked = conn.execute("SELECT file_name, reg_date FROM term_list WHERE idx IN (2, 3, 4) ORDER BY idx").fetchall()
+            jobs = conn.execute("SELECT COUNT(*) FROM publish_outbox").fetchone()[0]
+        results.append(check(updated == 3 and [row[0] for row in marked] == ['output/a.png', 'output/b.png', 'output/c.png']
+                             and len({row[1] for row in marked}) == 1 and jobs == 2,
+                             "용어 3개 표시와 작업 2개 등록 (같은 등록 시각)"))
+        results.append(check(commits == 1, f"커밋 {commits}번 (executemany 한 번)"))
+
+        try:
+            with db.transaction():
+                outbox.enqueue('instagram', {'title': '제목'})
+                db.mark_published([(5, 'output/d.png')])
+                raise RuntimeError("게시 표시 뒤 중단")
+        except RuntimeError:
+            pass
+        with sqlite3.connect(db_path) as conn:
+            file_name = conn.execute("SELECT file_name FROM term_list WHERE idx = 5").fetchone()[0]
+            jobs = conn.execute("SELECT COUNT(*) FROM publish_outbox").fetchone()[0]
+        results.append(check(file_name is None and jobs == 2, "중간에 중단되면 작업 등록과 게시 표시가 함께 취소"))
+
+        with DatabaseManager(db_path=db_path) as other:
+            results.append(check(other.execute('SELECT COUNT(*) FROM term_list').fetchone()[0] == before + 2004,
+                                 "with 문으로 연 연결은 끝날 때 닫힘"))
+        results.append(check(other.conn is None, "close() 뒤 연결 정리"))
+        db.close()
+
+        # 6. 중복된 용어가 있는 기존 DB: 용어 인덱스 마이그레이션은 한 번만 실행
+        legacy_path = os.path.join(temp_dir, 'legacy.db')
+        with sqlite3.connect(legacy_path) as conn:
+            conn.execute('CREATE TABLE term_list (idx INTEGER PRIMARY KEY AUTOINCREMENT, term TEXT NOT NULL, short_description TEXT, '
+                         'description TEXT, file_name TEXT, open_yn INTEGER DEFAULT 1, reg_date TEXT)')
+            conn.executemany('INSERT INTO term_list (term) VALUES (?)', [('수입',), ('환율',), ('수입',)])
+        statements = []
+        for _ in range(2):
+            with DatabaseManager(db_path=legacy_path) as legacy:
+                legacy.conn.set_trace_callback(statements.append)
+                legacy._initialize_database(True)
+                plan = legacy.execute(f"EXPLAIN QUERY PLAN SELECT idx FROM term_list WHERE {legacy.TERM_KEY} = {legacy.term_key()}",
+                                      (' 수입 ',)).fetchall()
+                version = legacy.execute('PRAGMA user_version').fetchone()[0]
+        index_sql = [statement for statement in statements if 'idx_term_list_term' in statement]
+        results.append(check(version == DatabaseManager.SCHEMA_VERSION and not index_sql and 'idx_term_list_term' in str(plan),
+                             "중복이 있으면 일반 인덱스로 만들고 다음 연결부터 다시 시도하지 않음 (정규화 조회는 인덱스 사용)"))
+
+        with sqlite3.connect(legacy_path) as conn:
+            conn.execute('DELETE FROM term_list WHERE idx = 3')
+            conn.execute('PRAGMA user_version = 0')
+        with DatabaseManager(db_path=legacy_path) as legacy:
+            unique = legacy.execute("SELECT \"unique\" FROM pragma_index_list('term_list') WHERE name = 'idx_term_list_term'").fetchone()
+        results.append(check(unique == (1,), "중복을 정리하고 user_version을 0으로 되돌리면 고유 인덱스 생성"))
+
+        # 7. 읽기 전용 연결은 파일을 바꾸지 않음 (스키마/인덱스 생성, WAL 전환 없음)
+        plain_path = os.path.join(temp_dir, 'plain.db')
+        with sqlite3.connect(plain_path) as conn:
+            conn.execute('CREATE TABLE term_list (idx INTEGER PRIMARY KEY AUTOINCREMENT, term TEXT NOT NULL, short_description TEXT, '
+                         'description TEXT, file_name TEXT, open_yn INTEGER DEFAULT 1, reg_date TEXT)')
+            conn.execute("INSERT INTO term_list (term) VALUES ('수입')")
+        with open(plain_path, 'rb') as file:
+            original = file.read()
+        with DatabaseManager(db_path=plain_path, read_only=True) as reader:
+            rows = reader.execute('SELECT term FROM term_list').fetchall()
+            try:
+                reader.execute("INSERT INTO term_list (term) VALUES ('환율')")
+                writable = True
+            except sqlite3.OperationalError:
+                writable = False
+        with open(plain_path, 'rb') as file:
+            unchanged = file.read() == original
+        results.append(check(rows == [('수입',)] and not writable and unchanged
+                             and not os.path.exists(plain_path + '-wal'), "읽기 전용 연결은 조회만 하고 파일을 바꾸지 않음"))
+
+    report(results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import time
+import requests
+from checks.common import check, report, StandInHandler, StandInServer
+from utils.http_client import HttpClient, CircuitOpenError
+
+class FlakyHandler(StandInHandler):
+    """지정한 횟수만큼 503을 돌려준 뒤 성공하는 대역 서버 (/down은 항상 503)"""
+    failures_left = 0
+    hits = []
+
+    @classmethod
+    def reset(cls, failures):
+        cls.failures_left = failures
+        cls.hits = []
+
+    def _handle(self):
+        self.read_body()
+        with self.lock:
+            FlakyHandler.hits.append((self.command, self.path, self.client_address[1]))
+            fail = self.path.startswith('/down') or FlakyHandler.failures_left > 0
+            if fail and not self.path.startswith('/down'):
+                FlakyHandler.failures_left -= 1
+        self.respond(503 if fail else 200, {'ok': not fail})
+
+    do_GET = do_POST = do_HEAD = _handle
+
+def main():
+    results = []
+    with StandInServer(FlakyHandler) as server:
+        # 프로세스 전역 클라이언트를 짧은 대기 시간으로 설정
+        client = HttpClient(max_retries=3, base_delay=0.05, max_delay=0.2, failure_threshold=3, reset_timeout=0.5)
+
+        # 1. 멱등 요청은 503이면 재시도, POST는 재시도하지 않음
+        FlakyHandler.reset(failures=2)
+        response = client.get(f"{server.base_url}/bot123:secret/getMe")
+        results.append(check(response.status_code == 200 and len(FlakyHandler.hits) == 3, f"GET 503 2번 후 재시도로 성공 (요청 {len(FlakyHandler.hits)}번)"))
+        results.append(check(len({port for _, _, port in FlakyHandler.hits}) == 1, "재시도와 요청이 같은 연결을 재사용"))
+
+        FlakyHandler.reset(failures=1)
+        response = client.post(f"{server.base_url}/v1/cafe/100/menu/7/articles", data={'a': 1})
+        results.append(check(response.status_code == 503 and len(FlakyHandler.hits) == 1, "POST는 재시도하지 않음"))
+        FlakyHandler.reset(failures=1)
+        response = client.post(f"{server.base_url}/oauth2.0/token", data={'a': 1}, idempotent=True)
+        results.append(check(response.status_code == 200 and len(FlakyHandler.hits) == 2, "idempotent=True인 POST는 재시도"))
+
+        # 2. 연속 실패하면 서킷이 열려 요청을 보내지 않고, reset_timeout 뒤 시험 요청이 성공하면 닫힘
+        down_client_url = f"http://localhost:{server.port}"
+        FlakyHandler.reset(failures=0)
+        for _ in range(3):
+            client.post(f"{down_client_url}/down")
+        try:
+            client.post(f"{down_client_url}/ok")
+            blocked = False
+        except CircuitOpenError:
+            blocked = True
+        results.append(check(blocked and len(FlakyHandler.hits) == 3 and client.get_stats()['circuits'][down_client_url] == 'open',
+                             "연속 실패 3번 후 서킷이 열려 요청 차단"))
+        results.append(check(isinstance(CircuitOpenError(), requests.RequestException), "CircuitOpenError는 requests.RequestException"))
+        results.append(check(client.get_stats()['circuits'][server.base_url] == 'closed', "다른 호스트의 서킷은 영향 없음"))
+        time.sleep(0.6)
+        response = client.post(f"{down_client_url}/ok")
+        results.append(check(response.status_code == 200 and client.get_stats()['circuits'][down_client_url] == 'closed',
+                             "reset_timeout 뒤 시험 요청이 성공하면 서킷 닫힘"))
+
+        # 시험 요청이 requests 예외가 아닌 예외로 끝나도 서킷이 반열림 상태에 머물지 않음
+        for _ in range(3):
+            client.post(f"{down_client_url}/down")
+        time.sleep(0.6)
+        try:
+            client.post(f"{down_client_url}/ok", unknown_argument=True)
+        except TypeError:
+            pass
+        state = client.get_stats()['circuits'][down_client_url]
+        time.sleep(0.6)
+        response = client.post(f"{down_client_url}/ok")
+        results.append(check(state == 'open' and response.status_code == 200 and client.get_stats()['circuits'][down_client_url] == 'closed',
+                             f"시험 요청이 TypeError로 끝나면 서킷이 다시 열리고({state}) 다음 시험 요청은 정상 처리"))
+
+        # 3. 연결 오류도 재시도 후 예외
+        start = time.perf_counter()
+        try:
+            client.get("http://127.0.0.1:1/unreachable", timeout=(0.2, 0.2))
+            raised = False
+        except requests.ConnectionError:
+            raised = True
+        results.append(check(raised and time.perf_counter() - start < 2, "연결 오류는 재시도 후 requests.ConnectionError"))
+
+        # 4. 엔드포인트별 메트릭 (숫자 ID와 토큰은 {id}로 치환)
+        endpoints = client.get_stats()['endpoints']
+        telegram = endpoints.get(f"GET 127.0.0.1:{server.port}/{{id}}/getMe", {})
+        cafe = endpoints.get(f"POST 127.0.0.1:{server.port}/v1/cafe/{{id}}/menu/{{id}}/articles", {})
+        results.append(check(telegram.get('count') == 3 and telegram.get('errors') == 2 and cafe.get('count') == 1,
+                             "엔드포인트별 호출 수와 오류 수 기록"))
+        results.append(check(not any('secret' in endpoint for endpoint in endpoints), "경로의 토큰은 메트릭 이름에 남기지 않음"))
+        for endpoint, stats in endpoints.items():
+            print(f"    {endpoint}: {stats['count']}번, 오류율 {stats['error_rate']:.0%}, "
+                  f"p50 {stats['p50_ms']:.1f}ms, p95 {stats['p95_ms']:.1f}ms")
+
+    report(results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import multiprocessing
+import os
+import tempfile
+from checks.common import check, report
+from image_processor import ImageProcessor
+
+ITEMS = [
+    ('매매', '값을 지불하고 재화나 용역을 사고 파는 것', '우리가 사용하는 당근 어플에서 중고 거래를 하는 것도 매매의 일종이에요.'),
+    ('환율', '한 나라 돈과 다른 나라 돈을 바꾸는 비율', '해외여행을 가기 전에 원화를 달러로 바꿀 때 환율에 따라 받는 돈이 달라져요.'),
+    ('저축', '소득 중 쓰지 않고 모아 두는 돈', '용돈을 받으면 일부를 저금통에 넣어 두는 것도 저축이에요.'),
+]
+
+def make_items(output_dir, prefix):
+    return [{'no': no, 'term': term, 'short_description': short_description, 'description': description,
+             'output_path': os.path.join(output_dir, f"{prefix}_{no}.png")}
+            for no, (term, short_description, description) in enumerate(ITEMS, start=1)]
+
+def read(path):
+    with open(path, 'rb') as file:
+        return file.read()
+
+def main():
+    results = []
+    spawn = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory(prefix='image_processor_') as temp_dir:
+        output_dir = os.path.join(temp_dir, 'output')
+        os.makedirs(output_dir)
+
+        # 1. 한 프로세스에서 생성한 결과를 기준으로 사용
+        serial = ImageProcessor(cache_dir=os.path.join(temp_dir, 'serial_cache'))
+        expected = serial.create_cards(make_items(output_dir, 'serial'), workers=1, sizes=['upload'])
+
+        # 2. spawn 방식 작업 프로세스 2개 (Windows, macOS 기본값과 같은 시작 방식)
+        processor = ImageProcessor(cache_dir=os.path.join(temp_dir, 'cache'))
+        try:
+            spawned = processor.create_cards(make_items(output_dir, 'spawn'), workers=2, sizes=['upload'], mp_context=spawn)
+            error = None
+        except Exception as e:
+            spawned, error = [], e
+        results.append(check(error is None and len(spawned) == len(ITEMS), f"spawn 방식 작업 프로세스 2개로 생성 ({error or '오류 없음'})"))
+        results.append(check(spawned and all(read(actual.output_path) == read(base.output_path)
+                                             and actual.variants['upload'].data == base.variants['upload'].data
+                                             for actual, base in zip(spawned, expected)),
+                             "한 프로세스에서 만든 카드, 업로드용 변형과 같은 바이트"))
+
+        # 3. 작업 프로세스가 부모와 같은 카드 저장소 경로를 사용 (두 번째 실행은 저장소에서 재사용)
+        again = processor.create_cards(make_items(output_dir, 'again'), workers=2, sizes=['upload'], mp_context=spawn)
+        results.append(check(all('font_fitting' not in result.timings for result in again),
+                             "두 번째 실행은 작업 프로세스에서도 저장된 카드 재사용"))
+
+        # 4. 카드 저장소를 끈 설정도 작업 프로세스에 전달
+        processor.card_store = None
+        uncached = processor.create_cards(make_items(output_dir, 'uncached'), workers=2, mp_context=spawn)
+        results.append(check(all('card_store' not in result.timings and os.path.exists(result.output_path) for result in uncached),
+                             "카드 저장소를 끄면 작업 프로세스도 저장소 없이 렌더링"))
+
+        # 5. 레이아웃 계획 캐시는 크기 상한을 넘으면 오래 쓰지 않은 계획부터 삭제
+        planner = ImageProcessor(cache_dir=os.path.join(temp_dir, 'plan_cache'))
+        planner.plan_store.max_bytes = 20 * 1024
+        for index in range(40):
+            planner.plan_card(1, f"용어 {index}", '짧은 설명', '긴 설명')
+        plan_dir = planner.plan_store.store_dir
+        stored = sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(plan_dir) for name in files)
+        hits = planner.plan_store.hits
+        planner.plan_card(1, '용어 39', '짧은 설명', '긴 설명')
+        results.append(check(stored <= planner.plan_store.max_bytes and planner.plan_store.evictions > 0,
+                             f"계획 40개 저장 후 캐시 {stored / 1024:.1f}KB (상한 20KB, 삭제 {planner.plan_store.evictions}개)"))
+        results.append(check(planner.plan_store.hits == hits + 1, "최근 계획은 캐시에서 재사용"))
+
+    report(results)
+
+if __name__ == "__main__":
+    main()
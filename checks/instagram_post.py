@@ -0,0 +1,100 @@
+import contextlib
+import io
+import time
+from urllib.parse import urlparse, parse_qs
+from checks.common import check, report, StandInHandler, StandInServer
+from utils.instagram_post import InstagramAPI
+
+# 대역 서버의 Graph API 컨테이너 생성 지연(초)
+MEDIA_DELAY = 0.5
+
+class GraphStandInHandler(StandInHandler):
+    """Graph API(/v18.0/<계정>/media, media_publish)와 이미지 호스트 대역"""
+    # 이미지가 준비되기까지 404를 돌려줄 HEAD 횟수
+    not_ready_heads = 0
+    heads = {}
+    in_flight = 0
+    peak_in_flight = 0
+    carousel_children = []
+
+    @classmethod
+    def reset(cls, not_ready_heads):
+        cls.not_ready_heads = not_ready_heads
+        cls.heads = {}
+        cls.in_flight = cls.peak_in_flight = 0
+        cls.carousel_children = []
+
+    def do_HEAD(self):
+        # 이미지는 처음 not_ready_heads번은 404 (업로드 직후 아직 제공되지 않는 상황)
+        with self.lock:
+            count = self.heads[self.path] = self.heads.get(self.path, 0) + 1
+        self.respond(200 if count > self.not_ready_heads else 404)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        self.read_body()
+        if url.path.endswith('/media_publish'):
+            self.respond(200, f'{{"id": "post_{params["creation_id"]}"}}'.encode('utf-8'))
+            return
+
+        with self.lock:
+            GraphStandInHandler.in_flight += 1
+            GraphStandInHandler.peak_in_flight = max(GraphStandInHandler.peak_in_flight, GraphStandInHandler.in_flight)
+        time.sleep(MEDIA_DELAY)
+        with self.lock:
+            GraphStandInHandler.in_flight -= 1
+        if params.get('media_type') == 'CAROUSEL':
+            self.carousel_children.append(params['children'].split(','))
+            self.respond(200, b'{"id": "carousel"}')
+        else:
+            # 아이템 ID는 이미지 파일명에서 만든다 (순서 확인용)
+            name = params['image_url'].rsplit('/', 1)[-1].split('.')[0]
+            self.respond(200, f'{{"id": "item_{name}"}}'.encode('utf-8'))
+
+def main():
+    results = []
+    with StandInServer(GraphStandInHandler) as server:
+        base_url = server.base_url
+
+        api = InstagramAPI(access_token='token', account_id='account', graph_url=base_url)
+        image_urls = [f"{base_url}/output/card_{index}.png" for index in range(1, 4)]
+
+        # 1. 이미지가 바로 준비된 경우: 캐러셀 아이템 3개를 동시에 생성
+        GraphStandInHandler.reset(not_ready_heads=0)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = api.post_image(image_urls, caption='테스트')
+        elapsed = time.perf_counter() - start
+
+        results.append(check(result.get('success') and result.get('post_id') == 'post_carousel', "캐러셀 게시 성공"))
+        results.append(check(GraphStandInHandler.carousel_children == [['item_card_1', 'item_card_2', 'item_card_3']],
+                             "캐러셀 아이템이 이미지 순서대로 연결됨"))
+        results.append(check(GraphStandInHandler.peak_in_flight == len(image_urls),
+                             f"캐러셀 아이템 생성 요청이 동시에 진행됨 (최대 {GraphStandInHandler.peak_in_flight}개)"))
+        # 순차 실행이면 아이템 3개 + 캐러셀 컨테이너 생성 지연이 모두 더해진다
+        sequential = (len(image_urls) + 1) * MEDIA_DELAY
+        results.append(check(elapsed < sequential - MEDIA_DELAY, f"전체 {elapsed:.2f}초 (순차 실행 {sequential:.2f}초 이상)"))
+
+        # 2. 업로드 직후라 이미지가 늦게 준비되는 경우: 백오프하며 재시도
+        GraphStandInHandler.reset(not_ready_heads=2)
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = api.post_image(image_urls, caption='테스트')
+        results.append(check(result.get('success') and all(count == 3 for count in GraphStandInHandler.heads.values()),
+                             f"이미지가 준비될 때까지 재시도 후 게시 (HEAD 횟수 {sorted(GraphStandInHandler.heads.values())})"))
+        results.append(check(GraphStandInHandler.carousel_children == [['item_card_1', 'item_card_2', 'item_card_3']],
+                             "재시도 후에도 이미지 순서 유지"))
+
+        # 끝까지 준비되지 않는 이미지는 지수 백오프 후 실패
+        GraphStandInHandler.reset(not_ready_heads=100)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            ready = api._test_image_url(f"{base_url}/output/missing.png", max_retries=4, base_delay=0.2, max_delay=1)
+        elapsed = time.perf_counter() - start
+        results.append(check(not ready and elapsed <= 0.2 + 0.4 + 0.8 + 0.5,
+                             f"준비되지 않은 이미지는 백오프 상한 안에서 실패 ({elapsed:.2f}초)"))
+
+    report(results)
+
+if __name__ == "__main__":
+    main()
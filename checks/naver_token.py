@@ -0,0 +1,124 @@
+import contextlib
+import io
+import json
+import os
+import stat
+import tempfile
+import time
+from urllib.parse import parse_qs
+from checks.common import check, report, StandInHandler, StandInServer
+from utils.naver_token_manager import NaverTokenManager
+from utils.ncafe_post import NaverCafeAPI
+
+class NaverStandInHandler(StandInHandler):
+    """네이버 토큰 갱신(/oauth2.0/token)과 카페 글쓰기(/v1/cafe/...) 대역"""
+    valid_token = None
+    valid_refresh_tokens = {'refresh'}
+    token_calls = 0
+    article_calls = 0
+    other_calls = []
+
+    def do_GET(self):
+        NaverStandInHandler.other_calls.append(self.path)
+        self.respond(404, {})
+
+    def do_POST(self):
+        body = self.read_body()
+        if self.path == '/oauth2.0/token':
+            NaverStandInHandler.token_calls += 1
+            form = {key: values[0] for key, values in parse_qs(body.decode('utf-8')).items()}
+            if form.get('refresh_token') not in NaverStandInHandler.valid_refresh_tokens:
+                self.respond(400, {'error': 'invalid_request'})
+                return
+            NaverStandInHandler.valid_token = f"access_{NaverStandInHandler.token_calls}"
+            self.respond(200, {'access_token': NaverStandInHandler.valid_token, 'token_type': 'bearer', 'expires_in': '3600'})
+        elif self.path.startswith('/v1/cafe/'):
+            NaverStandInHandler.article_calls += 1
+            if self.headers.get('Authorization') != f"Bearer {NaverStandInHandler.valid_token}":
+                self.respond(401, {'message': 'Authentication failed'})
+                return
+            self.respond(200, {'message': {'status': '200'}})
+        else:
+            NaverStandInHandler.other_calls.append(self.path)
+            self.respond(404, {})
+
+def main():
+    handler = NaverStandInHandler
+    results = []
+    with StandInServer(NaverStandInHandler) as server:
+        base_url = server.base_url
+
+        with tempfile.TemporaryDirectory(prefix='naver_token_') as temp_dir:
+            state_path = os.path.join(temp_dir, 'naver_token.json')
+            image_path = os.path.join(temp_dir, 'card.png')
+            with open(image_path, 'wb') as file:
+                file.write(b'\x89PNG\r\n\x1a\n')
+            os.environ.update(NAVER_ACCESS_TOKEN='stale', NAVER_REFRESH_TOKEN='refresh', NAVER_CAFE_ID='cafe')
+
+            def make_api():
+                manager = NaverTokenManager(client_id='id', client_secret='secret', state_path=state_path,
+                                            token_url=f"{base_url}/oauth2.0/token")
+                return NaverCafeAPI(token_manager=manager, api_url=base_url)
+
+            def post(api, output=None):
+                with contextlib.redirect_stdout(output or io.StringIO()):
+                    return api.write_cafe_post(1, '제목', '내용', [image_path])
+
+            def load_state():
+                with open(state_path, 'r', encoding='utf-8') as file:
+                    return json.load(file)
+
+            # 1. 상태 파일이 없으면 환경 변수의 토큰으로 시작해 한 번 갱신
+            api = make_api()
+            ok = post(api)
+            results.append(check(ok and handler.token_calls == 1, "처음 실행: 만료 시각을 모르는 토큰을 한 번 갱신 후 글 작성"))
+            mode = stat.S_IMODE(os.stat(state_path).st_mode)
+            state = load_state()
+            results.append(check(state['access_token'] == 'access_1' and state['expires_at'] > time.time() + 3000 and mode == 0o600,
+                                 f"토큰과 만료 시각을 상태 파일에 저장 (권한 {oct(mode)})"))
+
+            # 2. 다음 실행(새 인스턴스)은 저장된 토큰을 그대로 사용
+            api = make_api()
+            ok = post(api) and post(api)
+            results.append(check(ok and handler.token_calls == 1 and handler.article_calls == 3,
+                                 "다음 실행: 갱신이나 유효성 확인 없이 글 작성 2번"))
+
+            # 3. 만료가 가까우면 글 작성 전에 미리 갱신
+            api.token_manager._state['expires_at'] = time.time() + 60
+            ok = post(api)
+            results.append(check(ok and handler.token_calls == 2 and handler.article_calls == 4, "만료 5분 전 이내면 미리 갱신"))
+
+            # 4. 서버가 토큰을 거부하면 한 번 갱신 후 재시도
+            handler.valid_token = 'revoked'
+            ok = post(api)
+            results.append(check(ok and handler.token_calls == 3 and handler.article_calls == 6, "401 응답이면 갱신 후 한 번 재시도"))
+
+            # 5. 저장된 리프레시 토큰이 만료되면 환경 변수의 토큰으로 다시 시도
+            api.token_manager._state.update(expires_at=0, refresh_token='expired')
+            ok = post(api)
+            results.append(check(ok and handler.token_calls == 5 and load_state()['refresh_token'] == 'refresh',
+                                 "저장된 리프레시 토큰으로 갱신에 실패하면 NAVER_REFRESH_TOKEN으로 갱신"))
+
+            # 6. 환경 변수의 리프레시 토큰이 바뀌면 다음 실행은 상태 파일 대신 새 토큰으로 시작
+            handler.valid_refresh_tokens = {'rotated'}
+            os.environ['NAVER_REFRESH_TOKEN'] = 'rotated'
+            api = make_api()
+            ok = post(api)
+            state = load_state()
+            results.append(check(ok and handler.token_calls == 6 and state['refresh_token'] == 'rotated'
+                                 and state['env_refresh_token'] == 'rotated', "NAVER_REFRESH_TOKEN이 바뀌면 새 토큰으로 갱신"))
+
+            # 7. 두 토큰 모두 갱신이 실패하면 프로세스를 끝내지 않고 상태 파일 경로와 함께 실패 반환
+            handler.valid_refresh_tokens = set()
+            api.token_manager._state.update(expires_at=0, refresh_token='expired')
+            output = io.StringIO()
+            ok = post(api, output)
+            results.append(check(ok is False and state_path in output.getvalue(),
+                                 "리프레시 토큰이 모두 만료되면 예외 없이 False 반환 (오류 메시지에 상태 파일 경로)"))
+
+            results.append(check(not handler.other_calls, f"토큰 유효성 확인 요청 없음 ({handler.other_calls})"))
+
+    report(results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from PIL import Image
+from checks.common import check, report
+from database_manager import DatabaseManager
+from publish_outbox import PublishOutbox
+
+def get_row(db_path, key):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute('SELECT state, attempts, next_attempt_at, last_error FROM publish_outbox WHERE idempotency_key = ?',
+                            (key,)).fetchone()
+
+def main():
+    results = []
+    with tempfile.TemporaryDirectory(prefix='outbox_') as temp_dir:
+        db_path = os.path.join(temp_dir, 'term.db')
+        output_dir = os.path.join(temp_dir, 'output')
+        os.makedirs(output_dir)
+        image_paths = []
+        for index, color in enumerate([(174, 151, 116), (255, 255, 255)]):
+            path = os.path.join(output_dir, f"20250101_0{index + 1}.png")
+            Image.new('RGB', (90, 90), color).save(path)
+            image_paths.append(path)
+
+        outbox = PublishOutbox(DatabaseManager(db_path), store_dir=os.path.join(temp_dir, 'store'), max_attempts=3, base_delay=60)
+        payload = {'title': '제목', 'content': '내용', 'caption': '캡션'}
+
+        # 1. 같은 작업은 한 번만 등록
+        key = outbox.enqueue('board', payload, image_paths)
+        again = outbox.enqueue('board', payload, image_paths)
+        other = outbox.enqueue('telegram', payload, image_paths)
+        results.append(check(key == again and key != other and outbox.get_counts() == {'pending': 2},
+                             "같은 채널과 내용의 작업은 멱등성 키가 같아 한 번만 등록"))
+
+        # 2. 실패하면 대기 상태로 남고 다음 시도 시각 전에는 다시 실행하지 않음
+        calls = []
+
+        def failing_board(job, paths):
+            calls.append((job.idempotency_key, paths))
+            raise RuntimeError("게시판 API 응답 없음")
+
+        start = time.time()
+        drained = outbox.drain({'board': failing_board})
+        state, attempts, next_attempt_at, last_error = get_row(db_path, key)
+        results.append(check(len(drained) == 1 and not drained[0][1].success and state == 'pending' and attempts == 1
+                             and start + 30 <= next_attempt_at <= start + 61 and '응답 없음' in last_error,
+                             f"실패한 작업은 {next_attempt_at - start:.0f}초 뒤 재시도하도록 대기"))
+        results.append(check(calls[0][0] == key and calls[0][1] == image_paths, "채널 함수에 멱등성 키와 이미지 경로 전달"))
+        results.append(check(outbox.drain({'board': failing_board}) == [] and len(calls) == 1,
+                             "다음 시도 시각 전에는 실행하지 않음"))
+        results.append(check(get_row(db_path, other)[0] == 'pending', "처리하지 않은 채널의 작업은 그대로"))
+
+        # 3. output/ 폴더가 비워진 뒤(다음 실행) 재시도: 렌더링 없이 보관된 이미지로 게시
+        for path in image_paths:
+            os.remove(path)
+        with sqlite3.connect(db_path) as conn:
+            conn.execute('UPDATE publish_outbox SET next_attempt_at = 0')
+        received = []
+        drained = outbox.drain({'board': lambda job, paths: received.extend(paths) or {'success': True}})
+        restored_ok = len(received) == 2 and all(os.path.exists(path) for path in received)
+        if restored_ok:
+            original = Image.new('RGB', (90, 90), (174, 151, 116))
+            restored_ok = list(Image.open(received[0]).getdata()) == list(original.getdata())
+        results.append(check(drained and drained[0][1].success and get_row(db_path, key)[:2] == ('done', 2),
+                             "두 번째 시도에서 게시 완료"))
+        results.append(check(restored_ok, f"지워진 이미지를 보관된 바이트로 복구 ({os.path.basename(received[0]) if received else '-'})"))
+
+        # 4. 여러 작업자가 동시에 가져가도 작업은 한 번만 실행
+        claimed = []
+        barrier = threading.Barrier(4)
+
+        def claim():
+            worker = PublishOutbox(DatabaseManager(db_path), store_dir=os.path.join(temp_dir, 'store'))
+            barrier.wait()
+            claimed.extend(worker.claim_due(channels={'telegram'}))
+
+        threads = [threading.Thread(target=claim) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        results.append(check(len(claimed) == 1 and claimed[0].idempotency_key == other, f"동시 작업자 4개 중 하나만 작업을 가져감"))
+
+        # 5. 작업자가 중단되어 임대 시간이 지나면 다른 작업자가 다시 가져감
+        results.append(check(outbox.claim_due(channels={'telegram'}) == [], "임대 중인 작업은 가져가지 않음"))
+        reclaimed = outbox.claim_due(channels={'telegram'}, now=time.time() + outbox.lease_seconds + 1)
+        results.append(check(len(reclaimed) == 1 and reclaimed[0].attempts == 2, "임대 시간이 지난 작업은 다시 가져감"))
+
+        # 6. 최대 시도 횟수를 넘으면 failed
+        outbox.fail(reclaimed[0], "오류")
+        with sqlite3.connect(db_path) as conn:
+            conn.execute('UPDATE publish_outbox SET next_attempt_at = 0')
+        drained = outbox.drain({'telegram': lambda job, paths: False})
+        results.append(check(drained and get_row(db_path, other)[:2] == ('failed', 3), "최대 시도 횟수(3번) 뒤 재시도 중단"))
+        results.append(check(outbox.get_counts() == {'done': 1, 'failed': 1}, f"상태별 작업 수 {outbox.get_counts()}"))
+
+        # 7. 마지막 시도 중 작업자가 중단되면 임대 시간이 지나도 다시 실행하지 않음 (최대 시도 횟수 초과 방지)
+        last = outbox.enqueue('naver_cafe', payload)
+        now = time.time()
+        for _ in range(outbox.max_attempts):
+            now += outbox.lease_seconds + 1
+            claimed = outbox.claim_due(channels={'naver_cafe'}, now=now)
+        reclaimed = outbox.claim_due(channels={'naver_cafe'}, now=now + outbox.lease_seconds + 1)
+        results.append(check(claimed and claimed[0].attempts == 3 and reclaimed == [] and get_row(db_path, last)[:2] == ('failed', 3),
+                             "최대 시도 횟수를 채운 작업은 임대 시간이 지나도 다시 가져가지 않고 failed"))
+
+        # 8. 시간 초과된 작업은 게시되었을 수 있으므로 재시도하지 않고 unknown
+        slow = outbox.enqueue('instagram', payload)
+        finished = threading.Event()
+
+        def slow_instagram(job, paths):
+            time.sleep(0.5)
+            finished.set()
+            return {'success': True}
+
+        drained = outbox.drain({'instagram': slow_instagram}, timeouts={'instagram': 0.1})
+        state, attempts, next_attempt_at, last_error = get_row(db_path, slow)
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE publish_outbox SET next_attempt_at = 0 WHERE idempotency_key = ?", (slow,))
+        results.append(check(drained and drained[0][1].timed_out and state == 'unknown' and '0.1초' in last_error,
+                             "시간 초과된 작업은 unknown으로 기록"))
+        results.append(check(outbox.claim_due(channels={'instagram'}, now=time.time() + outbox.lease_seconds * 10) == [],
+                             "unknown 작업은 다시 가져가지 않음 (중복 게시 방지)"))
+        finished.wait(2)
+
+    report(results)
+
+if __name__ == "__main__":
+    main()
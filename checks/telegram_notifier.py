@@ -0,0 +1,99 @@
+import os
+import time
+from urllib.parse import parse_qs
+from checks.common import check, report, StandInHandler, StandInServer
+from utils.telegram_util import TelegramUtil
+from utils.telegram_notifier import TelegramNotifier
+
+# 대역 서버의 sendMessage 응답 지연(초)
+SEND_DELAY = 0.3
+
+class BotStandInHandler(StandInHandler):
+    """Bot API(/bot<토큰>/sendMessage) 대역: 받은 메시지를 기록하고 지정한 횟수만큼 429 응답"""
+    messages = []
+    rate_limited = 0
+
+    @classmethod
+    def reset(cls, rate_limited=0):
+        cls.messages = []
+        cls.rate_limited = rate_limited
+
+    def _respond(self, payload):
+        self.respond(200 if payload['ok'] else payload['error_code'], payload)
+
+    def do_POST(self):
+        body = self.read_body()
+        form = {key: values[0] for key, values in parse_qs(body.decode('utf-8')).items()}
+        time.sleep(SEND_DELAY)
+        with self.lock:
+            if BotStandInHandler.rate_limited:
+                BotStandInHandler.rate_limited -= 1
+                self._respond({'ok': False, 'error_code': 429, 'description': 'Too Many Requests',
+                               'parameters': {'retry_after': 1}})
+                return
+            BotStandInHandler.messages.append({
+                'method': self.command, 'query': '?' in self.path, 'time': time.monotonic(),
+                'client_port': self.client_address[1], **form
+            })
+        self._respond({'ok': True, 'result': {'message_id': len(BotStandInHandler.messages)}})
+
+def main():
+    os.environ.update(TELEGRAM_BOT_TOKEN='token', TELEGRAM_CHAT_ID='main', TELEGRAM_CHAT_TEST_ID='test')
+    results = []
+    with StandInServer(BotStandInHandler) as server:
+        api_url = server.base_url
+
+        # 1. notify는 전송을 기다리지 않고, 몰린 메시지는 채팅방별로 합쳐서 전송
+        BotStandInHandler.reset()
+        notifier = TelegramNotifier(TelegramUtil(api_url=api_url), coalesce_window=0.2, chat_interval=0.5)
+        start = time.perf_counter()
+        for index in range(5):
+            notifier.notify_test(f"오류 {index}")
+        notifier.notify("완료")
+        enqueue_elapsed = time.perf_counter() - start
+        flushed = notifier.flush()
+        messages = BotStandInHandler.messages
+
+        results.append(check(enqueue_elapsed < 0.05, f"알림 6개를 큐에 넣는 데 {enqueue_elapsed * 1000:.1f}ms (전송을 기다리지 않음)"))
+        results.append(check(flushed and len(messages) == 2 and notifier.sent_count == 2,
+                             f"메시지 6개를 채팅방별로 합쳐 요청 {len(messages)}번"))
+        test_message = next((message for message in messages if message['chat_id'] == 'test'), {})
+        results.append(check(test_message.get('text') == "\n\n".join(f"오류 {index}" for index in range(5)),
+                             "합친 메시지가 들어온 순서를 유지"))
+        results.append(check(all(message['method'] == 'POST' and not message['query'] and message['parse_mode'] == 'html'
+                                 for message in messages), "URL 쿼리가 아닌 POST 본문으로 전송"))
+        results.append(check(len({message['client_port'] for message in messages}) == 1, "연결 재사용"))
+
+        # 2. 같은 채팅방에 연속으로 보낼 때 간격을 두고, 429면 retry_after만큼 기다렸다가 재시도
+        BotStandInHandler.reset(rate_limited=1)
+        notifier = TelegramNotifier(TelegramUtil(api_url=api_url), coalesce_window=0, chat_interval=0.5)
+        notifier.notify_test("A" * 3000)
+        notifier.notify_test("B" * 3000)
+        start = time.monotonic()
+        notifier.flush()
+        messages = BotStandInHandler.messages
+        gap = messages[1]['time'] - messages[0]['time'] if len(messages) == 2 else 0
+        results.append(check(len(messages) == 2 and notifier.sent_count == 3 and messages[0]['time'] - start >= 1,
+                             f"429 응답 후 retry_after(1초) 대기 후 재전송 (요청 {notifier.sent_count}번)"))
+        results.append(check(gap >= 0.5 + SEND_DELAY, f"같은 채팅방 전송 간격 {gap:.2f}초 (최소 0.5초 + 응답 시간)"))
+        results.append(check([len(message['text']) for message in messages] == [3000, 3000],
+                             "합치면 4096자를 넘는 메시지는 나눠서 전송"))
+
+        # 3. 종료 시 flush는 지정한 시간까지만 기다림
+        BotStandInHandler.reset()
+        notifier = TelegramNotifier(TelegramUtil(api_url=api_url), coalesce_window=0, chat_interval=1)
+        for index in range(5):
+            notifier.notify(f"느린 알림 {index}", chat_id=f"chat_{index % 2}")
+            time.sleep(0.05)
+        start = time.perf_counter()
+        flushed = notifier.flush(timeout=0.5)
+        elapsed = time.perf_counter() - start
+        results.append(check(not flushed and elapsed < 0.7, f"flush 대기 시간 제한 ({elapsed:.2f}초)"))
+        queued = notifier._queue.qsize()
+        notifier.notify("종료 후 알림")
+        results.append(check(notifier._queue.qsize() == queued, "종료 후 들어온 알림은 큐에 넣지 않음"))
+
+    report(results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import os
+import time
+from database_manager import DatabaseManager
+from image_processor import ImageProcessor
+from utils.text_measurer import TextMeasurer
+
+# 스크립트가 있는 폴더의 상위(루트 경로)를 기본 디렉토리로 설정
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_terms(db_path):
+    """term.db의 모든 용어 조회"""
+    with DatabaseManager(db_path=db_path, read_only=True) as db:
+        cursor = db.conn.cursor()
+        cursor.execute("SELECT term, short_description, description FROM term_list ORDER BY idx")
+        return cursor.fetchall()
+
+def main():
+    """term.db의 모든 문자열을 각 영역의 모든 후보 크기에서 Pillow 측정값과 비교"""
+    rows = load_terms(os.path.join(BASE_DIR, 'term.db'))
+    processor = ImageProcessor()
+    measurer = TextMeasurer()
+
+    checked = 0
+    mismatches = []
+    table_elapsed = 0.0
+    pillow_elapsed = 0.0
+    for row in rows:
+        for name, text in zip(('term', 'short_description', 'description'), row):
+            field = processor.text_fields[name]
+            for font_size in range(field['initial_size'], 10, -2):
+                font = processor.font_cache.get_font(field['font_path'], font_size)
+                wrapped_text = processor._wrap_text(text, field['max_width'], font)
+                for line in [text] + text.split(' ') + wrapped_text.split('\n'):
+                    start = time.perf_counter()
+                    expected = font.getbbox(line)
+                    pillow_elapsed += time.perf_counter() - start
+
+                    start = time.perf_counter()
+                    actual = measurer.getbbox(font, line)
+                    table_elapsed += time.perf_counter() - start
+
+                    checked += 1
+                    if tuple(actual) != tuple(expected):
+                        mismatches.append((name, font_size, line, expected, actual))
+
+    print(f"비교한 문자열: {checked}개")
+    print(f"불일치: {len(mismatches)}개")
+    for name, font_size, line, expected, actual in mismatches[:20]:
+        print(f"  [{name} {font_size}px] {line!r} Pillow={expected} 테이블={actual}")
+    print(f"측정 시간: Pillow {pillow_elapsed:.2f}초 / 테이블 {table_elapsed:.2f}초 (테이블 생성 포함)")
+    print(f"테이블 통계: {measurer.get_stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,134 @@
 import sqlite3
 import csv
 import os
+import random
+import time
+from itertools import islice
+from pathlib import Path
+from contextlib import contextmanager
 from datetime import datetime
 from utils.logger_util import LoggerUtil
 
 class DatabaseManager:
-    def __init__(self, db_path='sqlite.db'):
+    """term.db 접근을 한 곳에서 관리하는 클래스
+
+    연결은 인스턴스가 살아 있는 동안 하나를 계속 사용한다. (WAL 저널, PRAGMAS 설정, 준비된 문장 캐시)
+    연결은 자동 커밋 모드이며, 여러 문장을 한 번에 커밋하려면 transaction()으로 감싼다.
+    read_only로 열면 파일을 바꾸지 않는다. (스키마 생성, 마이그레이션, WAL 전환 없음)
+    """
+    # 연결할 때 적용하는 설정
+    # WAL: 읽기와 쓰기가 서로 막지 않음, synchronous=NORMAL: WAL에서는 커밋마다 fsync하지 않아도 손상되지 않음
+    PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -16000,  # 페이지 캐시 약 16MB (음수는 KB 단위)
+        'mmap_size': 256 * 1024 * 1024,
+        'temp_store': 'MEMORY'
+    }
+    # 연결별로 컴파일해 두는 SQL 문장 수
+    CACHED_STATEMENTS = 256
+    # 아직 게시하지 않은 공개 용어 조건 (idx_term_list_unpublished 부분 인덱스와 같은 조건이어야 함)
+    UNPUBLISHED = "open_yn = 1 AND file_name IS NULL"
+    # 무작위 idx 후보를 한 번에 조회하는 개수와 최대 조회 횟수 (넘으면 부분 인덱스 위치로 뽑기)
+    SAMPLE_BATCH_SIZE = 32
+    SAMPLE_MAX_BATCHES = 4
+    # 중복 판단에 쓰는 용어 정규화 식 (idx_term_list_term 인덱스와 조회가 같은 식을 쓰도록 term_key()로 만듦)
+    TERM_KEY_FORMAT = "lower(trim({}))"
+    TERM_KEY = TERM_KEY_FORMAT.format('term')
+    # PRAGMA user_version에 기록하는 스키마 버전 (1: 용어 인덱스 생성 완료)
+    SCHEMA_VERSION = 1
+    # CSV 임포트에서 executemany 한 번에 넣는 행 수
+    IMPORT_CHUNK_SIZE = 5000
+
+    def __init__(self, db_path='sqlite.db', csv_path='term.csv', read_only=False):
+        """
+        Args:
+            db_path (str): DB 파일 경로 (없으면 만들고 csv_path의 용어를 임포트)
+            csv_path (str): 새 DB에 임포트할 CSV 파일 경로
+            read_only (bool): 읽기 전용으로 열기 (벤치마크, 검사 스크립트처럼 조회만 하는 경우, 파일이 없으면 오류)
+        """
         self.db_path = db_path
+        self.csv_path = csv_path
+        self.read_only = read_only
         self.logger = LoggerUtil().get_logger()
-        self._initialize_database()
+        self._transaction_depth = 0
+        # 연결하면 파일이 생기므로 연결 전에 확인
+        db_exists = os.path.exists(self.db_path)
+        self.conn = self._connect()
+        if not read_only:
+            self._initialize_database(db_exists)
+
+    def _connect(self):
+        """설정을 적용한 연결 생성 (isolation_level=None: 자동 커밋, 트랜잭션은 transaction()에서 직접 시작)"""
+        if self.read_only:
+            database, uri = Path(self.db_path).absolute().as_uri() + '?mode=ro', True
+        else:
+            database, uri = self.db_path, False
+        # 다른 프로세스가 쓰기 중이면 잠금이 풀릴 때까지 최대 30초 대기
+        conn = sqlite3.connect(database, timeout=30, isolation_level=None, cached_statements=self.CACHED_STATEMENTS, uri=uri)
+        for name, value in self.PRAGMAS.items():
+            # journal_mode는 파일에 기록되는 설정이므로 읽기 전용 연결에서는 바꾸지 않음
+            if self.read_only and name == 'journal_mode':
+                continue
+            conn.execute(f"PRAGMA {name} = {value!r}" if isinstance(value, str) else f"PRAGMA {name} = {value}")
+        return conn
+
+    def close(self):
+        """연결 종료 (마지막 연결이면 WAL 내용이 DB 파일에 반영됨)"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @contextmanager
+    def transaction(self, immediate=False):
+        """트랜잭션 범위: 정상 종료하면 커밋, 예외가 나면 롤백
+
+        안쪽에서 다시 transaction()을 열면 SAVEPOINT로 바깥 트랜잭션에 합류하므로,
+        바깥 범위가 커밋될 때 함께 커밋된다.
+
+        Args:
+            immediate (bool): 시작할 때 바로 쓰기 잠금을 잡음 (조회 후 갱신을 다른 프로세스와 겹치지 않게 할 때)
+        """
+        depth = self._transaction_depth
+        if depth == 0:
+            self.conn.execute('BEGIN IMMEDIATE' if immediate else 'BEGIN')
+        else:
+            self.conn.execute(f"SAVEPOINT sp_{depth}")
+        self._transaction_depth += 1
+        try:
+            yield self.conn
+        except BaseException:
+            self._transaction_depth -= 1
+            if depth == 0:
+                self.conn.execute('ROLLBACK')
+            else:
+                self.conn.execute(f"ROLLBACK TO sp_{depth}")
+                self.conn.execute(f"RELEASE sp_{depth}")
+            raise
+        self._transaction_depth -= 1
+        if depth == 0:
+            self.conn.execute('COMMIT')
+        else:
+            self.conn.execute(f"RELEASE sp_{depth}")
 
-    def _initialize_database(self):
+    def execute(self, sql, parameters=()):
+        """SQL 한 문장 실행 후 커서 반환 (transaction() 밖이면 바로 커밋)"""
+        return self.conn.execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.conn.executemany(sql, seq_of_parameters)
+
+    def _initialize_database(self, db_exists):
         """데이터베이스와 테이블 초기화"""
-        db_exists = os.path.exists(self.db_path)
-        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self.transaction():
+                cursor = self.conn.cursor()
                 
                 if not db_exists:
                     self.logger.info(f"새로운 데이터베이스 파일 생성: {self.db_path}")
@@ -27,11 +139,17 @@ class DatabaseManager:
                     WHERE type='table' AND name='term_list'
                 """)
                 
-                if cursor.fetchone()[0] == 0:
+                table_created = cursor.fetchone()[0] == 0
+                if table_created:
                     self.logger.info("term_list 테이블 생성 중...")
                     self._create_term_table(cursor)
+
+                # 임포트의 중복 제외가 고유 인덱스를 쓰므로 임포트보다 먼저 생성
+                self._create_indexes(cursor)
+                self._migrate(cursor)
+
+                if table_created:
                     self._import_csv_data(cursor)
-                    conn.commit()
                     self.logger.info("테이블 생성 및 데이터 임포트 완료")
         
         except sqlite3.Error as e:
@@ -52,48 +170,159 @@ class DatabaseManager:
         )
         ''')
 
+    @classmethod
+    def term_key(cls, expression='?'):
+        """용어 정규화 식 (기본값: 조회 매개변수용 'lower(trim(?))')"""
+        return cls.TERM_KEY_FORMAT.format(expression)
+
+    def _create_indexes(self, cursor):
+        """게시하지 않은 공개 용어만 담는 부분 인덱스 생성 (무작위 선택용)"""
+        cursor.execute(f'''
+        CREATE INDEX IF NOT EXISTS idx_term_list_unpublished
+        ON term_list (idx) WHERE {self.UNPUBLISHED}
+        ''')
+
+    def _migrate(self, cursor):
+        """PRAGMA user_version이 SCHEMA_VERSION보다 낮으면 한 번만 실행하는 마이그레이션"""
+        cursor.execute("PRAGMA user_version")
+        version = cursor.fetchone()[0]
+        if version >= self.SCHEMA_VERSION:
+            return
+        if version < 1:
+            self._create_term_index(cursor)
+        cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def _create_term_index(self, cursor):
+        """정규화된 용어의 고유 인덱스 생성
+
+        이미 중복된 용어가 있으면 데이터는 건드리지 않고 중복 목록을 한 번 알린 뒤,
+        같은 식의 일반 인덱스를 만들어 용어 조회는 인덱스를 쓰게 한다.
+        중복을 정리한 뒤 PRAGMA user_version = 0으로 되돌리면 다음 연결에서 고유 인덱스를 다시 시도한다.
+        """
+        cursor.execute("DROP INDEX IF EXISTS idx_term_list_term")
+        try:
+            cursor.execute(f"CREATE UNIQUE INDEX idx_term_list_term ON term_list ({self.TERM_KEY})")
+            return
+        except sqlite3.IntegrityError:
+            pass
+
+        cursor.execute(f"""
+            SELECT min(term), group_concat(idx, ', ') FROM term_list
+            GROUP BY {self.TERM_KEY} HAVING COUNT(*) > 1
+        """)
+        duplicates = [f"{term} (idx {indexes})" for term, indexes in cursor.fetchall()]
+        cursor.execute(f"CREATE INDEX idx_term_list_term ON term_list ({self.TERM_KEY})")
+        self.logger.warning(f"중복된 용어 {len(duplicates)}개가 있어 용어 인덱스(idx_term_list_term)를 고유 인덱스가 아닌 "
+                            f"일반 인덱스로 만들었습니다: {'; '.join(duplicates)}")
+
     def _import_csv_data(self, cursor):
-        """CSV 파일에서 데이터 임포트 (term 기준 중복 제외)"""
-        csv_path = 'term.csv'
-        if not os.path.exists(csv_path):
-            self.logger.warning(f"경고: {csv_path} 파일을 찾을 수 없습니다.")
+        """CSV 파일에서 데이터 임포트 (정규화된 term 기준 중복 제외)
+
+        파일을 한 줄씩 읽어 IMPORT_CHUNK_SIZE행씩 executemany로 넣고,
+        중복은 고유 인덱스(idx_term_list_term)에 맡겨 ON CONFLICT DO NOTHING으로 건너뛴다.
+        _initialize_database의 트랜잭션 안에서 실행되므로 전체가 한 번에 커밋된다.
+        """
+        if not os.path.exists(self.csv_path):
+            self.logger.warning(f"경고: {self.csv_path} 파일을 찾을 수 없습니다.")
             return
-        
+
         try:
-            with open(csv_path, 'r', encoding='utf-8') as file:
+            start = time.perf_counter()
+            read_count = 0
+            skipped_count = 0
+            insert_count = 0
+            with open(self.csv_path, 'r', encoding='utf-8', newline='') as file:
                 csv_reader = csv.reader(file, quoting=csv.QUOTE_MINIMAL)
-                next(csv_reader)  # 헤더 건너뛰기
-                
-                insert_count = 0
-                for row in csv_reader:
-                    if len(row) == 3:  # 모든 필드가 있는 경우에만 처리
-                        # term 중복 체크
-                        cursor.execute('SELECT COUNT(*) FROM term_list WHERE term = ?', (row[0],))
-                        if cursor.fetchone()[0] == 0:  # 중복되지 않은 경우에만 삽입
-                            cursor.execute('''
-                            INSERT INTO term_list (term, short_description, description)
-                            VALUES (?, ?, ?)
-                            ''', (row[0], row[1], row[2]))
-                            insert_count += 1
-                
-                self.logger.info(f"{insert_count}개의 중복되지 않은 데이터가 임포트되었습니다.")
-        
+                next(csv_reader, None)  # 헤더 건너뛰기
+
+                while True:
+                    chunk = list(islice(csv_reader, self.IMPORT_CHUNK_SIZE))
+                    if not chunk:
+                        break
+                    read_count += len(chunk)
+                    rows = [row for row in chunk if len(row) == 3]  # 모든 필드가 있는 경우에만 처리
+                    skipped_count += len(chunk) - len(rows)
+                    before = self.conn.total_changes
+                    cursor.executemany('''
+                    INSERT INTO term_list (term, short_description, description)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT DO NOTHING
+                    ''', rows)
+                    insert_count += self.conn.total_changes - before
+
+            elapsed = time.perf_counter() - start
+            duplicate_count = read_count - skipped_count - insert_count
+            self.logger.info(f"{insert_count}개의 중복되지 않은 데이터가 임포트되었습니다. "
+                             f"(읽은 행 {read_count}개, 중복 {duplicate_count}개, 필드 누락 {skipped_count}개, "
+                             f"{elapsed:.2f}초, 초당 {read_count / max(elapsed, 1e-9):,.0f}행)")
+
         except Exception as e:
             self.logger.error(f"CSV 데이터 임포트 중 오류 발생: {e}")
             raise
 
-    def get_random_term(self):
+    def _sample_by_rowid(self, cursor, count):
+        """idx 범위에서 무작위 idx를 뽑아 조건에 맞는 행만 받는 방식 (기각 샘플링)
+
+        조건에 맞는 행마다 뽑힐 확률이 같고, 후보 조회는 기본 키 탐색이라 O(log n)이다.
+        조건에 맞는 행이 드물어 SAMPLE_MAX_BATCHES번 안에 count개를 찾지 못하면 None 반환
+        """
+        # 조건에 맞는 가장 작은/큰 idx (부분 인덱스 양 끝 탐색)
+        cursor.execute(f"""
+            SELECT (SELECT idx FROM term_list WHERE {self.UNPUBLISHED} ORDER BY idx LIMIT 1),
+                   (SELECT idx FROM term_list WHERE {self.UNPUBLISHED} ORDER BY idx DESC LIMIT 1)
+        """)
+        low, high = cursor.fetchone()
+        if low is None:
+            return []
+
+        selected = {}
+        for _ in range(self.SAMPLE_MAX_BATCHES):
+            candidates = [random.randint(low, high) for _ in range(self.SAMPLE_BATCH_SIZE)]
+            placeholders = ', '.join('?' * len(candidates))
+            cursor.execute(f"""
+                SELECT idx, term, short_description, description
+                FROM term_list
+                WHERE idx IN ({placeholders}) AND {self.UNPUBLISHED}
+            """, candidates)
+            rows = {row[0]: row for row in cursor.fetchall()}
+            # 뽑은 순서대로 받아야 결과 순서도 무작위가 됨
+            for idx in candidates:
+                if idx in rows and idx not in selected:
+                    selected[idx] = rows[idx]
+                    if len(selected) == count:
+                        return list(selected.values())
+            # 첫 후보 묶음에서 하나도 못 찾으면 조건에 맞는 행이 드문 것이므로 바로 포기
+            if not selected:
+                break
+        return None
+
+    def _sample_by_offset(self, cursor, count):
+        """부분 인덱스에서 무작위 위치(OFFSET)의 행을 고르는 방식 (정렬 없이 인덱스만 순회)"""
+        cursor.execute(f"SELECT COUNT(*) FROM term_list WHERE {self.UNPUBLISHED}")
+        total = cursor.fetchone()[0]
+        results = []
+        for offset in random.sample(range(total), min(count, total)):
+            cursor.execute(f"""
+                SELECT idx, term, short_description, description
+                FROM term_list
+                WHERE idx = (SELECT idx FROM term_list WHERE {self.UNPUBLISHED} ORDER BY idx LIMIT 1 OFFSET ?)
+            """, (offset,))
+            results.append(cursor.fetchone())
+        return results
+
+    def get_random_term(self, count=3):
+        """게시하지 않은 공개 용어 중 무작위로 count개 선택 (ORDER BY RANDOM() 전체 정렬 없이)
+
+        먼저 idx 기각 샘플링을 시도하고, 조건에 맞는 행이 드물면 부분 인덱스의 무작위 위치로 고른다.
+        두 방식 모두 조건에 맞는 행마다 뽑힐 확률이 같다.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT idx, term, short_description, description 
-                    FROM term_list 
-                    WHERE open_yn = 1 AND file_name IS NULL 
-                    ORDER BY RANDOM() 
-                    LIMIT 3
-                """)
-                results = cursor.fetchall()
+            # 여러 조회가 같은 시점의 데이터를 보도록 한 읽기 트랜잭션에서 실행
+            with self.transaction():
+                cursor = self.conn.cursor()
+                results = self._sample_by_rowid(cursor, count)
+                if results is None:
+                    results = self._sample_by_offset(cursor, count)
                 if len(results) == 0:
                     self.logger.warning("조건에 맞는 데이터가 없습니다.")
                     return None
@@ -104,17 +333,32 @@ class DatabaseManager:
             self.logger.error(f"데이터베이스 오류: {e}")
             return None
 
+    def mark_published(self, items, reg_date=None):
+        """게시한 용어들의 파일명과 등록 시각을 한 트랜잭션에서 기록
+
+        transaction() 안에서 호출하면 바깥 트랜잭션(예: 아웃박스 작업 등록)과 함께 커밋되고,
+        실패하면 예외가 전파되어 함께 롤백된다.
+
+        Args:
+            items (list): (idx, file_name) 목록
+            reg_date (str, optional): 등록 시각 (기본값: 현재 시각, 모든 행에 같은 값)
+
+        Returns:
+            int: 갱신된 행 수
+        """
+        reg_date = reg_date or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        rows = [(file_name, reg_date, idx) for idx, file_name in items]
+        with self.transaction():
+            cursor = self.executemany("UPDATE term_list SET file_name = ?, reg_date = ? WHERE idx = ?", rows)
+        if cursor.rowcount != len(rows):
+            self.logger.warning(f"게시 표시 대상 {len(rows)}건 중 {cursor.rowcount}건만 갱신되었습니다.")
+        self.logger.info(f"데이터베이스 업데이트 완료: {cursor.rowcount}건")
+        return cursor.rowcount
+
     def update_term_list(self, idx, filename):
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "UPDATE term_list SET file_name = ?, reg_date = ? WHERE idx = ?",
-                    (filename, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), idx)
-                )
-                conn.commit()
-                self.logger.info(f"데이터베이스 업데이트 완료: {filename}")
-                return True
+            self.mark_published([(idx, filename)])
+            return True
         except sqlite3.Error as e:
             self.logger.error(f"데이터베이스 업데이트 오류: {e}")
-            return False 
\ No newline at end of file
+            return False
@@ -0,0 +1,191 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+from PIL import Image, ImageChops, ImageOps
+from database_manager import DatabaseManager
+from image_processor import ImageProcessor
+
+# 현재 스크립트의 절대 경로를 기준으로 기본 디렉토리 설정
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_DIR = os.path.join(BASE_DIR, 'golden')
+MANIFEST_PATH = os.path.join(GOLDEN_DIR, 'manifest.json')
+
+# 지각 해시(dHash) 해밍 거리가 이 값 이하면 사람 눈에는 같은 카드로 본다
+PHASH_THRESHOLD = 4
+
+def select_corpus(db_path, count):
+    """term.db에서 고정 코퍼스 선택: 앞쪽 용어 + 각 텍스트 영역에서 가장 긴 용어"""
+    with DatabaseManager(db_path=db_path, read_only=True) as db:
+        cursor = db.conn.cursor()
+        cursor.execute("SELECT idx, term, short_description, description FROM term_list ORDER BY idx LIMIT ?", (count,))
+        rows = cursor.fetchall()
+        # 긴 텍스트는 폰트 크기 탐색과 줄바꿈이 가장 많이 바뀌는 경우
+        for column in ('term', 'short_description', 'description'):
+            cursor.execute(f"""
+                SELECT idx, term, short_description, description FROM term_list
+                ORDER BY length({column}) DESC, idx LIMIT 1
+            """)
+            rows.append(cursor.fetchone())
+        # 라틴 문자(커닝)가 섞인 용어
+        cursor.execute("""
+            SELECT idx, term, short_description, description FROM term_list
+            WHERE term GLOB '*[A-Za-z]*' OR short_description GLOB '*[A-Za-z]*' ORDER BY idx LIMIT 1
+        """)
+        row = cursor.fetchone()
+        if row:
+            rows.append(row)
+
+    corpus = []
+    seen = set()
+    for idx, term, short_description, description in rows:
+        if idx in seen:
+            continue
+        seen.add(idx)
+        corpus.append({
+            'name': f"{len(corpus) + 1:02}_idx{idx}",
+            'no': f"{len(corpus) % 3 + 1:02}",
+            'term': term,
+            'short_description': short_description,
+            'description': description
+        })
+    return corpus
+
+def pixel_hash(img):
+    return hashlib.sha256(img.convert('RGB').tobytes()).hexdigest()
+
+def perceptual_hash(img, size=8):
+    """dHash: 가로로 이웃한 밝기 차이의 부호로 만든 64비트 해시"""
+    gray = img.convert('L').resize((size + 1, size), Image.Resampling.LANCZOS)
+    pixels = list(gray.getdata())
+    bits = 0
+    for row in range(size):
+        for col in range(size):
+            left = pixels[row * (size + 1) + col]
+            right = pixels[row * (size + 1) + col + 1]
+            bits = (bits << 1) | (1 if left > right else 0)
+    return f"{bits:016x}"
+
+def hamming_distance(hash_a, hash_b):
+    return bin(int(hash_a, 16) ^ int(hash_b, 16)).count('1')
+
+def render_corpus(corpus, output_dir):
+    """캐시를 끄고 코퍼스를 렌더링해 {이름: CardResult} 반환"""
+    processor = ImageProcessor(cache_dir=os.path.join(output_dir, 'cache'))
+    processor.use_plan_cache = False
+    processor.card_store = None
+
+    items = [dict(entry, output_path=os.path.join(output_dir, f"{entry['name']}.png")) for entry in corpus]
+    results = processor.create_cards(items, workers=1)
+    return {entry['name']: result for entry, result in zip(corpus, results)}
+
+def save_diff_image(expected, actual, path):
+    """기대 이미지, 실제 이미지, 차이(강조)를 나란히 붙인 이미지 저장"""
+    expected = expected.convert('RGB')
+    actual = actual.convert('RGB')
+    diff = ImageChops.difference(expected, actual)
+    # 차이가 난 픽셀을 잘 보이도록 빨간색으로 강조
+    mask = diff.convert('L').point(lambda value: 255 if value else 0)
+    highlight = ImageOps.grayscale(expected).convert('RGB')
+    highlight.paste((255, 0, 0), mask=mask)
+
+    width, height = expected.size
+    combined = Image.new('RGB', (width * 3, height), (255, 255, 255))
+    combined.paste(expected, (0, 0))
+    combined.paste(actual, (width, 0))
+    combined.paste(highlight, (width * 2, 0))
+    combined.save(path)
+
+def update_golden(args):
+    corpus = select_corpus(os.path.join(BASE_DIR, 'term.db'), args.count)
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    for file_name in os.listdir(GOLDEN_DIR):
+        if file_name.endswith('.png'):
+            os.remove(os.path.join(GOLDEN_DIR, file_name))
+
+    with tempfile.TemporaryDirectory(prefix='card_golden_') as temp_dir:
+        results = render_corpus(corpus, temp_dir)
+        for entry in corpus:
+            with Image.open(results[entry['name']].output_path) as img:
+                img.save(os.path.join(GOLDEN_DIR, f"{entry['name']}.png"))
+                entry['pixel_hash'] = pixel_hash(img)
+                entry['perceptual_hash'] = perceptual_hash(img)
+
+    manifest = {'updated_at': datetime.now().isoformat(timespec='seconds'), 'cards': corpus}
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    print(f"골든 이미지 {len(corpus)}장 갱신: {GOLDEN_DIR}")
+
+def check_golden(args):
+    with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    corpus = manifest['cards']
+
+    report_dir = args.report_dir or os.path.join(BASE_DIR, 'golden_report', datetime.now().strftime('%Y%m%d_%H%M%S'))
+    os.makedirs(report_dir, exist_ok=True)
+
+    entries = []
+    with tempfile.TemporaryDirectory(prefix='card_golden_') as temp_dir:
+        results = render_corpus(corpus, temp_dir)
+        for entry in corpus:
+            result = results[entry['name']]
+            with Image.open(result.output_path) as actual, Image.open(os.path.join(GOLDEN_DIR, f"{entry['name']}.png")) as expected:
+                exact = actual.size == expected.size and pixel_hash(actual) == entry['pixel_hash']
+                distance = hamming_distance(perceptual_hash(actual), entry['perceptual_hash'])
+                status = 'same' if exact else ('similar' if distance <= PHASH_THRESHOLD else 'different')
+                if not exact:
+                    if actual.size == expected.size:
+                        changed = ImageChops.difference(actual.convert('RGB'), expected.convert('RGB')).getbbox()
+                        save_diff_image(expected, actual, os.path.join(report_dir, f"{entry['name']}_diff.png"))
+                    else:
+                        changed = None
+                    actual.save(os.path.join(report_dir, f"{entry['name']}_actual.png"))
+                else:
+                    changed = None
+            entries.append({
+                'name': entry['name'],
+                'term': entry['term'],
+                'status': status,
+                'phash_distance': distance,
+                'changed_region': list(changed) if changed else None,
+                'timings_ms': {stage: seconds * 1000 for stage, seconds in result.timings.items()}
+            })
+
+    failed = [entry for entry in entries if entry['status'] != 'same']
+    report = {
+        'checked_at': datetime.now().isoformat(timespec='seconds'),
+        'golden_updated_at': manifest.get('updated_at'),
+        'cards': len(entries),
+        'failed': len(failed),
+        'total_render_ms': sum(sum(entry['timings_ms'].values()) for entry in entries),
+        'entries': entries
+    }
+    with open(os.path.join(report_dir, 'report.json'), 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    for entry in entries:
+        total = sum(entry['timings_ms'].values())
+        print(f"[{entry['status']:<9}] {entry['name']} {entry['term']} (dHash 거리 {entry['phash_distance']}, {total:.1f}ms)")
+    print(f"\n{len(entries)}장 중 {len(failed)}장 불일치, 렌더링 합계 {report['total_render_ms']:.1f}ms")
+    print(f"리포트: {report_dir}")
+    return not failed
+
+def main():
+    parser = argparse.ArgumentParser(description='골든 이미지와 비교하는 카드 렌더링 회귀 검사')
+    parser.add_argument('--update', action='store_true', help='term.db에서 코퍼스를 다시 골라 골든 이미지 갱신')
+    parser.add_argument('--count', type=int, default=12, help='--update 시 앞에서부터 고를 용어 수 (기본값: 12)')
+    parser.add_argument('--report-dir', default=None, help='차이 이미지와 report.json 저장 경로 (기본값: golden_report/<시각>)')
+    args = parser.parse_args()
+
+    if args.update:
+        update_golden(args)
+        return
+
+    if not check_golden(args):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,143 @@
 import os
+import json
+import hashlib
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from PIL import Image, ImageDraw, ImageFont
-import textwrap
 from utils.logger_util import LoggerUtil
+from utils.font_cache import FontCache
+from utils.font_fitter import FontFitter
+from utils.text_measurer import TextMeasurer
+from utils.text_wrapper import TextWrapper
+from utils.card_store import CardStore
+from utils.image_encoder import ImageEncoder, EncodedImage
 
 class ImageProcessor:
-    def __init__(self):
-        """이미지 카드 생성기 초기화"""
+    # 레이아웃 계획 형식이 바뀌면 올려서 이전 캐시를 무효화
+    PLAN_VERSION = 1
+
+    def __init__(self, cache_dir=None, output_profile='png', upload_profile='png_optimized'):
+        """이미지 카드 생성기 초기화
+
+        Args:
+            cache_dir (str, optional): 레이아웃 계획 캐시와 카드 저장소 경로 (기본값: cache)
+            output_profile (str): 저장할 카드 파일의 출력 프로필 (ImageEncoder.PROFILES, 기본값: 'png')
+            upload_profile (str): 업로드용 변형의 출력 프로필 (기본값: 'png_optimized')
+        """
         # 스크립트의 절대 경로를 기준으로 기본 디렉토리 설정
         self.base_dir = os.path.dirname(os.path.abspath(__file__))
         self.background_path = os.path.join(self.base_dir, 'img', 'background_card.png')
+        self.sb_aggro_m_font_path = os.path.join(self.base_dir, 'fonts', 'SB-Aggro-Medium.ttf')
+        self.sb_aggro_b_font_path = os.path.join(self.base_dir, 'fonts', 'SB-Aggro-Bold.ttf')
+        self.gm_sans_b_font_path = os.path.join(self.base_dir, 'fonts', 'GmarketSansTTFBold.ttf')
+        # 텍스트 영역별 폰트와 최대 크기 (폰트 크기는 initial_size부터 줄여가며 맞춤)
+        self.text_fields = {
+            'term': {'font_path': self.sb_aggro_b_font_path, 'max_width': 750, 'max_height': 200, 'initial_size': 165, 'start_y': 260},
+            'short_description': {'font_path': self.sb_aggro_m_font_path, 'max_width': 780, 'max_height': 100, 'initial_size': 38, 'start_y': 480},
+            'description': {'font_path': self.gm_sans_b_font_path, 'max_width': 700, 'max_height': 200, 'initial_size': 36, 'start_y': 630,
+                            'box_padding': (40, 30), 'box_radius': 20},
+        }
+        # 서브 타이틀 (고정 위치, 번호를 뺀 앞부분은 배경과 함께 미리 그려 둠)
+        self.subtitle = {'prefix': '경제용어 ', 'position': (358, 130), 'font_path': self.sb_aggro_m_font_path, 'size': 40}
+        # 요소별 색상 (레이아웃 계획에는 포함되지 않으므로 바꿔도 폰트 크기 탐색을 다시 하지 않음)
+        self.colors = {
+            'term': (174, 151, 116),
+            'short_description': (180, 159, 126),
+            'description_box': (174, 151, 116),
+            'description': (255, 255, 255),
+            'subtitle': (255, 255, 255),
+        }
+        # 레이아웃 계획 캐시와 완성된 카드 저장소 (둘 다 크기 상한을 넘으면 오래 쓰지 않은 항목부터 삭제)
+        self.cache_dir = cache_dir or os.path.join(self.base_dir, 'cache')
+        self.plan_store = CardStore(os.path.join(self.cache_dir, 'layout'), max_bytes=50 * 1024 * 1024)
+        self.use_plan_cache = True
+        self.card_store = CardStore(os.path.join(self.cache_dir, 'cards'))
+        # 보관용 PNG와 업로드용 변형 인코딩
+        self.image_encoder = ImageEncoder(archive_profile=output_profile, upload_profile=upload_profile)
         self.logger = LoggerUtil().get_logger()
+        self.font_cache = FontCache()
+        self.font_fitter = FontFitter()
+        self.text_measurer = TextMeasurer()
+        self.text_wrapper = TextWrapper(self.text_measurer)
+        self._template = None
+        self._template_lock = threading.Lock()
+        self._file_hashes = {}
+
+    def preload_fonts(self, all_sizes=False):
+        """카드 레이아웃에서 사용하는 폰트를 캐시에 미리 로드
+
+        all_sizes가 True이면 폰트 크기 탐색 중 시도될 수 있는 모든 크기를 로드한다.
+        """
+        for field in self.text_fields.values():
+            initial_size = field['initial_size']
+            sizes = range(initial_size, 10, -2) if all_sizes else [initial_size]
+            self.font_cache.preload(field['font_path'], sizes)
+        # 서브 타이틀
+        self.font_cache.preload(self.subtitle['font_path'], [self.subtitle['size']])
+
+    def _get_template_signature(self):
+        """배경 이미지와 서브 타이틀 폰트 파일의 (경로, 수정 시각, 크기) 목록과 미리 그리는 서브 타이틀 설정"""
+        signature = []
+        for path in (self.background_path, self.subtitle['font_path']):
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        signature.append((self.subtitle['prefix'], self.subtitle['position'], self.subtitle['size'], self.colors['subtitle']))
+        return tuple(signature)
+
+    def _get_template_hash(self):
+        """배경 이미지와 서브 타이틀 폰트 파일 내용의 해시"""
+        sha256 = hashlib.sha256()
+        for path in (self.background_path, self.subtitle['font_path']):
+            with open(path, 'rb') as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                    sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def _build_template(self):
+        """배경 이미지를 디코딩하고 고정 요소(서브 타이틀 앞부분)를 미리 그린 기본 이미지 생성"""
+        with Image.open(self.background_path) as background:
+            img = background.copy()
+        
+        draw = ImageDraw.Draw(img)
+        font = self.font_cache.get_font(self.subtitle['font_path'], self.subtitle['size'])
+        draw.text(self.subtitle['position'], self.subtitle['prefix'], font=font, fill=self.colors['subtitle'])
+        return img
+
+    def _get_template(self):
+        """미리 합성된 기본 이미지 반환 (파일의 수정 시각이나 내용이 바뀌면 다시 생성)"""
+        signature = self._get_template_signature()
+        with self._template_lock:
+            template = self._template
+            if template and template['signature'] == signature:
+                return template['image']
+            
+            # 수정 시각만 바뀌고 내용과 설정이 같으면 기존 이미지를 그대로 사용
+            template_hash = self._get_template_hash()
+            if template and template['hash'] == template_hash and template['signature'][-1] == signature[-1]:
+                template['signature'] = signature
+                return template['image']
+            
+            if template:
+                self.logger.info("배경 템플릿이 변경되어 다시 불러옵니다.")
+            self._template = {
+                'signature': signature,
+                'hash': template_hash,
+                'image': self._build_template()
+            }
+            return self._template['image']
+
+    def _layout_subtitle_number(self, no):
+        """미리 그려진 서브 타이틀 앞부분 뒤에 올 번호의 배치"""
+        font = self.font_cache.get_font(self.subtitle['font_path'], self.subtitle['size'])
+        number = str(no)
+        prefix = self.subtitle['prefix']
+        # 앞부분과 이어서 한 번에 그린 것과 같은 위치 (앞부분 마지막 글자와의 커닝 포함)
+        offset = self.text_measurer.getlength(font, prefix + number[:1]) - self.text_measurer.getlength(font, number[:1])
+        x, y = self.subtitle['position']
+        return [self._text_element('subtitle', font, number, x + offset, y)]
 
     def _get_unique_filename(self, base_path):
         """파일명이 중복될 경우 인덱스를 붙여 고유한 파일명 생성"""
@@ -26,33 +154,51 @@ class ImageProcessor:
         
         return new_path
     
-    def _draw_text(self, draw, text, font, img_width, start_y, fill):
-        """한 줄의 텍스트를 이미지 중앙에 그리기"""
+    def _font_ref(self, font):
+        """레이아웃 계획에 저장할 폰트 정보 (기본 디렉토리 안의 폰트는 상대 경로로 저장)"""
+        path = getattr(font, 'path', None)
+        if path and os.path.abspath(path).startswith(self.base_dir + os.sep):
+            path = os.path.relpath(path, self.base_dir)
+        return {'path': path, 'size': getattr(font, 'size', None)}
+
+    def _resolve_font(self, font_ref):
+        """레이아웃 계획의 폰트 정보로 폰트 객체 반환"""
+        if not font_ref['path']:
+            return ImageFont.load_default()
+        return self.font_cache.get_font(os.path.join(self.base_dir, font_ref['path']), font_ref['size'])
+
+    def _text_element(self, role, font, text, x, y):
+        return {'type': 'text', 'role': role, 'font': self._font_ref(font), 'text': text, 'xy': [x, y]}
+
+    def _layout_text(self, role, text, font, img_width, start_y):
+        """한 줄의 텍스트를 이미지 중앙에 배치"""
         # 텍스트의 너비 계산
-        bbox = font.getbbox(text)
+        bbox = self.text_measurer.getbbox(font, text)
         text_width = bbox[2] - bbox[0]
         
         # 중앙 정렬을 위한 x 좌표 계산
         x_position = (img_width - text_width) // 2
         
-        # 텍스트 그리기
-        draw.text((x_position, start_y), text, font=font, fill=fill)
+        return [self._text_element(role, font, text, x_position, start_y)]
         
-    def _draw_multiline_text(self, draw, text, font, img_width, start_y, fill):
-        """줄바꿈된 텍스트를 이미지 중앙에 그리기"""
+    def _layout_multiline_text(self, role, text, font, img_width, start_y):
+        """줄바꿈된 텍스트를 이미지 중앙에 배치"""
         lines = text.split('\n')  # 이미 줄바꿈된 텍스트를 라인별로 분리
         current_y = start_y
+        elements = []
         
         for line in lines:
-            bbox = font.getbbox(line)
+            bbox = self.text_measurer.getbbox(font, line)
             line_width = bbox[2] - bbox[0]
             line_height = bbox[3] - bbox[1]
             
             # 각 줄의 x 좌표 계산 (중앙 정렬)
             line_x = (img_width - line_width) // 2
             
-            draw.text((line_x, current_y), line, font=font, fill=fill)
+            elements.append(self._text_element(role, font, line, line_x, current_y))
             current_y += line_height * 1.5 # 다음 줄로 이동
+        
+        return elements
 
     def _draw_rounded_rectangle(self, draw, coords, radius, fill):
         """둥근 모서리 사각형 그리기"""
@@ -67,69 +213,94 @@ class ImageProcessor:
         draw.ellipse([x1, y2 - diameter, x1 + diameter, y2], fill=fill)
         draw.ellipse([x2 - diameter, y2 - diameter, x2, y2], fill=fill)
     
+    def _wrap_text(self, text, max_width, font):
+        """마침표 기준으로 문장을 나누고 실제 글자 너비에 맞춰 줄바꿈"""
+        return self.text_wrapper.fill(text, font, max_width)
+
+    def _measure_wrapped_text(self, wrapped_text, font, font_size, exact=False):
+        """줄바꿈된 텍스트의 최대 줄 너비와 총 높이 계산
+
+        기본적으로 글자별 측정 테이블을 사용하고, exact가 True이면 Pillow로 직접 측정한다.
+        """
+        lines = wrapped_text.split('\n')
+        getbbox = self.text_measurer.get_exact_bbox if exact else self.text_measurer.getbbox
+        
+        # 모든 줄의 최대 너비와 총 높이 계산
+        max_line_width = 0
+        total_height = 0
+        line_spacing = font_size * 0.3
+        
+        for line in lines:
+            bbox = getbbox(font, line)
+            line_width = bbox[2] - bbox[0]
+            line_height = bbox[3] - bbox[1]
+            max_line_width = max(max_line_width, line_width)
+            total_height += line_height
+        
+        if len(lines) > 1:
+            total_height += line_spacing * (len(lines) - 1)
+        
+        return max_line_width, total_height
+
+    def _fit_text(self, text, max_width, max_height, font_path, font_size, exact=False):
+        """주어진 폰트 크기로 텍스트가 영역에 들어가면 (폰트, 줄바꿈된 텍스트) 반환, 아니면 None"""
+        font = self.font_cache.get_font(font_path, font_size)
+        wrapped_text = self._wrap_text(text, max_width, font)
+        max_line_width, total_height = self._measure_wrapped_text(wrapped_text, font, font_size, exact=exact)
+        
+        if max_line_width <= max_width and total_height <= max_height:
+            return font, wrapped_text
+        return None
+
     def _get_optimal_font_size(self, text, max_width, max_height, font_path=None, initial_size=60):
-        font_size = initial_size
-        
-        while font_size > 10:  # 최소 폰트 크기는 10
-            try:
-                if font_path:
-                    font = ImageFont.truetype(font_path, font_size)
-                else:
-                    font = ImageFont.load_default()
-                    return font
-                    
-                # 마침표를 기준으로 문장을 나누기
-                sentences = text.split('.')
-                wrapped_lines = []
-                
-                # 각 문장 처리
-                for i, sentence in enumerate(sentences):
-                    if sentence.strip():  # 빈 문장 제외
-                        # 현재 문장을 줄바꿈 처리
-                        char_limit = int(max_width / (font_size * 0.8))  # 폰트 크기를 고려한 글자 수 계산
-                        wrapped = textwrap.fill(sentence.strip(), width=char_limit)
-                        current_lines = wrapped.split('\n')
-                        
-                        # 마지막 줄에만 마침표 추가 (마지막 문장이 아닌 경우에만)
-                        if i < len(sentences) - 1:
-                            current_lines[-1] = current_lines[-1] + '.'
-                        
-                        wrapped_lines.extend(current_lines)
-                
-                wrapped_text = '\n'.join(wrapped_lines)
-                lines = wrapped_text.split('\n')
-                
-                # 모든 줄의 최대 너비와 총 높이 계산
-                max_line_width = 0
-                total_height = 0
-                line_spacing = font_size * 0.3
-                
-                for line in lines:
-                    bbox = font.getbbox(line)
-                    line_width = bbox[2] - bbox[0]
-                    line_height = bbox[3] - bbox[1]
-                    max_line_width = max(max_line_width, line_width)
-                    total_height += line_height
-                
-                if len(lines) > 1:
-                    total_height += line_spacing * (len(lines) - 1)
-                
-                if max_line_width <= max_width and total_height <= max_height:
-                    return font, wrapped_text
-                
-            except Exception as e:
-                self.logger.error(f"폰트 크기 조정 중 오류 발생: {e}")
-                if font_size == initial_size:
-                    font = ImageFont.load_default()
-                    return font, text
-                
-            font_size -= 2
+        if not font_path:
+            font = ImageFont.load_default()
+            return font
+        
+        # 최소 폰트 크기는 10 (initial_size부터 2씩 줄여가며 후보 생성)
+        sizes = list(range(initial_size, 10, -2))
+        
+        def search(exact):
+            def fit(font_size):
+                try:
+                    return self._fit_text(text, max_width, max_height, font_path, font_size, exact=exact)
+                except Exception as e:
+                    self.logger.error(f"폰트 크기 조정 중 오류 발생: {e}")
+                    return None
+            
+            # 크기가 작을수록 줄바꿈한 텍스트도 작아진다고 가정하고 전체 후보를 이분 탐색하고
+            # (선택한 크기가 들어가는지는 아래에서 정확한 측정으로 다시 확인),
+            # 비슷한 길이의 텍스트는 직전 결과에서 탐색 시작
+            hint_key = (font_path, max_width, max_height, initial_size, len(text) // 4)
+            return self.font_fitter.find(sizes, fit, hint_key=hint_key)
+        
+        font_size, fitted = search(exact=False)
+        if fitted:
+            # 선택된 크기만 Pillow로 다시 측정해 최종 확인
+            if self._fit_text(text, max_width, max_height, font_path, font_size, exact=True):
+                return fitted
+            self.logger.warning(f"측정 테이블과 Pillow 측정값이 다릅니다. 직접 측정으로 다시 탐색합니다: {text}")
+            font_size, fitted = search(exact=True)
+        
+        if fitted:
+            return fitted
         
         font = ImageFont.load_default()
         return font, text
 
-    def _draw_content_box(self, draw, text, font, width, start_y, text_color, box_color):
-        """텍스트 배경 박스를 그리고 텍스트를 작성하는 메서드"""
+    def fit_text_field(self, name, text):
+        """text_fields에 정의된 영역에 맞는 (폰트, 줄바꿈된 텍스트) 반환"""
+        field = self.text_fields[name]
+        return self._get_optimal_font_size(
+            text,
+            field['max_width'],
+            field['max_height'],
+            field['font_path'],
+            field['initial_size']
+        )
+
+    def _layout_content_box(self, role, text, font, width, start_y, padding, radius):
+        """텍스트 배경 박스와 텍스트를 배치하는 메서드"""
         # 텍스트의 크기 계산
         lines = text.split('\n')
         total_height = 0
@@ -137,12 +308,11 @@ class ImageProcessor:
         line_spacing = font.size * 0.3
         
         # 첫 번째 라인의 실제 높이 계산 (ascent + descent)
-        first_line = lines[0]
         ascent, descent = font.getmetrics()
         line_height = ascent + descent
         
         for line in lines:
-            bbox = font.getbbox(line)
+            bbox = self.text_measurer.getbbox(font, line)
             line_width = bbox[2] - bbox[0]
             max_width = max(max_width, line_width)
             total_height += line_height  # 실제 라인 높이 사용
@@ -151,8 +321,7 @@ class ImageProcessor:
             total_height += line_spacing * (len(lines) - 1)
         
         # 배경 박스의 패딩 설정
-        padding_x = 40
-        padding_y = 30
+        padding_x, padding_y = padding
         
         # 텍스트의 실제 시작 위치 계산 (베이스라인 조정)
         text_start_y = start_y - (ascent * 0.1)  # 텍스트 위치를 약간 위로 조정
@@ -163,80 +332,306 @@ class ImageProcessor:
         box_right = (width + max_width) // 2 + padding_x
         box_bottom = text_start_y + total_height + padding_y
         
-        # 배경 박스 그리기
-        self._draw_rounded_rectangle(
-            draw,
-            [box_left, box_top, box_right, box_bottom],
-            radius=20,
-            fill=box_color
-        )
+        box = {
+            'type': 'rounded_rectangle',
+            'role': f'{role}_box',
+            'coords': [box_left, box_top, box_right, box_bottom],
+            'radius': radius
+        }
+        return [box] + self._layout_multiline_text(role, text, font, width, text_start_y)
+
+    def _get_file_hash(self, path):
+        """파일 내용 해시 (수정 시각과 크기가 같으면 이전 결과 재사용)"""
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        file_hash = self._file_hashes.get(key)
+        if file_hash is None:
+            sha256 = hashlib.sha256()
+            with open(path, 'rb') as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                    sha256.update(chunk)
+            file_hash = sha256.hexdigest()
+            self._file_hashes[key] = file_hash
+        return file_hash
+
+    def _get_layout_signature(self):
+        """레이아웃 결과에 영향을 주는 배경, 폰트, 레이아웃 상수 (색상 제외)"""
+        font_paths = sorted({field['font_path'] for field in self.text_fields.values()} | {self.subtitle['font_path']})
+        return {
+            'version': self.PLAN_VERSION,
+            'background': self._get_file_hash(self.background_path),
+            'fonts': {os.path.basename(path): self._get_file_hash(path) for path in font_paths},
+            'text_fields': {name: {key: os.path.basename(value) if key == 'font_path' else value for key, value in field.items()}
+                            for name, field in self.text_fields.items()},
+            'subtitle': {key: os.path.basename(value) if key == 'font_path' else value for key, value in self.subtitle.items()},
+        }
+
+    def get_plan_key(self, no, term, short_description, description):
+        """용어 텍스트, 배경, 폰트, 레이아웃 상수로 만든 레이아웃 계획 캐시 키"""
+        payload = {
+            'no': str(no),
+            'term': term,
+            'short_description': short_description,
+            'description': description,
+            'layout': self._get_layout_signature()
+        }
+        encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=list).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get_card_key(self, no, term, short_description, description, output_path):
+        """카드 이미지를 결정하는 모든 입력(레이아웃 계획 입력, 색상, 출력 프로필)의 해시"""
+        payload = {
+            'plan': self.get_plan_key(no, term, short_description, description),
+            'colors': self.colors,
+            'format': os.path.splitext(output_path)[1].lower(),
+            'profile': self.image_encoder.archive_profile
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=list).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _load_cached_plan(self, key):
+        data = self.plan_store.get_data(key, '.json')
+        if data is None:
+            return None
+        try:
+            plan = json.loads(data)
+        except ValueError as e:
+            self.logger.warning(f"레이아웃 계획 캐시를 읽을 수 없습니다: {key} - {e}")
+            return None
+        return plan if plan.get('key') == key else None
+
+    def _save_cached_plan(self, plan):
+        """레이아웃 계획을 plan_store에 저장 (배경, 폰트, 레이아웃 상수가 바뀌어 쓰이지 않는 계획은 LRU로 삭제됨)"""
+        self.plan_store.put_data(plan['key'], json.dumps(plan, ensure_ascii=False).encode('utf-8'), '.json')
+
+    def plan_card(self, no, term, short_description, description):
+        """폰트 크기, 줄바꿈, 각 요소의 위치를 계산한 레이아웃 계획 반환 (JSON으로 저장 가능)
+
+        같은 텍스트, 배경, 폰트, 레이아웃 상수의 계획은 디스크에 캐시되어 폰트 크기 탐색을 건너뛴다.
+        색상은 계획에 포함되지 않고 render_plan에서 적용된다.
+        """
+        key = self.get_plan_key(no, term, short_description, description) if self.use_plan_cache else None
+        if key:
+            plan = self._load_cached_plan(key)
+            if plan:
+                return plan
         
-        # 텍스트 그리기
-        self._draw_multiline_text(
-            draw, 
-            text, 
-            font, 
-            width, 
-            start_y=text_start_y, 
-            fill=text_color
-        )
+        width, height = self._get_template().size
+        
+        # 타이틀, 짧은 설명, 긴 설명의 폰트 크기 및 줄바꿈 결정
+        term_font, term_text = self.fit_text_field('term', term)
+        short_description_font, short_description_text = self.fit_text_field('short_description', short_description)
+        description_font, description_text = self.fit_text_field('description', description)
+        
+        description_field = self.text_fields['description']
+        elements = []
+        # 타이틀
+        elements += self._layout_text('term', term_text, term_font, width, self.text_fields['term']['start_y'])
+        # 짧은 설명
+        elements += self._layout_multiline_text('short_description', short_description_text, short_description_font, width,
+                                                self.text_fields['short_description']['start_y'])
+        # 긴 설명 (배경 박스 포함)
+        elements += self._layout_content_box('description', description_text, description_font, width, description_field['start_y'],
+                                             description_field['box_padding'], description_field['box_radius'])
+        # 서브 타이틀 번호 (앞부분은 템플릿에 포함)
+        elements += self._layout_subtitle_number(no)
+        
+        plan = {
+            'key': key,
+            'version': self.PLAN_VERSION,
+            'size': [width, height],
+            'elements': elements
+        }
+        if key:
+            self._save_cached_plan(plan)
+        return plan
 
-    def create_card(self, no, term, short_description, description, output_path):
-        """카드 이미지 생성"""
+    def render_plan(self, plan):
+        """레이아웃 계획대로 템플릿 위에 그린 이미지 반환"""
+        img = self._get_template().copy()
+        draw = ImageDraw.Draw(img)
+        
+        for element in plan['elements']:
+            fill = self.colors[element['role']]
+            if element['type'] == 'rounded_rectangle':
+                self._draw_rounded_rectangle(draw, element['coords'], element['radius'], fill)
+            else:
+                font = self._resolve_font(element['font'])
+                draw.text(tuple(element['xy']), element['text'], font=font, fill=fill)
+        return img
+
+    def _get_variant_key(self, card_key, name):
+        """카드 키와 출력 크기 설정으로 만든 변형 저장 키"""
+        payload = {'card': card_key, 'size': self.image_encoder.get_signature(name)}
+        encoded = json.dumps(payload, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _get_stored_variants(self, card_key, output_path, sizes):
+        """카드 저장소에서 출력 크기별 변형을 꺼내기 (하나라도 없으면 None)"""
+        variants = {}
+        for name in sizes:
+            data = self.card_store.get_data(self._get_variant_key(card_key, name), '.variant')
+            if data is None:
+                return None
+            image_format = self.image_encoder.detect_format(data)
+            filename = self.image_encoder.get_variant_filename(os.path.basename(output_path), name, image_format)
+            variants[name] = EncodedImage(filename, data, image_format)
+        return variants
 
-        sb_aggro_m_font_path = os.path.join(self.base_dir, 'fonts', 'SB-Aggro-Medium.ttf')
-        sb_aggro_b_font_path = os.path.join(self.base_dir, 'fonts', 'SB-Aggro-Bold.ttf')
-        gm_sans_b_font_path = os.path.join(self.base_dir, 'fonts', 'GmarketSansTTFBold.ttf')
+    def _render_card(self, no, term, short_description, description, output_path, sizes=()):
+        """카드 이미지를 생성하고 (저장 경로, 단계별 소요 시간, {출력 크기 이름: EncodedImage}) 반환
 
+        렌더링한 이미지는 메모리에서 바로 보관용 파일과 요청한 출력 크기(ImageEncoder.SIZES)로 인코딩되어,
+        채널마다 저장된 파일을 다시 열어 디코딩하고 축소하지 않는다.
+        """
+        timings = {}
+        # 출력 프로필의 확장자로 저장 (예: webp 프로필이면 .png 대신 .webp)
+        output_path = os.path.splitext(output_path)[0] + self.image_encoder.get_extension()
+        
+        start = time.perf_counter()
         try:
-            img = Image.open(self.background_path)
+            self._get_template()
         except FileNotFoundError:
             self.logger.error("배경 이미지를 찾을 수 없습니다.")
-            return
+            return None, timings, {}
+        timings['template'] = time.perf_counter() - start
         
-        draw = ImageDraw.Draw(img)
-        width, height = img.size
-
-        # 타이틀 폰트 및 텍스트 설정
-        term_font, term_text = self._get_optimal_font_size(term, 750, 200, sb_aggro_b_font_path, 165)
-        self._draw_text(
-            draw, 
-            term_text, 
-            term_font, 
-            width, 
-            start_y=260, 
-            fill=(174, 151, 116)
-        )
+        # 같은 입력으로 만든 카드가 저장소에 있으면 렌더링 없이 재사용
+        card_key = None
+        if self.card_store:
+            start = time.perf_counter()
+            card_key = self.get_card_key(no, term, short_description, description, output_path)
+            unique_output_path = self._get_unique_filename(output_path)
+            found = self.card_store.get(card_key, unique_output_path)
+            variants = self._get_stored_variants(card_key, unique_output_path, sizes) if found else None
+            timings['card_store'] = time.perf_counter() - start
+            if variants is not None:
+                self.logger.info(f"저장된 카드 재사용: {unique_output_path}")
+                return unique_output_path, timings, variants
+            if found:
+                # 출력 크기별 변형이 없으면 저장된 카드를 지우고 새로 렌더링
+                os.remove(unique_output_path)
+        
+        start = time.perf_counter()
+        plan = self.plan_card(no, term, short_description, description)
+        timings['font_fitting'] = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        img = self.render_plan(plan)
+        timings['drawing'] = time.perf_counter() - start
 
-        # 짧은 설명 폰트 설정
-        short_description_font, short_description_text = self._get_optimal_font_size(short_description, 780, 100, sb_aggro_m_font_path, 38)
-        self._draw_multiline_text(
-            draw, 
-            short_description_text, 
-            short_description_font, 
-            width, 
-            start_y=480, 
-            fill=(180, 159, 126)
-        )
+        start = time.perf_counter()
+        unique_output_path = self._get_unique_filename(output_path)
+        archive, variants = self.image_encoder.encode(img, os.path.basename(unique_output_path), sizes)
+        timings['encode'] = time.perf_counter() - start
 
-        # 긴 설명 폰트 설정
-        description_font, description_text = self._get_optimal_font_size(description, 700, 200, gm_sans_b_font_path, 36)
-        self._draw_content_box(
-            draw=draw,
-            text=description_text,
-            font=description_font,
-            width=width,
-            start_y=630,
-            text_color=(255, 255, 255),
-            box_color=(174, 151, 116)
-        )
+        start = time.perf_counter()
+        with open(unique_output_path, 'wb') as file:
+            file.write(archive)
+        timings['save'] = time.perf_counter() - start
         
-        # 서브 타이틀 작성 (고정 위치)
-        subtitle_text = f"경제용어 {no}"
-        draw.text((358, 130), subtitle_text, font=ImageFont.truetype(sb_aggro_m_font_path, 40), fill=(255, 255, 255))
+        if card_key:
+            self.card_store.put(card_key, unique_output_path)
+            for name, variant in variants.items():
+                self.card_store.put_data(self._get_variant_key(card_key, name), variant.data, '.variant')
+        
+        return unique_output_path, timings, variants
 
-        unique_output_path = self._get_unique_filename(output_path)
-        img.save(unique_output_path)
+    def create_card(self, no, term, short_description, description, output_path):
+        """카드 이미지 생성 후 저장된 경로 반환"""
+        unique_output_path, _, _ = self._render_card(no, term, short_description, description, output_path)
+        return unique_output_path
+
+    def _get_worker_options(self):
+        """작업 프로세스에서 같은 설정의 ImageProcessor를 만들기 위한 옵션
+
+        spawn 방식(Windows, macOS 기본값)에서도 넘길 수 있도록 기본 자료형만 담고,
+        카드 저장소와 인코더는 작업 프로세스에서 이 설정으로 새로 만든다.
+        """
+        def store_options(store):
+            return {'store_dir': store.store_dir, 'max_bytes': store.max_bytes} if store else None
+
+        return {
+            'attributes': {
+                'background_path': self.background_path,
+                'cache_dir': self.cache_dir,
+                'use_plan_cache': self.use_plan_cache,
+                'colors': self.colors
+            },
+            'plan_store': store_options(self.plan_store),
+            'card_store': store_options(self.card_store),
+            'image_encoder': self.image_encoder.get_config()
+        }
+
+    def create_cards(self, items, workers=None, sizes=(), mp_context=None):
+        """여러 장의 카드를 작업 프로세스에서 병렬로 생성
+
+        Args:
+            items (list): no, term, short_description, description, output_path 키를 가진 dict 목록
+            workers (int, optional): 작업 프로세스 수 (기본값: CPU 코어 수와 카드 수 중 작은 값)
+            sizes (list): 보관용 파일과 함께 메모리에서 인코딩할 출력 크기 이름 (ImageEncoder.SIZES, 예: ['upload'])
+            mp_context (optional): 작업 프로세스 시작 방식 (multiprocessing.get_context('spawn') 등, 기본값: 플랫폼 기본값)
+
+        Returns:
+            list: 입력 순서대로 CardResult(no, output_path, timings, variants)
+                  variants는 {출력 크기 이름: EncodedImage}
+        """
+        items = list(items)
+        if not items:
+            return []
+        sizes = tuple(sizes)
+        unknown = [name for name in sizes if name not in self.image_encoder.sizes]
+        if unknown:
+            raise ValueError(f"알 수 없는 출력 크기: {', '.join(unknown)}")
+        
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, len(items)))
+        
+        if workers == 1:
+            return [_render_item(self, item, sizes) for item in items]
+        
+        self.logger.info(f"카드 {len(items)}장 병렬 생성 시작 (작업 프로세스 {workers}개)")
+        chunksize = max(1, len(items) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self._get_worker_options(),)
+        ) as executor:
+            return list(executor.map(partial(_render_in_worker, sizes=sizes), items, chunksize=chunksize))
+
+CardResult = namedtuple('CardResult', ['no', 'output_path', 'timings', 'variants'])
+
+# 작업 프로세스마다 하나씩 만들어 재사용하는 ImageProcessor
+_worker_processor = None
+
+def _init_worker(options):
+    """작업 프로세스 초기화: 폰트와 배경 템플릿을 한 번만 불러옴"""
+    global _worker_processor
+    _worker_processor = ImageProcessor()
+    for key, value in options['attributes'].items():
+        setattr(_worker_processor, key, value)
+    for name in ('plan_store', 'card_store'):
+        store = options[name]
+        setattr(_worker_processor, name, CardStore(**store) if store else None)
+    _worker_processor.image_encoder = ImageEncoder.from_config(options['image_encoder'])
+    _worker_processor.preload_fonts()
+    _worker_processor._get_template()
+
+def _render_item(processor, item, sizes=()):
+    output_path, timings, variants = processor._render_card(
+        no=item['no'],
+        term=item['term'],
+        short_description=item['short_description'],
+        description=item['description'],
+        output_path=item['output_path'],
+        sizes=sizes
+    )
+    return CardResult(item['no'], output_path, timings, variants)
+
+def _render_in_worker(item, sizes=()):
+    return _render_item(_worker_processor, item, sizes)
 
 def main():
     logger = LoggerUtil().get_logger()
@@ -17,27 +17,19 @@ global_skip = False
 global_overwrite = False
 
 def get_existing_term(term):
-    import sqlite3
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
-        cursor.execute('SELECT idx, short_description, description FROM term_list WHERE term = ?', (term,))
-        return cursor.fetchone()
+    # 정규화된 용어로 비교 (idx_term_list_term 인덱스 사용)
+    return db.execute(f'SELECT idx, short_description, description FROM term_list WHERE {db.TERM_KEY} = {db.term_key()}',
+                      (term,)).fetchone()
 
 def insert_term(term, short_desc, desc):
-    import sqlite3
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
-        cursor.execute('''INSERT INTO term_list (term, short_description, description) VALUES (?, ?, ?)''', (term, short_desc, desc))
-        conn.commit()
-        logger.info(f"'{term}' 항목이 새로 추가되었습니다.")
+    with db.transaction():
+        db.execute('''INSERT INTO term_list (term, short_description, description) VALUES (?, ?, ?)''', (term, short_desc, desc))
+    logger.info(f"'{term}' 항목이 새로 추가되었습니다.")
 
 def update_term(idx, term, short_desc, desc):
-    import sqlite3
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
-        cursor.execute('''UPDATE term_list SET short_description = ?, description = ? WHERE idx = ?''', (short_desc, desc, idx))
-        conn.commit()
-        logger.info(f"'{term}' 항목이 덮어쓰기(업데이트)되었습니다.")
+    with db.transaction():
+        db.execute('''UPDATE term_list SET short_description = ?, description = ? WHERE idx = ?''', (short_desc, desc, idx))
+    logger.info(f"'{term}' 항목이 덮어쓰기(업데이트)되었습니다.")
 
 def main():
     global global_skip, global_overwrite
@@ -86,5 +78,7 @@ def main():
         else:
             insert_term(term, short_desc, desc)
 
+    db.close()
+
 if __name__ == '__main__':
     main()
@@ -1,12 +1,16 @@
+import argparse
 import os
 from datetime import datetime
 from image_processor import ImageProcessor
 from database_manager import DatabaseManager
 from utils.instagram_post import InstagramAPI
 from utils.telegram_util import TelegramUtil
+from utils.telegram_notifier import TelegramNotifier
 from utils.ncafe_post import NaverCafeAPI
-from utils.api_util import ApiUtil, ApiError
+from utils.api_util import ApiUtil
+from utils.http_client import HttpClient
 from utils.logger_util import LoggerUtil
+from publish_outbox import PublishOutbox
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -14,6 +18,14 @@ load_dotenv()
 # 현재 스크립트의 절대 경로를 기준으로 기본 디렉토리 설정
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# 채널별 게시 제한 시간(초), 인스타그램은 이미지 URL 확인 재시도가 있어 길게 설정
+CHANNEL_TIMEOUTS = {
+    'board': 60,
+    'telegram': 60,
+    'naver_cafe': 60,
+    'instagram': 180
+}
+
 def get_image_url(file_path):
     """로컬 이미지 파일의 URL을 생성"""
     # 여기에 실제 이미지가 호스팅되는 베이스 URL을 입력해야 합니다
@@ -34,15 +46,75 @@ def get_unique_filename(output_path):
             return new_path
         index += 1
 
+def get_enabled_channels():
+    """PUBLISH_CHANNELS 환경 변수의 게시 채널 목록"""
+    return [name.strip() for name in os.getenv('PUBLISH_CHANNELS', 'board').split(',') if name.strip()]
+
+def get_channel_handlers(api_util, upload_images=None):
+    """아웃박스 작업을 게시하는 채널 함수 (job, image_paths) 반환
+
+    upload_images: 이미지 경로 -> 메모리에서 인코딩한 업로드용 이미지 (같은 실행에서만 사용, 재시도 때는 파일에서 압축)
+    """
+    upload_images = upload_images or {}
+    thumbnail_path = os.path.join(BASE_DIR, 'img', 'main.png')
+
+    def post_board(job, image_paths):
+        return api_util.create_post(
+            title=job.payload['title'],
+            content=job.payload['content'],
+            category="경제용어",
+            writer="admin",
+            image_paths=[upload_images.get(path, path) for path in image_paths],
+            thumbnail_image_path=thumbnail_path,
+            idempotency_key=job.idempotency_key
+        )
+
+    def post_telegram(job, image_paths):
+        return TelegramUtil().send_multiple_photo(image_paths, job.payload['caption'])
+
+    def post_naver_cafe(job, image_paths):
+        return NaverCafeAPI().write_cafe_post(os.getenv('NAVER_CAFE_MENU_ID'), job.payload['title'], job.payload['content'], image_paths)
+
+    def post_instagram(job, image_paths):
+        # 900px 카드는 인스타그램 최대 크기(1080px) 이하라 보관용 파일을 그대로 URL로 게시
+        return InstagramAPI().post_image([get_image_url(path) for path in image_paths], job.payload['caption'])
+
+    return {
+        'board': post_board,
+        'telegram': post_telegram,
+        'naver_cafe': post_naver_cafe,
+        'instagram': post_instagram
+    }
+
+def drain_outbox(outbox, handlers, notifier):
+    """활성화된 채널의 실행할 때가 된 아웃박스 작업 처리 (실패하면 텔레그램 알림)"""
+    logger = LoggerUtil().get_logger()
+    enabled = {name: handlers[name] for name in get_enabled_channels() if name in handlers}
+    results = outbox.drain(enabled, timeouts=CHANNEL_TIMEOUTS)
+    for job, result in results:
+        if result.success:
+            logger.info(f"{job.channel} 게시 완료 ({result.elapsed:.2f}초, {job.attempts}번째 시도)")
+            continue
+        if result.timed_out:
+            # 채널 함수가 백그라운드에서 계속 실행되어 게시되었을 수 있으므로 재시도하지 않음
+            notifier.notify_test(f"⚠️ {job.channel} 게시 시간 초과 ({job.attempts}번째 시도, 게시 여부 확인 필요)\n\n{result.error}")
+            logger.error(f"{job.channel} 게시 시간 초과 ({job.attempts}번째 시도): {result.error}")
+            continue
+        notifier.notify_test(f"❌ {job.channel} 게시 오류 발생 ({job.attempts}번째 시도)\n\n{result.error}")
+        logger.error(f"{job.channel} 게시 오류 ({job.attempts}번째 시도): {result.error}")
+    logger.info(f"아웃박스 상태: {outbox.get_counts()}")
+    return results
+
 def main():
     logger = LoggerUtil().get_logger()
     processor = ImageProcessor()
     db_manager = DatabaseManager(db_path=os.path.join(BASE_DIR, 'term.db'))
-    telegram = TelegramUtil()
+    notifier = TelegramNotifier()  # 오류 알림은 백그라운드에서 전송
     api_util = ApiUtil()
     term_list = db_manager.get_random_term()
     image_paths = []  # 생성된 이미지 경로를 저장할 리스트
-    term_updates = []  # DB 업데이트를 위한 정보를 저장할 리스트
+    upload_images = []  # API 전송용으로 메모리에서 인코딩된 이미지 리스트
+    term_updates = []  # DB 업데이트를 위한 (idx, 파일 경로) 리스트
     terms = []  # 용어 목록을 저장할 리스트
 
      # output 폴더 초기화 (절대 경로 사용)
@@ -58,7 +130,8 @@ def main():
                 os.remove(file_path)
                 logger.info(f"삭제됨: {file_path}")
 
-    # 이미지 생성
+    # 이미지 생성 정보 수집
+    items = []
     for no, data in enumerate(term_list):
         no = f"{no + 1:02}"
         idx = data[0]
@@ -75,54 +148,81 @@ def main():
         # 중복 파일명 처리
         output_path = get_unique_filename(base_output_path)
 
-        # 이미지 생성
-        processor.create_card(
-            no=no,
-            term=term,
-            short_description=short_description,
-            description=description,
-            output_path=output_path
-        )
-        
+        items.append({
+            'idx': idx,
+            'no': no,
+            'term': term,
+            'short_description': short_description,
+            'description': description,
+            'output_path': output_path
+        })
+
+    # 이미지 생성 (작업 프로세스에서 병렬 처리, API 업로드용 크기도 함께 인코딩)
+    results = processor.create_cards(items, sizes=['upload'])
+    for item, result in zip(items, results):
         # 생성된 이미지 경로와 DB 업데이트 정보 저장
-        image_paths.append(output_path)
-        term_updates.append((idx, output_path))
+        image_paths.append(result.output_path)
+        upload_images.append(result.variants.get('upload') or result.output_path)
+        term_updates.append((item['idx'], result.output_path))
 
-        logger.info(f"이미지 생성 완료: {output_path}")
+        logger.info(f"이미지 생성 완료: {result.output_path}")
 
-    # API 전송
+    # 채널별 게시 내용
     today = datetime.now().strftime('%Y-%m-%d')
+    title = f"{today} 오늘의 경제용어"
     
     # 모든 용어를 해시태그로 사용
     term_hashtags = ' '.join([f"<a href=\"#\">#{term}</a>" for term in terms])
-    
-    try:
-        logger.info("API 포스트 생성 시작")
-        api_util.create_post(
-            title=f"{today} 오늘의 경제용어",
-            content=f"""<strong><h3>{today} 우리 아이가 알아야 할 오늘의 경제용어</h3></strong><br>
+    content = f"""<strong><h3>{today} 우리 아이가 알아야 할 오늘의 경제용어</h3></strong><br>
             <p>
                 {term_hashtags} 
                 <a href="#">#경제교육</a> 
                 <a href="#">#아이와함께</a> 
                 <a href="#">#오늘의경제</a> 
                 <a href="#">#MQWAY</a> 
-            </p>""",
-            category="경제용어",
-            writer="admin",
-            image_paths=image_paths,
-            thumbnail_image_path=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'img', 'main.png')
-        )
-        logger.info("API 포스트 생성 완료")
-    except ApiError as e:
-        error_message = f"❌ API 오류 발생\n\n{e.message}"
-        telegram.send_test_message(error_message)
-        logger.error(f"API 포스트 생성 오류: {e.message}")
+            </p>"""
+    caption = f"{title}\n\n" + ' '.join([f"#{term.replace(' ', '')}" for term in terms]) + " #경제교육 #아이와함께 #오늘의경제 #MQWAY"
+
+    # 채널별 게시 작업을 아웃박스(term.db의 publish_outbox)에 등록하고 용어를 사용됨으로 표시
+    # (한 트랜잭션으로 커밋: 중간에 중단되면 작업 등록과 용어 표시가 모두 취소되어 다음 실행에서 다시 선택됨)
+    outbox = PublishOutbox(db_manager)
+    handlers = get_channel_handlers(api_util, upload_images=dict(zip(image_paths, upload_images)))
+    payload = {'title': title, 'content': content, 'caption': caption}
+    with db_manager.transaction():
+        for name in get_enabled_channels():
+            if name not in handlers:
+                logger.warning(f"알 수 없는 게시 채널: {name}")
+                continue
+            outbox.enqueue(name, payload, image_paths)
+        db_manager.mark_published(term_updates)
+    logger.info(f"DB 업데이트 완료: ID {', '.join(str(idx) for idx, _ in term_updates)}")
+
+    # 이번 작업과 재시도할 때가 된 이전 작업을 채널별로 동시에 게시 (실패한 작업은 아웃박스에 남아 나중에 재시도)
+    drain_outbox(outbox, handlers, notifier)
+    db_manager.close()
 
-    # DB 업데이트
-    for idx, output_path in term_updates:
-        db_manager.update_term_list(idx, output_path)
-        logger.info(f"DB 업데이트 완료: ID {idx}")
+    # 남은 텔레그램 알림 전송 (최대 flush_timeout초 대기)
+    notifier.flush()
+
+    # 외부 API 엔드포인트별 호출 메트릭
+    for endpoint, stats in HttpClient().get_stats()['endpoints'].items():
+        logger.info(f"HTTP {endpoint}: {stats['count']}번, 오류 {stats['errors']}번, "
+                    f"p50 {stats['p50_ms']:.0f}ms, p95 {stats['p95_ms']:.0f}ms, 최대 {stats['max_ms']:.0f}ms")
+
+def retry_outbox():
+    """렌더링 없이 아웃박스에서 재시도할 때가 된 게시 작업만 처리 (cron 등에서 주기적으로 실행)"""
+    notifier = TelegramNotifier()
+    db_manager = DatabaseManager(db_path=os.path.join(BASE_DIR, 'term.db'))
+    outbox = PublishOutbox(db_manager)
+    drain_outbox(outbox, get_channel_handlers(ApiUtil()), notifier)
+    db_manager.close()
+    notifier.flush()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='오늘의 경제용어 카드 생성 및 게시')
+    parser.add_argument('--retry-outbox', action='store_true', help='새 카드를 만들지 않고 아웃박스의 실패한 게시 작업만 재시도')
+    args = parser.parse_args()
+    if args.retry_outbox:
+        retry_outbox()
+    else:
+        main()
\ No newline at end of file
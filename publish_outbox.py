@@ -0,0 +1,266 @@
+import hashlib
+import json
+import os
+import random
+import time
+from collections import namedtuple
+from datetime import datetime
+from utils.card_store import CardStore
+from utils.logger_util import LoggerUtil
+from utils.publisher import Publisher, PublishResult
+
+# 게시 작업 한 건 (payload의 images에는 이미지 경로, 내용 해시, 확장자가 들어 있음)
+OutboxJob = namedtuple('OutboxJob', ['idx', 'idempotency_key', 'channel', 'payload', 'attempts'])
+
+class OutboxError(Exception):
+    """게시 작업을 실행할 수 없을 때 발생하는 예외 (재시도하지 않음)"""
+    pass
+
+class PublishOutbox:
+    """term.db의 publish_outbox 테이블에 채널별 게시 작업을 기록하고 재시도하며 처리하는 아웃박스
+
+    - 작업은 (채널, 게시 내용, 이미지 해시)로 만든 멱등성 키가 같으면 한 번만 등록된다.
+    - 이미지 바이트는 내용 해시를 키로 cache/outbox 저장소에 보관하므로,
+      output/ 폴더가 비워진 뒤에도 렌더링 없이 이미지를 복구해 다시 게시할 수 있다.
+    - 처리할 작업은 쓰기 트랜잭션 안에서 임대(lease_until)를 걸어 가져오므로
+      여러 프로세스가 동시에 처리해도 같은 작업을 두 번 실행하지 않는다.
+    - 실패한 작업은 base_delay부터 두 배씩 늘어나는 간격(최대 max_delay)으로 max_attempts번까지 재시도한다.
+    - 시간 초과된 작업은 채널 함수가 백그라운드에서 계속 실행되어 게시되었을 수 있으므로,
+      중복 게시하지 않도록 재시도하지 않고 unknown 상태로 남긴다. (게시 여부를 확인한 뒤 직접 정리)
+    """
+
+    PENDING = 'pending'
+    IN_PROGRESS = 'in_progress'
+    DONE = 'done'
+    FAILED = 'failed'
+    UNKNOWN = 'unknown'
+
+    def __init__(self, db_manager, store_dir=None, max_attempts=8, base_delay=60, max_delay=6 * 3600, lease_seconds=900):
+        """
+        Args:
+            db_manager (DatabaseManager): term.db 연결 (작업 상태는 이 연결의 트랜잭션 안에서 기록)
+            store_dir (str, optional): 게시할 이미지 보관 경로 (기본값: 루트 경로의 cache/outbox)
+            max_attempts (int): 작업 하나당 최대 시도 횟수
+            base_delay (float): 첫 재시도까지 대기 시간(초)
+            max_delay (float): 재시도 대기 시간 상한(초)
+            lease_seconds (float): 가져간 작업을 다른 작업자가 가져가지 못하는 시간(초), 가장 긴 채널 타임아웃보다 길어야 함
+        """
+        self.db = db_manager
+        store_dir = store_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'outbox')
+        self.store = CardStore(store_dir, max_bytes=200 * 1024 * 1024)
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.lease_seconds = lease_seconds
+        self.logger = LoggerUtil().get_logger()
+        self._create_table()
+
+    def _create_table(self):
+        with self.db.transaction():
+            self.db.execute('''
+            CREATE TABLE IF NOT EXISTS publish_outbox (
+                idx INTEGER PRIMARY KEY AUTOINCREMENT,
+                idempotency_key TEXT NOT NULL UNIQUE,
+                channel TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                state TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL DEFAULT 0,
+                lease_until REAL,
+                last_error TEXT,
+                result TEXT,
+                reg_date TEXT,
+                done_date TEXT
+            )
+            ''')
+            self.db.execute('''
+            CREATE INDEX IF NOT EXISTS idx_publish_outbox_due
+            ON publish_outbox (next_attempt_at) WHERE state IN ('pending', 'in_progress')
+            ''')
+
+    @staticmethod
+    def _hash_file(path):
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def enqueue(self, channel, payload, image_paths=()):
+        """게시 작업 등록 후 멱등성 키 반환 (같은 작업이 이미 있으면 새로 등록하지 않음)
+
+        Args:
+            channel (str): 게시 채널 이름 (board, telegram, naver_cafe, instagram)
+            payload (dict): 채널 함수에 넘길 게시 내용 (JSON으로 저장 가능해야 함)
+            image_paths (list): 게시할 이미지 경로 (내용은 저장소에 보관)
+        """
+        images = []
+        for path in image_paths:
+            with open(path, 'rb') as file:
+                data = file.read()
+            digest = hashlib.sha256(data).hexdigest()
+            extension = os.path.splitext(path)[1]
+            self.store.put_data(digest, data, extension)
+            images.append({'path': path, 'sha256': digest, 'extension': extension})
+
+        payload = {**payload, 'images': images}
+        key_source = json.dumps({'channel': channel, 'payload': payload}, sort_keys=True, ensure_ascii=False)
+        idempotency_key = hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+
+        with self.db.transaction():
+            cursor = self.db.execute('''
+            INSERT OR IGNORE INTO publish_outbox (idempotency_key, channel, payload, reg_date)
+            VALUES (?, ?, ?, ?)
+            ''', (idempotency_key, channel, json.dumps(payload, ensure_ascii=False),
+                  datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+        if cursor.rowcount:
+            self.logger.info(f"게시 작업 등록: {channel} ({idempotency_key[:12]})")
+        else:
+            self.logger.info(f"이미 등록된 게시 작업: {channel} ({idempotency_key[:12]})")
+        return idempotency_key
+
+    def claim_due(self, channels=None, now=None):
+        """실행할 때가 된 작업을 임대하고 OutboxJob 목록 반환
+
+        대기 중(pending)이면서 다음 시도 시각이 지난 작업과, 임대 시간이 지난(작업자가 중단된) 작업을 가져온다.
+        """
+        now = time.time() if now is None else now
+        due = '''
+            state IN ('pending', 'in_progress') AND next_attempt_at <= ?
+              AND (state = 'pending' OR lease_until < ?)
+        '''
+        # 조회와 임대를 한 쓰기 트랜잭션에서 처리 (다른 프로세스와 같은 작업을 가져가지 않도록)
+        with self.db.transaction(immediate=True):
+            # 최대 시도 횟수를 채운 채 임대 시간이 지난 작업(마지막 시도 중 작업자가 중단됨)은 다시 실행하지 않음
+            self.db.execute(f'''
+            UPDATE publish_outbox SET state = 'failed', lease_until = NULL,
+                last_error = COALESCE(last_error || ' / ', '') || '최대 시도 횟수에 도달한 채 임대 시간 초과'
+            WHERE {due} AND attempts >= ?
+            ''', (now, now, self.max_attempts))
+            rows = self.db.execute(f'''
+            SELECT idx, idempotency_key, channel, payload, attempts FROM publish_outbox
+            WHERE {due} AND attempts < ?
+            ORDER BY idx
+            ''', (now, now, self.max_attempts)).fetchall()
+            jobs = [OutboxJob(idx, key, channel, json.loads(payload), attempts)
+                    for idx, key, channel, payload, attempts in rows
+                    if channels is None or channel in channels]
+            self.db.executemany('''
+            UPDATE publish_outbox SET state = 'in_progress', lease_until = ?, attempts = attempts + 1 WHERE idx = ?
+            ''', [(now + self.lease_seconds, job.idx) for job in jobs])
+        return [job._replace(attempts=job.attempts + 1) for job in jobs]
+
+    def complete(self, job, result=None):
+        """작업 완료 기록"""
+        with self.db.transaction():
+            self.db.execute('''
+            UPDATE publish_outbox SET state = 'done', lease_until = NULL, last_error = NULL, result = ?, done_date = ?
+            WHERE idx = ?
+            ''', (json.dumps(result, ensure_ascii=False, default=str), datetime.now().strftime('%Y-%m-%d %H:%M:%S'), job.idx))
+
+    def fail(self, job, error, retry=True):
+        """작업 실패 기록 (재시도 횟수가 남았으면 다음 시도 시각을 정해 대기 상태로, 아니면 failed)
+
+        Returns:
+            float | None: 다음 시도 시각(epoch 초), 더 이상 재시도하지 않으면 None
+        """
+        if retry and job.attempts < self.max_attempts:
+            # 대기 시간은 base_delay * 2^(시도 횟수 - 1)의 절반~전체 사이에서 무작위 (최대 max_delay)
+            delay = min(self.max_delay, self.base_delay * 2 ** (job.attempts - 1))
+            next_attempt_at = time.time() + random.uniform(delay / 2, delay)
+            state = self.PENDING
+        else:
+            next_attempt_at = None
+            state = self.FAILED
+
+        with self.db.transaction():
+            self.db.execute('''
+            UPDATE publish_outbox SET state = ?, lease_until = NULL, last_error = ?, next_attempt_at = COALESCE(?, next_attempt_at)
+            WHERE idx = ?
+            ''', (state, str(error), next_attempt_at, job.idx))
+        return next_attempt_at
+
+    def mark_unknown(self, job, error):
+        """게시 여부를 알 수 없는 작업 기록 (재시도하지 않음)"""
+        with self.db.transaction():
+            self.db.execute('''
+            UPDATE publish_outbox SET state = 'unknown', lease_until = NULL, last_error = ? WHERE idx = ?
+            ''', (str(error), job.idx))
+
+    def prepare_images(self, job):
+        """작업의 이미지 경로 목록 반환
+
+        원래 경로의 파일이 없거나 내용이 바뀌었으면 저장소의 바이트를 같은 폴더에 해시를 붙인 이름으로 복구한다.
+        """
+        paths = []
+        for image in job.payload.get('images', []):
+            path = image['path']
+            if os.path.exists(path) and self._hash_file(path) == image['sha256']:
+                paths.append(path)
+                continue
+
+            data = self.store.get_data(image['sha256'], image['extension'])
+            if data is None:
+                raise OutboxError(f"보관된 이미지가 없어 복구할 수 없습니다: {path}")
+            base_name = os.path.splitext(path)[0]
+            restored_path = f"{base_name}_{image['sha256'][:8]}{image['extension']}"
+            os.makedirs(os.path.dirname(restored_path) or '.', exist_ok=True)
+            with open(restored_path, 'wb') as file:
+                file.write(data)
+            self.logger.info(f"보관된 이미지 복구: {restored_path}")
+            paths.append(restored_path)
+        return paths
+
+    def drain(self, handlers, timeouts=None, default_timeout=60):
+        """실행할 때가 된 작업을 채널 함수로 동시에 처리하고 (OutboxJob, PublishResult) 목록 반환
+
+        Args:
+            handlers (dict): 채널 이름 -> func(job, image_paths), 실패는 예외나 False/{'success': False}로 알림
+            timeouts (dict, optional): 채널 이름 -> 제한 시간(초)
+            default_timeout (float): timeouts에 없는 채널의 제한 시간(초)
+        """
+        timeouts = timeouts or {}
+        jobs = self.claim_due(channels=set(handlers))
+        if not jobs:
+            return []
+
+        publisher = Publisher(default_timeout=default_timeout)
+        runnable = []
+        results = {}
+        for job in jobs:
+            name = f"{job.channel}#{job.idx}"
+            try:
+                image_paths = self.prepare_images(job)
+            except OutboxError as e:
+                self.fail(job, e, retry=False)
+                self.logger.error(f"게시 작업 실패 (재시도 중단): {job.channel} - {e}")
+                results[job.idx] = PublishResult(name, False, 0.0, None, str(e))
+                continue
+            publisher.add_channel(name, handlers[job.channel], job, image_paths, timeout=timeouts.get(job.channel))
+            runnable.append(job)
+
+        # 결과는 한 트랜잭션으로 기록 (작업마다 커밋하지 않음)
+        publish_results = publisher.publish()
+        with self.db.transaction():
+            for job, result in zip(runnable, publish_results):
+                if result.success:
+                    self.complete(job, result.result)
+                    self.logger.info(f"게시 작업 완료: {job.channel} ({job.attempts}번째 시도)")
+                elif result.timed_out:
+                    self.mark_unknown(job, result.error)
+                    self.logger.error(f"게시 작업 시간 초과 (게시 여부 확인 필요, 재시도하지 않음): {job.channel} "
+                                      f"({job.idempotency_key[:12]}) - {result.error}")
+                else:
+                    next_attempt_at = self.fail(job, result.error)
+                    if next_attempt_at is None:
+                        self.logger.error(f"게시 작업 실패 ({job.attempts}번 시도, 재시도 중단): {job.channel} - {result.error}")
+                    else:
+                        retry_at = datetime.fromtimestamp(next_attempt_at).strftime('%Y-%m-%d %H:%M:%S')
+                        self.logger.warning(f"게시 작업 실패 ({job.attempts}번째 시도, {retry_at}에 재시도): {job.channel} - {result.error}")
+                results[job.idx] = result
+
+        return [(job, results[job.idx]) for job in jobs]
+
+    def get_counts(self):
+        """상태별 작업 수 반환"""
+        return dict(self.db.execute('SELECT state, COUNT(*) FROM publish_outbox GROUP BY state').fetchall())
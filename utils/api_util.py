@@ -1,8 +1,10 @@
 import requests
-from typing import List, Optional
+from typing import List, Optional, Union
 import os
-from PIL import Image
-import io
+from utils.card_store import CardStore
+from utils.http_client import HttpClient
+from utils.multipart_stream import MultipartStream
+from utils.image_encoder import ImageEncoder, EncodedImage
 from utils.logger_util import LoggerUtil
 
 class ApiError(Exception):
@@ -13,53 +15,58 @@ class ApiError(Exception):
         super().__init__(f"API Error (Status: {status_code}): {message}")
 
 class ApiUtil:
-    def __init__(self):
-        self.base_url = "http://localhost/api"
+    def __init__(self, upload_profile='png_optimized', base_url="http://localhost/api", connect_timeout=5, read_timeout=30):
+        self.base_url = base_url
         self.headers = {
             "Accept": "application/json"
         }
+        # 연결 타임아웃, 응답 대기 타임아웃 (초)
+        self.timeout = (connect_timeout, read_timeout)
+        # 호스트별 연결을 재사용하는 공용 HTTP 클라이언트
+        self.http = HttpClient()
         self.max_file_size = 1 * 1024 * 1024  # 1MB
         self.max_width = 800  # 최대 너비
+        # 압축 결과 저장소 (루트 경로의 cache/compressed)
+        cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'compressed')
+        self.image_encoder = ImageEncoder(max_width=self.max_width, max_file_size=self.max_file_size,
+                                          store=CardStore(cache_dir, max_bytes=50 * 1024 * 1024),
+                                          upload_profile=upload_profile)
         self.logger = LoggerUtil().get_logger()
 
+    def close(self):
+        """API 호스트의 연결 정리"""
+        self.http.close(self.base_url)
+
     def _compress_image(self, image_path: str):
         """이미지 압축"""
         try:
-            with Image.open(image_path) as img:
-                # 이미지 크기 조정
-                if img.width > self.max_width:
-                    ratio = self.max_width / img.width
-                    new_height = int(img.height * ratio)
-                    img = img.resize((self.max_width, new_height), Image.Resampling.LANCZOS)
-                
-                # 이미지 품질 조정
-                buffer = io.BytesIO()
-                format = img.format if img.format else 'PNG'
-                
-                if format == 'PNG':
-                    img.save(buffer, format=format, optimize=True)
-                else:
-                    img.save(buffer, format=format, quality=85, optimize=True)
-                
-                compressed_image = buffer.getvalue()
-                
-                # 압축 후에도 크기가 큰 경우 추가 압축
-                quality = 85
-                while len(compressed_image) > self.max_file_size and quality > 30:
-                    buffer = io.BytesIO()
-                    img.save(buffer, format='JPEG', quality=quality, optimize=True)
-                    compressed_image = buffer.getvalue()
-                    quality -= 10
-                
-                self.logger.info(f"이미지 압축 완료: {image_path} (크기: {len(compressed_image)/1024:.1f}KB)")
-                return compressed_image, format.lower()
+            # 같은 파일 내용과 설정의 압축 결과는 저장소에서 재사용 (정적 썸네일은 한 번만 압축)
+            encoded = self.image_encoder.encode_file(image_path)
+            self.logger.info(f"이미지 압축 완료: {image_path} (크기: {len(encoded.data)/1024:.1f}KB)")
+            return encoded.data, encoded.format
         except Exception as e:
             self.logger.error(f"이미지 압축 실패: {image_path} - {str(e)}")
             raise
 
-    def create_post(self, title: str, content: str, category: str, writer: str, image_paths: Optional[List[str]] = None, thumbnail_image_path: str = None):
-        """게시글 생성 API 호출"""
+    def _prepare_image(self, image: Union[str, EncodedImage]):
+        """업로드할 (파일명, 바이트, 형식) 반환 (이미 인코딩된 이미지는 그대로 사용)"""
+        if isinstance(image, EncodedImage):
+            return image
+        compressed_image, format = self._compress_image(image)
+        return EncodedImage(os.path.basename(image), compressed_image, format)
+
+    def create_post(self, title: str, content: str, category: str, writer: str, image_paths: Optional[List[Union[str, EncodedImage]]] = None, thumbnail_image_path: Union[str, EncodedImage, None] = None, idempotency_key: Optional[str] = None):
+        """게시글 생성 API 호출
+
+        image_paths와 thumbnail_image_path에는 이미지 경로 대신 ImageProcessor가 메모리에서 인코딩한
+        EncodedImage(예: CardResult.variants['upload'])를 넣을 수 있으며,
+        이 경우 파일을 다시 열어 압축하지 않고 그대로 전송한다.
+        idempotency_key를 넘기면 Idempotency-Key 헤더로 보내 서버가 같은 게시글의 재전송을 구분할 수 있게 한다.
+        """
         url = f"{self.base_url}/board-content"
+        headers = dict(self.headers)
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
         
         try:
             if image_paths:
@@ -67,11 +74,10 @@ class ApiUtil:
                 # 이미지와 함께 게시글 등록
                 files = {}
                 for i, image_path in enumerate(image_paths):
-                    if os.path.exists(image_path):
+                    if isinstance(image_path, EncodedImage) or os.path.exists(image_path):
                         try:
-                            compressed_image, format = self._compress_image(image_path)
                             # 원본 파일명 사용
-                            original_filename = os.path.basename(image_path)
+                            original_filename, compressed_image, format = self._prepare_image(image_path)
                             # 각 이미지를 배열로 전송
                             files[f'image[{i}]'] = (original_filename, compressed_image, f'image/{format}')
                             self.logger.debug(f"이미지 {i+1} 추가: {original_filename}")
@@ -95,8 +101,12 @@ class ApiUtil:
                 thumbnail_image = {}
                 if thumbnail_image_path:
                     try:
-                        compressed_image, format = self._compress_image(thumbnail_image_path)
-                        thumbnail_image['thumbnail_image'] = (thumbnail_image_path, compressed_image, f'image/{format}')
+                        if isinstance(thumbnail_image_path, EncodedImage):
+                            filename, compressed_image, format = thumbnail_image_path
+                        else:
+                            filename = thumbnail_image_path
+                            compressed_image, format = self._compress_image(thumbnail_image_path)
+                        thumbnail_image['thumbnail_image'] = (filename, compressed_image, f'image/{format}')
                         self.logger.debug(f"썸네일 이미지 추가: {thumbnail_image_path}")
                     except Exception as e:
                         self.logger.error(f"썸네일 이미지 처리 실패: {thumbnail_image_path} - {str(e)}")
@@ -106,27 +116,21 @@ class ApiUtil:
                     self.logger.debug(f"API 요청 데이터: {data}")
                     self.logger.debug(f"파일 데이터: {[f'{k}: {v[0]}' for k, v in files.items()]}")
                     
-                    # multipart/form-data로 전송 시에는 Content-Type 헤더를 제거 (requests가 자동으로 설정)
-                    headers = self.headers.copy()
-                    
-                    # form-data 형식으로 전송
-                    form_data = {}
+                    # form-data 본문은 한 번에 만들지 않고 필드와 이미지 바이트를 조각 단위로 전송 (Content-Length 포함)
+                    body = MultipartStream()
                     for key, value in data.items():
                         # Laravel 필드명에 맞게 수정
-                        form_data[key] = (None, str(value))
+                        body.add_field(key, value)
                     
                     # 이미지 파일 추가
-                    form_data.update(files)
-                    form_data.update(thumbnail_image)
-                    
-                    # 디버그 로그 추가
-                    self.logger.debug(f"최종 전송 데이터: {[(k, v[0] if isinstance(v, tuple) else v) for k, v in form_data.items()]}")
+                    for key, (filename, image_data, content_type) in {**files, **thumbnail_image}.items():
+                        body.add_file(key, filename, data=image_data, content_type=content_type)
                     
-                    response = requests.post(
+                    response = self.http.post(
                         url, 
-                        headers=headers,
-                        files=form_data,
-                        timeout=30
+                        headers={**headers, "Content-Type": body.content_type},
+                        data=body,
+                        timeout=self.timeout
                     )
                     
                     # 응답 상태 코드 로깅
@@ -142,7 +146,7 @@ class ApiUtil:
                     "category": category,
                     "writer": writer
                 }
-                response = requests.post(url, headers=self.headers, json=payload)
+                response = self.http.post(url, headers=headers, json=payload, timeout=self.timeout)
 
             # 응답 확인 및 한글 디코딩
             try:
@@ -0,0 +1,162 @@
+import os
+import shutil
+import tempfile
+from utils.logger_util import LoggerUtil
+
+class CardStore:
+    """카드 입력 해시를 키로 완성된 이미지 파일을 보관하는 저장소
+
+    같은 입력으로 만든 카드가 이미 있으면 렌더링 대신 하드 링크(안 되면 복사)로 재사용한다.
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 파일부터 max_bytes * LOW_WATER_RATIO 이하가 될 때까지
+    삭제한다(수정 시각 기준 LRU). 전체 크기는 처음 저장할 때 한 번 세고 이후에는 저장/삭제할 때마다 더하고 빼므로,
+    저장소 전체를 훑는 것은 max_bytes를 넘었을 때뿐이다. (다른 프로세스가 저장한 파일은 그때 다시 센다)
+    링크로 꺼낸 파일은 저장소와 내용을 공유하므로 제자리에서 수정하지 않아야 한다.
+    """
+
+    # 정리할 때 줄이는 목표 크기 비율 (정리 직후의 저장마다 다시 정리하지 않도록 여유를 둠)
+    LOW_WATER_RATIO = 0.8
+
+    def __init__(self, store_dir, max_bytes=500 * 1024 * 1024):
+        self.store_dir = store_dir
+        self.max_bytes = max_bytes
+        self._total_bytes = None  # 저장소 전체 크기 (처음 저장할 때 셈)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.logger = LoggerUtil().get_logger()
+
+    def _path(self, key, extension):
+        return os.path.join(self.store_dir, key[:2], f"{key}{extension}")
+
+    def _link_or_copy(self, source, target):
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
+    def get(self, key, output_path):
+        """저장된 카드가 있으면 output_path로 꺼내고 True 반환"""
+        stored_path = self._path(key, os.path.splitext(output_path)[1])
+        if not os.path.exists(stored_path):
+            self.misses += 1
+            return False
+
+        try:
+            self._link_or_copy(stored_path, output_path)
+            # 최근 사용 시각 갱신 (LRU 삭제 순서 기준)
+            os.utime(stored_path)
+        except OSError as e:
+            self.logger.warning(f"저장된 카드를 가져오지 못했습니다: {stored_path} - {e}")
+            self.misses += 1
+            return False
+
+        self.hits += 1
+        return True
+
+    def put(self, key, source_path):
+        """생성된 카드를 저장소에 복사 (임시 파일에 쓴 뒤 교체)"""
+        stored_path = self._path(key, os.path.splitext(source_path)[1])
+        if os.path.exists(stored_path):
+            return stored_path
+
+        try:
+            os.makedirs(os.path.dirname(stored_path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(stored_path), suffix='.tmp')
+            os.close(fd)
+            shutil.copyfile(source_path, temp_path)
+            os.replace(temp_path, stored_path)
+            size = os.path.getsize(stored_path)
+        except OSError as e:
+            self.logger.warning(f"카드 저장소에 저장하지 못했습니다: {source_path} - {e}")
+            return None
+
+        self._add_bytes(size)
+        return stored_path
+
+    def get_data(self, key, extension):
+        """저장된 바이트가 있으면 반환, 없으면 None"""
+        stored_path = self._path(key, extension)
+        try:
+            with open(stored_path, 'rb') as file:
+                data = file.read()
+            os.utime(stored_path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except OSError as e:
+            self.logger.warning(f"저장된 데이터를 읽지 못했습니다: {stored_path} - {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+    def put_data(self, key, data, extension):
+        """메모리의 바이트를 저장소에 저장 (임시 파일에 쓴 뒤 교체)"""
+        stored_path = self._path(key, extension)
+        if os.path.exists(stored_path):
+            return stored_path
+
+        try:
+            os.makedirs(os.path.dirname(stored_path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(stored_path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as file:
+                file.write(data)
+            os.replace(temp_path, stored_path)
+        except OSError as e:
+            self.logger.warning(f"카드 저장소에 저장하지 못했습니다: {stored_path} - {e}")
+            return None
+
+        self._add_bytes(len(data))
+        return stored_path
+
+    def _scan(self):
+        """저장소의 (수정 시각, 크기, 경로) 목록과 전체 크기"""
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.store_dir):
+            for name in files:
+                if name.endswith('.tmp'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+                total += stat.st_size
+        return entries, total
+
+    def _add_bytes(self, size):
+        """저장한 크기를 전체 크기에 더하고, max_bytes를 넘으면 정리"""
+        if self._total_bytes is None:
+            # 처음 저장할 때 한 번만 저장소 전체 크기를 셈 (방금 저장한 파일 포함)
+            _, self._total_bytes = self._scan()
+        else:
+            self._total_bytes += size
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _evict(self):
+        """전체 크기가 max_bytes * LOW_WATER_RATIO 이하가 될 때까지 오래된 파일부터 삭제"""
+        entries, total = self._scan()
+        target = self.max_bytes * self.LOW_WATER_RATIO
+        if total > self.max_bytes:
+            for _, size, path in sorted(entries):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                self.evictions += 1
+                if total <= target:
+                    break
+        self._total_bytes = total
+
+    def get_stats(self):
+        """적중/실패/삭제 횟수 반환"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,82 @@
+import threading
+from collections import OrderedDict
+from PIL import ImageFont
+from utils.logger_util import LoggerUtil
+
+class FontCache:
+    """(폰트 경로, 크기) 단위로 FreeTypeFont 객체를 공유하는 프로세스 전역 캐시"""
+    _instance = None
+    _initialized = False
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(FontCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self, max_entries=256):
+        if not FontCache._initialized:
+            self.max_entries = max_entries
+            self.logger = LoggerUtil().get_logger()
+            self._fonts = OrderedDict()
+            self._lock = threading.Lock()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            FontCache._initialized = True
+
+    def get_font(self, font_path, size):
+        """캐시된 폰트 반환 (없으면 로드 후 저장)"""
+        key = (font_path, size)
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self._fonts.move_to_end(key)
+                self.hits += 1
+                return font
+            self.misses += 1
+
+        # 폰트 파싱은 락 밖에서 수행 (다른 스레드의 캐시 조회를 막지 않도록)
+        font = ImageFont.truetype(font_path, size)
+
+        with self._lock:
+            self._fonts[key] = font
+            self._fonts.move_to_end(key)
+            # 최대 개수를 넘으면 가장 오래 사용되지 않은 폰트부터 제거
+            while len(self._fonts) > self.max_entries:
+                self._fonts.popitem(last=False)
+                self.evictions += 1
+        return font
+
+    def preload(self, font_path, sizes):
+        """레이아웃에서 사용하는 크기의 폰트를 미리 로드"""
+        for size in sizes:
+            self.get_font(font_path, size)
+
+    def set_max_entries(self, max_entries):
+        """캐시 최대 개수 변경 (초과분은 즉시 제거)"""
+        with self._lock:
+            self.max_entries = max_entries
+            while len(self._fonts) > self.max_entries:
+                self._fonts.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """캐시 및 통계 초기화"""
+        with self._lock:
+            self._fonts.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self):
+        """캐시 적중/실패 통계 반환"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._fonts),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0
+            }
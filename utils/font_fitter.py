@@ -0,0 +1,109 @@
+import threading
+
+class FontFitter:
+    """후보 폰트 크기 중 텍스트가 영역에 들어가는 가장 큰 크기를 찾는 탐색기
+
+    후보 크기는 큰 값부터 내림차순으로 주어진다. bisect 방식은 크기가 작을수록 줄바꿈한 텍스트의
+    너비와 높이도 줄어든다(어떤 크기가 들어가면 그보다 작은 크기도 들어간다)고 가정하고 이분 탐색한다.
+    이 가정은 구성상 보장되지 않는다. 한 줄보다 긴 단어를 음절 단위로 나누거나 글자 너비를
+    반올림하면 드물게 깨질 수 있고, 그때는 큰 크기부터 하나씩 줄여가는 선형 탐색(linear)과 결과가 다르다.
+    benchmarks/font_fit.py가 term.db와 긴 텍스트에서 두 방식의 결과가 같은지 확인한다.
+    """
+
+    def __init__(self, strategy='bisect'):
+        if strategy not in ('bisect', 'linear'):
+            raise ValueError(f"지원하지 않는 탐색 방식입니다: {strategy}")
+        self.strategy = strategy
+        self._hints = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """탐색 통계 초기화"""
+        self.searches = 0
+        self.iterations = 0
+        self.measurements = 0
+        self.hint_uses = 0
+        self.max_measurements = 0
+
+    def get_stats(self):
+        """탐색 통계 반환
+
+        iterations는 탐색 단계 수, measurements는 fit으로 실제 너비/높이를 측정한 횟수다.
+        """
+        return {
+            "strategy": self.strategy,
+            "searches": self.searches,
+            "iterations": self.iterations,
+            "measurements": self.measurements,
+            "hint_uses": self.hint_uses,
+            "max_measurements": self.max_measurements,
+            "measurements_per_search": self.measurements / self.searches if self.searches else 0.0
+        }
+
+    def find(self, sizes, fit, hint_key=None):
+        """텍스트가 들어가는 가장 큰 크기의 결과 반환
+
+        Args:
+            sizes (list): 내림차순 후보 크기 목록
+            fit (callable): 크기를 받아 들어가면 결과, 안 들어가면 None을 반환하는 함수
+            hint_key (hashable, optional): 비슷한 텍스트끼리 공유하는 시작점 키
+
+        Returns:
+            tuple: (크기, fit 결과) 또는 들어가는 크기가 없으면 (None, None)
+        """
+        with self._lock:
+            self.searches += 1
+        if not sizes:
+            return None, None
+
+        results = {}
+
+        def probe(index):
+            if index not in results:
+                with self._lock:
+                    self.measurements += 1
+                    self.max_measurements = max(self.max_measurements, len(results) + 1)
+                results[index] = fit(sizes[index])
+            return results[index]
+
+        if self.strategy == 'linear':
+            for index in range(len(sizes)):
+                with self._lock:
+                    self.iterations += 1
+                if probe(index) is not None:
+                    return sizes[index], results[index]
+            return None, None
+
+        with self._lock:
+            hint = self._hints.get(hint_key) if hint_key is not None else None
+
+        with self._lock:
+            self.iterations += 1
+        # 가장 큰 크기가 들어가면 그대로 답, 가장 작은 크기도 안 들어가면 들어가는 크기가 없음
+        if probe(0) is not None:
+            hi = 0
+        else:
+            last = len(sizes) - 1
+            if last == 0 or probe(last) is None:
+                return None, None
+
+            # lo(안 들어감)와 hi(들어감) 사이를 이분 탐색, 직전 결과(힌트)가 사이에 있으면 먼저 확인
+            lo, hi = 0, last
+            mid = sizes.index(hint) if hint in sizes[lo + 1:hi] else (lo + hi) // 2
+            if mid != (lo + hi) // 2:
+                with self._lock:
+                    self.hint_uses += 1
+            while hi - lo > 1:
+                with self._lock:
+                    self.iterations += 1
+                if probe(mid) is not None:
+                    hi = mid
+                else:
+                    lo = mid
+                mid = (lo + hi) // 2
+
+        if hint_key is not None:
+            with self._lock:
+                self._hints[hint_key] = sizes[hi]
+        return sizes[hi], results[hi]
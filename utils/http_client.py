@@ -0,0 +1,276 @@
+import random
+import re
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from utils.logger_util import LoggerUtil
+
+class CircuitOpenError(requests.ConnectionError):
+    """호스트의 서킷이 열려 있어 요청을 보내지 않았을 때 발생하는 예외
+
+    requests.ConnectionError를 상속하므로 기존의 requests.RequestException 처리에서 함께 잡힌다.
+    """
+    pass
+
+class CircuitBreaker:
+    """호스트 하나의 서킷 브레이커
+
+    연속 실패(연결 오류, 타임아웃, 5xx)가 failure_threshold번이면 열려서 reset_timeout초 동안 요청을 막고,
+    그 뒤 시험 요청 하나만 보내 성공하면 닫고 실패하면 다시 연다.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """요청을 보내도 되면 True (열린 뒤 reset_timeout이 지났으면 시험 요청 하나만 허용)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_abort(self):
+        """요청이 응답이나 연결 오류 없이 중단되었을 때 (시험 요청이었으면 반열림 상태에 머물지 않도록 다시 연다)"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def record_failure(self):
+        """실패 기록 (서킷이 새로 열렸으면 True)"""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.failures >= self.failure_threshold):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+class EndpointStats:
+    """엔드포인트 하나의 호출 횟수, 오류 수, 지연 시간(최근 max_samples개) 기록"""
+
+    def __init__(self, max_samples=500):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=max_samples)
+
+    def record(self, elapsed, error):
+        self.count += 1
+        self.errors += bool(error)
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self.samples.append(elapsed)
+
+    def summary(self):
+        samples = sorted(self.samples)
+
+        def percentile(percent):
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(len(samples) * percent / 100))] * 1000
+
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'error_rate': self.errors / self.count if self.count else 0.0,
+            'avg_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'p50_ms': percentile(50),
+            'p95_ms': percentile(95),
+            'max_ms': self.max * 1000
+        }
+
+class HttpClient:
+    """모든 외부 연동(utils/)이 함께 쓰는 프로세스 전역 HTTP 클라이언트
+
+    - 호스트별 세션(연결 풀)을 재사용한다.
+    - 멱등 요청(GET, HEAD 등)은 연결 오류, 타임아웃, 429/5xx 응답이면 지수 백오프(지터 적용)로 재시도한다.
+      POST는 idempotent=True를 넘긴 경우에만 재시도한다.
+    - 호스트별 서킷 브레이커가 연속 실패하는 호스트로의 요청을 잠시 막는다.
+    - 엔드포인트별 호출 수, 오류율, 지연 시간을 기록한다. (get_stats)
+    """
+    _instance = None
+    _initialized = False
+
+    IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    # 경로에서 ID나 토큰으로 보이는 부분 (엔드포인트 이름에서 {id}로 치환)
+    ID_SEGMENT = re.compile(r'^(\d+|[^/]*:[^/]*)$')
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(HttpClient, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self, timeout=(5, 30), max_retries=3, base_delay=0.5, max_delay=8,
+                 failure_threshold=5, reset_timeout=30, pool_maxsize=10):
+        if not HttpClient._initialized:
+            self.timeout = timeout  # 요청별 (연결, 응답 대기) 기본 타임아웃(초)
+            self.max_retries = max_retries  # 멱등 요청의 최대 재시도 횟수
+            self.base_delay = base_delay
+            self.max_delay = max_delay
+            self.failure_threshold = failure_threshold
+            self.reset_timeout = reset_timeout
+            self.pool_maxsize = pool_maxsize
+            self.logger = LoggerUtil().get_logger()
+            self._sessions = {}
+            self._breakers = {}
+            self._stats = {}
+            self._lock = threading.Lock()
+            HttpClient._initialized = True
+
+    @staticmethod
+    def _get_host(url):
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def get_endpoint(self, method, url):
+        """메트릭용 엔드포인트 이름 (숫자 ID와 토큰 경로는 {id}로 치환, 쿼리 제외)"""
+        parts = urlsplit(url)
+        path = '/'.join('{id}' if self.ID_SEGMENT.match(segment) else segment for segment in parts.path.split('/'))
+        return f"{method} {parts.netloc}{path}"
+
+    def get_session(self, url):
+        """호스트별 세션 반환 (없으면 생성)"""
+        host = self._get_host(url)
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                session.mount(f"{urlsplit(url).scheme}://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def get_breaker(self, url):
+        host = self._get_host(url)
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return breaker
+
+    def _record(self, endpoint, elapsed, error):
+        with self._lock:
+            stats = self._stats.get(endpoint)
+            if stats is None:
+                stats = self._stats[endpoint] = EndpointStats()
+            stats.record(elapsed, error)
+
+    def _get_retry_delay(self, attempt, response=None):
+        """재시도 대기 시간: Retry-After 헤더가 있으면 그 값, 없으면 base_delay * 2^attempt 안에서 무작위 (최대 max_delay)"""
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(self.max_delay, int(retry_after))
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def request(self, method, url, endpoint=None, retries=None, idempotent=None, timeout=None, **kwargs):
+        """HTTP 요청 (requests.request와 같은 인자, 응답 상태 코드로 예외를 발생시키지 않음)
+
+        Args:
+            endpoint (str, optional): 메트릭에 기록할 이름 (기본값: get_endpoint(method, url))
+            retries (int, optional): 재시도 횟수 (기본값: 멱등 요청이면 max_retries, 아니면 0)
+            idempotent (bool, optional): 재시도해도 안전한 요청인지 (기본값: 메서드로 판단)
+            timeout (tuple, optional): (연결, 응답 대기) 타임아웃 (기본값: self.timeout)
+
+        Raises:
+            CircuitOpenError: 호스트의 서킷이 열려 있을 때
+            requests.RequestException: 재시도 후에도 연결 오류나 타임아웃일 때
+        """
+        method = method.upper()
+        endpoint = endpoint or self.get_endpoint(method, url)
+        if idempotent is None:
+            idempotent = method in self.IDEMPOTENT_METHODS
+        if retries is None:
+            retries = self.max_retries if idempotent else 0
+        session = self.get_session(url)
+        breaker = self.get_breaker(url)
+
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                self._record(endpoint, 0.0, True)
+                raise CircuitOpenError(f"서킷이 열려 있어 요청하지 않습니다: {self._get_host(url)}")
+
+            start = time.perf_counter()
+            response = None
+            try:
+                response = session.request(method, url, timeout=timeout or self.timeout, **kwargs)
+                error = None
+            except requests.RequestException as e:
+                error = e
+            except BaseException:
+                # 잘못된 인자나 KeyboardInterrupt 등: 호스트 장애는 아니지만 시험 요청 결과는 남겨야 함
+                self._record(endpoint, time.perf_counter() - start, True)
+                breaker.record_abort()
+                raise
+            elapsed = time.perf_counter() - start
+
+            # 429는 호스트 장애가 아니므로 서킷 브레이커에는 실패로 기록하지 않음
+            failed = error is not None or response.status_code >= 500
+            self._record(endpoint, elapsed, failed or response.status_code >= 400)
+            if failed:
+                if breaker.record_failure():
+                    self.logger.warning(f"서킷 열림: {self._get_host(url)} ({self.reset_timeout}초 동안 요청 차단)")
+            else:
+                breaker.record_success()
+
+            retryable = error is not None or response.status_code in self.RETRY_STATUSES
+            if not retryable or attempt >= retries:
+                if error is not None:
+                    raise error
+                return response
+
+            delay = self._get_retry_delay(attempt, response)
+            reason = error or f"HTTP {response.status_code}"
+            self.logger.warning(f"{endpoint} 재시도 {attempt + 1}/{retries} ({delay:.2f}초 후): {reason}")
+            if response is not None:
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def get_stats(self):
+        """엔드포인트별 메트릭과 호스트별 서킷 상태 반환"""
+        with self._lock:
+            return {
+                'endpoints': {endpoint: stats.summary() for endpoint, stats in self._stats.items()},
+                'circuits': {host: breaker.state for host, breaker in self._breakers.items()}
+            }
+
+    def close(self, url=None):
+        """세션의 연결 정리 (url을 넘기면 그 호스트만)"""
+        with self._lock:
+            hosts = [self._get_host(url)] if url else list(self._sessions)
+            for host in hosts:
+                session = self._sessions.pop(host, None)
+                if session is not None:
+                    session.close()
@@ -0,0 +1,299 @@
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import namedtuple
+from PIL import Image
+
+# 업로드할 수 있게 인코딩된 이미지 (파일명, 바이트, 형식 'png'/'jpeg' 등)
+EncodedImage = namedtuple('EncodedImage', ['filename', 'data', 'format'])
+
+class ImageEncoder:
+    """메모리의 이미지를 보관용 PNG와 업로드용 변형으로 인코딩
+
+    렌더링한 이미지를 파일로 저장한 뒤 다시 열어 디코딩하지 않도록, 한 번의 인코딩 단계에서
+    보관용 PNG 바이트와 업로드용(최대 너비로 축소, 용량 제한) 바이트를 함께 만든다.
+    """
+
+    # 용량 예산의 이 비율 이상을 채운 JPEG를 찾으면 품질 탐색을 멈춘다
+    FIT_TOLERANCE = 0.9
+
+    # 출력 프로필: 저장 형식, 확장자, 저장 옵션 (palette는 적응형 팔레트 색상 수)
+    # 카드는 몇 가지 단색과 글자 외곽선의 중간색뿐이라 팔레트 PNG와 무손실 WebP가 기본 PNG보다 훨씬 작다
+    PROFILES = {
+        'png': {'format': 'PNG', 'extension': '.png', 'params': {}},
+        'png_optimized': {'format': 'PNG', 'extension': '.png', 'params': {'optimize': True}},
+        'png_palette': {'format': 'PNG', 'extension': '.png', 'palette': 256, 'params': {'optimize': True}},
+        'webp_lossless': {'format': 'WEBP', 'extension': '.webp', 'params': {'lossless': True, 'method': 4}},
+        'webp': {'format': 'WEBP', 'extension': '.webp', 'params': {'quality': 90, 'method': 4}},
+    }
+
+    # 이름별 출력 크기: 최대 너비, 프로필(None이면 upload_profile), 파일명 접미사
+    # 원본보다 큰 크기로는 확대하지 않는다. 인스타그램은 900px 카드 파일을 그대로 URL로 게시하고,
+    # 게시판 썸네일은 고정 이미지(img/main.png)라 카드에서 만드는 크기는 API 업로드용뿐이다.
+    SIZES = {
+        'upload': {'max_width': 800, 'profile': None, 'suffix': ''},
+    }
+
+    FORMAT_EXTENSIONS = {'png': '.png', 'jpeg': '.jpg', 'webp': '.webp'}
+
+    def __init__(self, max_width=800, max_file_size=1 * 1024 * 1024, min_quality=30, max_quality=85, store=None,
+                 archive_profile='png', upload_profile='png_optimized'):
+        for profile in (archive_profile, upload_profile):
+            if profile not in self.PROFILES:
+                raise ValueError(f"알 수 없는 출력 프로필: {profile} (사용 가능: {', '.join(self.PROFILES)})")
+        self.archive_profile = archive_profile  # 보관용 파일 프로필
+        self.upload_profile = upload_profile  # 업로드용 변형 프로필
+        self.max_width = max_width  # 업로드용 최대 너비
+        self.sizes = {name: dict(size) for name, size in self.SIZES.items()}
+        self.sizes['upload'].update(max_width=max_width, profile=upload_profile)
+        self.max_file_size = max_file_size  # 업로드용 최대 용량
+        self.min_quality = min_quality  # 용량을 맞출 때 허용하는 최저 JPEG 품질
+        self.max_quality = max_quality
+        # 파일 압축 결과를 (파일 해시, 설정) 키로 보관할 CardStore (None이면 메모리에만 보관)
+        self.store = store
+        self.encodes = 0
+        self.memo_hits = 0
+        self.store_hits = 0
+        self._memo = {}
+        self._file_hashes = {}
+        self._lock = threading.Lock()
+
+    def get_config(self):
+        """같은 설정의 ImageEncoder를 다시 만들 수 있는 기본 자료형 설정 (작업 프로세스로 넘길 때 사용)
+
+        잠금, 압축 결과 메모, 저장소 객체는 프로세스마다 새로 만들어야 하므로 포함하지 않는다.
+        """
+        return {
+            'max_width': self.max_width,
+            'max_file_size': self.max_file_size,
+            'min_quality': self.min_quality,
+            'max_quality': self.max_quality,
+            'archive_profile': self.archive_profile,
+            'upload_profile': self.upload_profile,
+            'sizes': {name: dict(size) for name, size in self.sizes.items()}
+        }
+
+    @classmethod
+    def from_config(cls, config, store=None):
+        """get_config()의 설정으로 ImageEncoder 생성"""
+        config = dict(config)
+        sizes = config.pop('sizes')
+        encoder = cls(store=store, **config)
+        encoder.sizes = {name: dict(size) for name, size in sizes.items()}
+        return encoder
+
+    def get_signature(self, name='upload'):
+        """이름별 출력 크기의 결과에 영향을 주는 설정 (기본값: 업로드용 변형)"""
+        size = self.sizes[name]
+        return {
+            'name': name,
+            'profile': size['profile'],
+            'max_width': size['max_width'],
+            'suffix': size['suffix'],
+            'max_file_size': self.max_file_size,
+            'min_quality': self.min_quality,
+            'max_quality': self.max_quality
+        }
+
+    def _save(self, img, image_format, **params):
+        """인코딩 1회 (횟수 집계)"""
+        buffer = io.BytesIO()
+        img.save(buffer, format=image_format, **params)
+        self.encodes += 1
+        return buffer.getvalue()
+
+    def _fit_jpeg(self, img, high_data=None):
+        """용량 예산 안에 드는 높은 JPEG 품질로 적은 횟수만 인코딩
+
+        최고 품질의 용량으로 예산에 맞는 품질을 예측해 구간을 잡은 뒤, 품질에 따른 용량이 구간 안에서
+        선형이라고 보고 보간으로 좁힌다. 예측이 구간을 절반 이상 줄이지 못하면 다음 번에는 이분 탐색을 쓰고,
+        예산의 FIT_TOLERANCE 이상을 채운 결과를 찾으면 멈춘다.
+        최저 품질로도 예산을 넘으면 최저 품질 결과를 반환한다.
+        high_data는 이미 최고 품질로 인코딩한 JPEG 바이트가 있으면 재사용한다.
+        """
+        img = img.convert('RGB')
+        budget = self.max_file_size
+
+        def encode(quality):
+            return self._save(img, 'JPEG', quality=quality, optimize=True)
+
+        high_quality = self.max_quality
+        data = high_data or encode(high_quality)
+        if len(data) <= budget:
+            return data
+        high_size = len(data)
+
+        # 용량이 품질에 비례한다고 보고 첫 예측
+        quality = max(self.min_quality, min(high_quality - 1, int(high_quality * budget / high_size)))
+        data = encode(quality)
+        if len(data) <= budget:
+            low_quality, low_size, best = quality, len(data), data
+        else:
+            high_quality, high_size = quality, len(data)
+            if quality == self.min_quality:
+                return data
+            low_quality = self.min_quality
+            best = encode(low_quality)
+            if len(best) > budget:
+                return best
+            low_size = len(best)
+
+        interpolate = True
+        while high_quality - low_quality > 1 and low_size < budget * self.FIT_TOLERANCE:
+            span = high_quality - low_quality
+            if interpolate and high_size > low_size:
+                quality = low_quality + int((budget - low_size) * span / (high_size - low_size))
+            else:
+                quality = low_quality + span // 2
+            quality = min(max(quality, low_quality + 1), high_quality - 1)
+
+            data = encode(quality)
+            if len(data) <= budget:
+                low_quality, low_size, best = quality, len(data), data
+            else:
+                high_quality, high_size = quality, len(data)
+            interpolate = (high_quality - low_quality) * 2 <= span
+        return best
+
+    def encode_profile(self, img, profile):
+        """출력 프로필로 인코딩한 바이트"""
+        settings = self.PROFILES[profile]
+        if settings.get('palette'):
+            img = img.convert('RGB').quantize(settings['palette'], method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+        return self._save(img, settings['format'], **settings['params'])
+
+    def get_extension(self, profile=None):
+        """프로필의 파일 확장자 (기본값: 보관용 프로필)"""
+        return self.PROFILES[profile or self.archive_profile]['extension']
+
+    def encode_archive(self, img):
+        """보관용 프로필로 인코딩한 바이트 (기본 'png'는 img.save(path)와 같은 설정)"""
+        return self.encode_profile(img, self.archive_profile)
+
+    def _resize(self, img, max_width):
+        """최대 너비보다 넓으면 비율을 유지해 축소 (확대하지 않음)"""
+        if img.width <= max_width:
+            return img
+        ratio = max_width / img.width
+        new_height = int(img.height * ratio)
+        return img.resize((max_width, new_height), Image.Resampling.LANCZOS)
+
+    def _encode_within_budget(self, img, profile, image_format='PNG'):
+        """프로필(PNG 계열 입력) 또는 원본 형식으로 저장 후, 용량이 크면 예산에 맞는 품질의 JPEG로 재압축
+
+        (바이트, 소문자 형식) 반환
+        """
+        if image_format == 'PNG':
+            data = self.encode_profile(img, profile)
+            image_format = self.PROFILES[profile]['format']
+        else:
+            data = self._save(img, image_format, quality=self.max_quality, optimize=True)
+
+        # 압축 후에도 크기가 큰 경우 예산에 맞는 품질의 JPEG로 압축
+        if len(data) > self.max_file_size:
+            data = self._fit_jpeg(img, data if image_format == 'JPEG' else None)
+            image_format = 'JPEG'
+        return data, image_format.lower()
+
+    def encode_upload(self, img, filename, source_format=None):
+        """업로드용 변형 인코딩: 최대 너비로 축소 후 저장, 용량이 크면 예산에 맞는 품질의 JPEG로 재압축
+
+        축소했거나 PNG(또는 메모리 이미지)이면 업로드용 프로필로, 그 밖의 원본 형식(JPEG 등)은 그 형식대로 저장한다.
+        """
+        image_format = source_format or 'PNG'
+        resized = self._resize(img, self.max_width)
+        if resized is not img:
+            image_format = 'PNG'
+        data, image_format = self._encode_within_budget(resized, self.upload_profile, image_format)
+        return EncodedImage(filename, data, image_format)
+
+    def get_variant_filename(self, filename, name, image_format):
+        """출력 크기별 파일명 (원본 파일명 + 접미사 + 형식 확장자)"""
+        stem = os.path.splitext(filename)[0]
+        return f"{stem}{self.sizes[name]['suffix']}{self.FORMAT_EXTENSIONS.get(image_format, '.' + image_format)}"
+
+    def encode_sizes(self, img, filename, names):
+        """이름별 출력 크기를 한 번에 인코딩해 {이름: EncodedImage} 반환
+
+        큰 크기부터 차례로 만들고, 작은 크기는 원본이 아니라 바로 앞 단계의 축소 이미지에서 다시 축소한다.
+        """
+        unknown = [name for name in names if name not in self.sizes]
+        if unknown:
+            raise ValueError(f"알 수 없는 출력 크기: {', '.join(unknown)} (사용 가능: {', '.join(self.sizes)})")
+
+        variants = {}
+        source = img
+        for name in sorted(set(names), key=lambda name: self.sizes[name]['max_width'], reverse=True):
+            size = self.sizes[name]
+            source = self._resize(source, size['max_width'])
+            data, image_format = self._encode_within_budget(source, size['profile'])
+            variants[name] = EncodedImage(self.get_variant_filename(filename, name, image_format), data, image_format)
+        return variants
+
+    def _get_file_hash(self, path):
+        """파일 내용 해시 (수정 시각과 크기가 같으면 이전 결과 재사용)"""
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        file_hash = self._file_hashes.get(key)
+        if file_hash is None:
+            sha256 = hashlib.sha256()
+            with open(path, 'rb') as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                    sha256.update(chunk)
+            file_hash = sha256.hexdigest()
+            self._file_hashes[key] = file_hash
+        return file_hash
+
+    def encode_file(self, path):
+        """이미지 파일의 업로드용 변형 (같은 파일 내용과 설정이면 이전 압축 결과 재사용)"""
+        payload = {'file': self._get_file_hash(path), 'settings': self.get_signature()}
+        key = hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+        filename = os.path.basename(path)
+
+        with self._lock:
+            data = self._memo.get(key)
+        if data is not None:
+            self.memo_hits += 1
+            return EncodedImage(filename, data, self.detect_format(data))
+
+        if self.store:
+            data = self.store.get_data(key, '.compressed')
+            if data is not None:
+                self.store_hits += 1
+                with self._lock:
+                    self._memo[key] = data
+                return EncodedImage(filename, data, self.detect_format(data))
+
+        with Image.open(path) as img:
+            encoded = self.encode_upload(img, filename, img.format)
+        with self._lock:
+            self._memo[key] = encoded.data
+        if self.store:
+            self.store.put_data(key, encoded.data, '.compressed')
+        return encoded
+
+    def get_stats(self):
+        """인코딩 횟수와 압축 결과 재사용 횟수 반환"""
+        return {
+            "encodes": self.encodes,
+            "memo_hits": self.memo_hits,
+            "store_hits": self.store_hits
+        }
+
+    def encode(self, img, filename, sizes=()):
+        """(보관용 바이트, {출력 크기 이름: EncodedImage}) 반환"""
+        archive = self.encode_archive(img)
+        return archive, self.encode_sizes(img, filename, sizes) if sizes else {}
+
+    @staticmethod
+    def detect_format(data):
+        """바이트의 시그니처로 이미지 형식 판별"""
+        if data.startswith(b'\x89PNG'):
+            return 'png'
+        if data.startswith(b'\xff\xd8'):
+            return 'jpeg'
+        if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+            return 'webp'
+        return 'png'
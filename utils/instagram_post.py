@@ -1,5 +1,8 @@
 import os
+import random
 import requests
+from utils.http_client import HttpClient
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from datetime import datetime
 import time  # 상단에 time 모듈 import 추가
@@ -8,47 +11,59 @@ import time  # 상단에 time 모듈 import 추가
 load_dotenv()
 
 class InstagramAPI:
-    def __init__(self):
-        """Initialize Instagram API with credentials from environment variables"""
-        self.access_token = os.getenv("INSTAGRAM_ACCESS_TOKEN")
-        self.account_id = os.getenv("INSTAGRAM_ACCOUNT_ID")
+    def __init__(self, access_token=None, account_id=None, graph_url="https://graph.facebook.com", timeout=(5, 30)):
+        """Initialize Instagram API with credentials from environment variables
+
+        Args:
+            access_token (str, optional): 액세스 토큰 (기본값: INSTAGRAM_ACCESS_TOKEN)
+            account_id (str, optional): 계정 ID (기본값: INSTAGRAM_ACCOUNT_ID)
+            graph_url (str): Graph API 주소 (테스트할 때는 로컬 대역 서버 주소)
+            timeout (tuple): 요청별 (연결, 응답 대기) 타임아웃(초)
+        """
+        self.access_token = access_token or os.getenv("INSTAGRAM_ACCESS_TOKEN")
+        self.account_id = account_id or os.getenv("INSTAGRAM_ACCOUNT_ID")
         
         if not self.access_token or not self.account_id:
             raise ValueError("Instagram 자격 증명이 설정되지 않았습니다. .env 파일을 확인해주세요.")
         
         self.api_version = "v18.0"
-        self.base_url = f"https://graph.facebook.com/{self.api_version}"
+        self.base_url = f"{graph_url.rstrip('/')}/{self.api_version}"
+        self.timeout = timeout
+        self.http = HttpClient()
 
-    def _test_image_url(self, image_url, max_retries=5, delay=2):
+    def _test_image_url(self, image_url, max_retries=6, base_delay=0.5, max_delay=8):
         """
         이미지 URL 접근성 테스트를 재시도하는 헬퍼 함수
         
+        재시도 간 대기 시간은 base_delay부터 두 배씩 늘린 값(최대 max_delay) 안에서 무작위로 정한다.
+        (여러 이미지를 동시에 확인할 때 요청이 한꺼번에 몰리지 않도록 지터 적용)
+        
         Args:
             image_url (str): 테스트할 이미지 URL
-            max_retries (int): 최대 재시도 횟수
-            delay (int): 재시도 간 대기 시간(초)
+            max_retries (int): 최대 시도 횟수
+            base_delay (float): 첫 재시도 대기 시간 상한(초)
+            max_delay (float): 재시도 대기 시간 상한(초)
             
         Returns:
             bool: 접근 가능하면 True, 아니면 False
         """
         for attempt in range(max_retries):
             try:
-                test_response = requests.head(image_url)
+                # 재시도는 아래 백오프 루프에서 처리
+                test_response = self.http.head(image_url, retries=0, endpoint='HEAD image', timeout=self.timeout)
                 print(f"시도 {attempt + 1}/{max_retries} - HTTP 상태: {test_response.status_code}")
                 print(f"Content-Type: {test_response.headers.get('content-type', 'unknown')}")
                 
                 if test_response.status_code == 200:
                     return True
                     
-                if attempt < max_retries - 1:  # 마지막 시도가 아니면 대기
-                    print(f"{delay}초 후 재시도...")
-                    time.sleep(delay)
-                    
             except Exception as e:
                 print(f"시도 {attempt + 1}/{max_retries} - 실패: {str(e)}")
-                if attempt < max_retries - 1:
-                    print(f"{delay}초 후 재시도...")
-                    time.sleep(delay)
+
+            if attempt < max_retries - 1:  # 마지막 시도가 아니면 대기
+                delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+                print(f"{delay:.2f}초 후 재시도...")
+                time.sleep(delay)
         
         return False
 
@@ -81,7 +96,7 @@ class InstagramAPI:
         print("Parameters:", {k: v if k != 'access_token' else '****' for k, v in container_params.items()})
         
         try:
-            response = requests.post(container_url, params=container_params)
+            response = self.http.post(container_url, params=container_params, timeout=self.timeout)
             print(f"\nAPI 응답 상태 코드: {response.status_code}")
             
             if response.status_code != 200:
@@ -126,7 +141,7 @@ class InstagramAPI:
         print("Parameters:", {k: v if k != 'access_token' else '****' for k, v in container_params.items()})
         
         try:
-            response = requests.post(container_url, params=container_params)
+            response = self.http.post(container_url, params=container_params, timeout=self.timeout)
             print(f"\nAPI 응답 상태 코드: {response.status_code}")
             
             if response.status_code != 200:
@@ -167,7 +182,7 @@ class InstagramAPI:
         print("Parameters:", {k: v if k != 'access_token' else '****' for k, v in container_params.items()})
         
         try:
-            response = requests.post(container_url, params=container_params)
+            response = self.http.post(container_url, params=container_params, timeout=self.timeout)
             print(f"\nAPI 응답 상태 코드: {response.status_code}")
             
             if response.status_code != 200:
@@ -205,7 +220,7 @@ class InstagramAPI:
         print("Parameters:", {k: v if k != 'access_token' else '****' for k, v in publish_params.items()})
         
         try:
-            response = requests.post(publish_url, params=publish_params)
+            response = self.http.post(publish_url, params=publish_params, timeout=self.timeout)
             print(f"\nAPI 응답 상태 코드: {response.status_code}")
             
             if response.status_code != 200:
@@ -242,11 +257,12 @@ class InstagramAPI:
             if len(image_paths) > 1:
                 print(f"캐러셀 이미지 업로드 중... (총 {len(image_paths)}장)")
                 
-                # 각 이미지를 캐러셀 아이템으로 생성
+                # 각 이미지의 URL 확인과 캐러셀 아이템 생성을 동시에 처리 (결과는 이미지 순서대로)
+                with ThreadPoolExecutor(max_workers=len(image_paths)) as executor:
+                    responses = list(executor.map(self._create_carousel_item, image_paths))
+                
                 children_ids = []
-                for i, image_url in enumerate(image_paths, 1):
-                    print(f"이미지 {i}/{len(image_paths)} 처리 중...")
-                    response = self._create_carousel_item(image_url)
+                for i, response in enumerate(responses, 1):
                     if "id" not in response:
                         return {"success": False, "error": f"캐러셀 아이템 {i} 생성 실패"}
                     children_ids.append(response["id"])
@@ -0,0 +1,67 @@
+import os
+import uuid
+
+class MultipartStream:
+    """multipart/form-data 본문을 한 번에 만들지 않고 조각 단위로 내보내는 요청 본문
+
+    requests에 data로 넘기면 __len__으로 Content-Length를 먼저 보내고(청크 전송 없음) __iter__로 본문을 보낸다.
+    파일 경로는 chunk_size 단위로 읽어서, 메모리의 바이트는 복사하지 않고 memoryview 조각으로 보낸다.
+    여러 번 반복할 수 있어 같은 본문으로 다시 요청할 수도 있다.
+    """
+
+    def __init__(self, boundary=None, chunk_size=64 * 1024):
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self._parts = []
+
+    @property
+    def content_type(self):
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @staticmethod
+    def _quote(value):
+        """헤더 파라미터 값의 따옴표와 줄바꿈 이스케이프 (urllib3와 같은 HTML5 방식)"""
+        return value.replace('\\', '\\\\').replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A')
+
+    def _header(self, name, filename=None, content_type=None):
+        disposition = f'form-data; name="{self._quote(name)}"'
+        if filename is not None:
+            disposition += f'; filename="{self._quote(filename)}"'
+        lines = [f"--{self.boundary}", f"Content-Disposition: {disposition}"]
+        if content_type:
+            lines.append(f"Content-Type: {content_type}")
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8')
+
+    def add_field(self, name, value):
+        """일반 폼 필드 추가"""
+        self._parts.append((self._header(name), str(value).encode('utf-8'), None))
+
+    def add_file(self, name, filename, data=None, path=None, content_type='application/octet-stream'):
+        """파일 필드 추가 (data: bytes/memoryview, path: 전송할 때 읽을 파일 경로)"""
+        if (data is None) == (path is None):
+            raise ValueError("data와 path 중 하나만 지정해야 합니다.")
+        self._parts.append((self._header(name, filename, content_type), data, path))
+
+    def _footer(self):
+        return f"--{self.boundary}--\r\n".encode('utf-8')
+
+    def __len__(self):
+        total = len(self._footer())
+        for header, data, path in self._parts:
+            size = os.path.getsize(path) if path is not None else len(data)
+            total += len(header) + size + 2
+        return total
+
+    def __iter__(self):
+        for header, data, path in self._parts:
+            yield header
+            if path is not None:
+                with open(path, 'rb') as file:
+                    for chunk in iter(lambda: file.read(self.chunk_size), b''):
+                        yield chunk
+            else:
+                view = memoryview(data)
+                for offset in range(0, len(view), self.chunk_size):
+                    yield view[offset:offset + self.chunk_size]
+            yield b'\r\n'
+        yield self._footer()
@@ -0,0 +1,162 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import requests
+from utils.http_client import HttpClient
+
+class NaverTokenError(Exception):
+    """네이버 액세스 토큰을 갱신할 수 없을 때 발생하는 예외"""
+    pass
+
+class NaverTokenManager:
+    """네이버 OAuth 토큰과 만료 시각을 전용 JSON 파일에 보관하고, 만료 전에 미리 갱신하는 관리자
+
+    토큰이 유효한지 API를 호출해 확인하지 않고, 갱신 응답의 expires_in으로 기록한 만료 시각만 본다.
+    상태 파일이 없으면 환경 변수(NAVER_ACCESS_TOKEN, NAVER_REFRESH_TOKEN)의 토큰으로 시작하며,
+    이때는 만료 시각을 모르므로 처음 사용할 때 한 번 갱신한다.
+    상태 파일에는 시작할 때 쓴 환경 변수의 리프레시 토큰(env_refresh_token)도 기록해, 환경 변수가
+    바뀌면 새 토큰으로 다시 시작하고, 저장된 토큰으로 갱신에 실패하면 환경 변수의 토큰으로 한 번 더 시도한다.
+    """
+
+    def __init__(self, client_id=None, client_secret=None, state_path=None, refresh_margin=300, timeout=(5, 30),
+                 token_url="https://nid.naver.com/oauth2.0/token"):
+        self.client_id = client_id or os.getenv('NAVER_CLIENT_ID')
+        self.client_secret = client_secret or os.getenv('NAVER_CLIENT_SECRET')
+        # 상태 파일 (기본값: 루트 경로의 .naver_token.json)
+        self.state_path = state_path or os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.naver_token.json'
+        )
+        self.refresh_margin = refresh_margin  # 만료 몇 초 전부터 미리 갱신할지
+        self.timeout = timeout
+        self.token_url = token_url
+        self.http = HttpClient()
+        self._lock = threading.Lock()
+        self._state = self._load_state()
+
+    def _env_state(self):
+        """환경 변수의 토큰으로 만든 초기 상태 (만료 시각을 모르므로 0)"""
+        return {
+            'access_token': os.getenv('NAVER_ACCESS_TOKEN'),
+            'refresh_token': os.getenv('NAVER_REFRESH_TOKEN'),
+            'expires_at': 0,
+            'env_refresh_token': os.getenv('NAVER_REFRESH_TOKEN')
+        }
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as file:
+                state = json.load(file)
+        except FileNotFoundError:
+            return self._env_state()
+        except (OSError, ValueError) as e:
+            print(f"토큰 상태 파일을 읽을 수 없습니다: {self.state_path} - {e}")
+            return self._env_state()
+
+        env_refresh_token = os.getenv('NAVER_REFRESH_TOKEN')
+        if 'env_refresh_token' not in state:
+            # 이전 형식의 상태 파일: 지금 환경 변수의 토큰에서 시작한 것으로 기록
+            state['env_refresh_token'] = env_refresh_token
+        elif env_refresh_token and env_refresh_token != state['env_refresh_token']:
+            print(f"NAVER_REFRESH_TOKEN이 바뀌어 상태 파일 대신 환경 변수의 토큰을 사용합니다: {self.state_path}")
+            return self._env_state()
+        return state
+
+    def _save_state(self):
+        """임시 파일에 쓴 뒤 교체 (쓰는 도중 중단되어도 이전 상태가 남음)"""
+        directory = os.path.dirname(os.path.abspath(self.state_path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.naver_token', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(self._state, file)
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self.state_path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @property
+    def access_token(self):
+        return self._state.get('access_token')
+
+    @property
+    def refresh_token(self):
+        return self._state.get('refresh_token')
+
+    @property
+    def expires_at(self):
+        return self._state.get('expires_at', 0)
+
+    def needs_refresh(self, now=None):
+        """토큰이 없거나 만료 refresh_margin초 전이면 True"""
+        now = time.time() if now is None else now
+        return not self.access_token or now >= self.expires_at - self.refresh_margin
+
+    def get_access_token(self):
+        """유효한 액세스 토큰 반환 (만료가 가까우면 먼저 갱신)"""
+        with self._lock:
+            if self.needs_refresh():
+                self._refresh()
+            return self.access_token
+
+    def invalidate(self):
+        """API가 토큰을 거부했을 때 호출: 다음 get_access_token에서 갱신"""
+        with self._lock:
+            self._state['expires_at'] = 0
+
+    def refresh(self):
+        """토큰을 즉시 갱신하고 새 액세스 토큰 반환"""
+        with self._lock:
+            self._refresh()
+            return self.access_token
+
+    def _refresh(self):
+        if not self.refresh_token:
+            raise NaverTokenError(f"리프레시 토큰이 없습니다. NAVER_REFRESH_TOKEN을 설정해주세요. (상태 파일: {self.state_path})")
+
+        try:
+            token_info, requested_at = self._request_token(self.refresh_token)
+        except NaverTokenError as e:
+            # 저장된 토큰이 만료되었어도 환경 변수에 다른 토큰이 있으면 그 토큰으로 다시 시작
+            env_state = self._env_state()
+            if not env_state['refresh_token'] or env_state['refresh_token'] == self.refresh_token:
+                raise NaverTokenError(f"{e} (상태 파일 {self.state_path}의 리프레시 토큰이 만료되었다면 "
+                                      f"NAVER_REFRESH_TOKEN을 새 토큰으로 설정해주세요.)") from e
+            print(f"상태 파일의 리프레시 토큰으로 갱신하지 못해 환경 변수의 토큰으로 다시 시도합니다: {e}")
+            self._state = env_state
+            try:
+                token_info, requested_at = self._request_token(self.refresh_token)
+            except NaverTokenError as env_error:
+                raise NaverTokenError(f"{env_error} (상태 파일 {self.state_path}와 NAVER_REFRESH_TOKEN의 "
+                                      f"리프레시 토큰 모두 갱신에 실패했습니다.)") from env_error
+
+        # 새로운 토큰 저장 (만료 시각은 요청을 보낸 시각 기준)
+        self._state = {
+            'access_token': token_info['access_token'],
+            'refresh_token': token_info.get('refresh_token') or self.refresh_token,
+            'expires_at': requested_at + int(token_info.get('expires_in', 3600)),
+            'env_refresh_token': self._state.get('env_refresh_token')
+        }
+        self._save_state()
+        print("액세스 토큰이 갱신되었습니다.")
+
+    def _request_token(self, refresh_token):
+        """리프레시 토큰으로 새 토큰을 요청해 (응답, 요청 시각) 반환"""
+        data = {
+            "grant_type": "refresh_token",
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "refresh_token": refresh_token
+        }
+        try:
+            requested_at = time.time()
+            response = self.http.post(self.token_url, data=data, timeout=self.timeout)
+            response.raise_for_status()
+            token_info = response.json()
+            if 'access_token' not in token_info:
+                raise NaverTokenError(f"토큰 갱신 응답에 access_token이 없습니다: {token_info}")
+        except (requests.RequestException, ValueError) as e:
+            raise NaverTokenError(f"토큰 갱신 오류: {e}") from e
+        return token_info, requested_at
@@ -0,0 +1,86 @@
+import asyncio
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from utils.logger_util import LoggerUtil
+
+# 채널별 게시 결과 (성공 여부, 소요 시간(초), 채널 함수의 반환값, 실패 사유, 시간 초과 여부)
+# 시간 초과된 채널 함수는 백그라운드에서 계속 실행되므로 실제로 게시되었는지 알 수 없다
+PublishResult = namedtuple('PublishResult', ['channel', 'success', 'elapsed', 'result', 'error', 'timed_out'],
+                           defaults=(False,))
+
+class Publisher:
+    """같은 카드를 여러 채널(게시판, 텔레그램, 네이버 카페, 인스타그램)에 동시에 게시하는 비동기 게시기
+
+    채널마다 독립적으로 실행되어 한 채널의 실패나 타임아웃이 다른 채널에 영향을 주지 않고,
+    전체 소요 시간은 채널 시간의 합이 아니라 가장 느린 채널 정도가 된다.
+    동기 채널 함수는 스레드에서 실행된다. 타임아웃된 스레드는 중단할 수 없으므로
+    채널 클라이언트 자체의 HTTP 타임아웃이 끝날 때까지 백그라운드에 남는다.
+    """
+
+    def __init__(self, default_timeout=60):
+        self.default_timeout = default_timeout
+        self.channels = {}
+        self.logger = LoggerUtil().get_logger()
+
+    def add_channel(self, name, func, *args, timeout=None, **kwargs):
+        """채널 추가 (func: 동기 함수 또는 코루틴 함수, timeout: 채널별 제한 시간(초))"""
+        self.channels[name] = (func, args, kwargs, timeout or self.default_timeout)
+
+    @staticmethod
+    def _is_failure(result):
+        """채널 함수가 예외 대신 반환값으로 알린 실패 (False, {'success': False}, {'ok': False})"""
+        if result is False:
+            return True
+        if isinstance(result, dict):
+            return result.get('success') is False or result.get('ok') is False
+        return False
+
+    async def _run_channel(self, name, executor):
+        func, args, kwargs, timeout = self.channels[name]
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            if asyncio.iscoroutinefunction(func):
+                call = func(*args, **kwargs)
+            else:
+                call = loop.run_in_executor(executor, partial(func, *args, **kwargs))
+            result = await asyncio.wait_for(call, timeout)
+        except asyncio.TimeoutError:
+            elapsed = time.perf_counter() - start
+            self.logger.error(f"[{name}] 게시 시간 초과 ({timeout}초)")
+            return PublishResult(name, False, elapsed, None, f"{timeout}초 안에 완료되지 않았습니다.", timed_out=True)
+        except (Exception, SystemExit) as e:
+            elapsed = time.perf_counter() - start
+            self.logger.error(f"[{name}] 게시 실패: {e}")
+            error = f"SystemExit({e.code})" if isinstance(e, SystemExit) else (str(e) or type(e).__name__)
+            return PublishResult(name, False, elapsed, None, error)
+
+        elapsed = time.perf_counter() - start
+        if self._is_failure(result):
+            self.logger.error(f"[{name}] 게시 실패: {result}")
+            return PublishResult(name, False, elapsed, result, str(result))
+
+        self.logger.info(f"[{name}] 게시 완료 ({elapsed:.2f}초)")
+        return PublishResult(name, True, elapsed, result, None)
+
+    async def publish_async(self):
+        """모든 채널에 동시에 게시하고 추가한 순서대로 PublishResult 목록 반환"""
+        if not self.channels:
+            return []
+
+        executor = ThreadPoolExecutor(max_workers=len(self.channels), thread_name_prefix='publisher')
+        try:
+            start = time.perf_counter()
+            results = await asyncio.gather(*(self._run_channel(name, executor) for name in self.channels))
+            self.logger.info(f"채널 {len(results)}개 게시 완료 ({time.perf_counter() - start:.2f}초, "
+                             f"실패 {sum(not result.success for result in results)}개)")
+        finally:
+            # 타임아웃된 채널의 스레드를 기다리지 않음
+            executor.shutdown(wait=False)
+        return list(results)
+
+    def publish(self):
+        """동기 코드에서 호출하는 publish_async"""
+        return asyncio.run(self.publish_async())
@@ -0,0 +1,152 @@
+import atexit
+import queue
+import threading
+import time
+from utils.logger_util import LoggerUtil
+from utils.telegram_util import TelegramUtil
+
+class TelegramNotifier:
+    """텔레그램 알림을 큐에 넣고 백그라운드 스레드에서 보내는 알림기
+
+    notify()는 큐에 넣고 바로 반환하므로 느린 텔레그램 응답이 파이프라인을 막지 않는다.
+    짧은 시간(coalesce_window) 안에 몰린 같은 채팅방의 메시지는 한 메시지로 합쳐 보내고,
+    채팅방별 전송 간격(chat_interval)과 429 응답의 retry_after를 지킨다.
+    프로세스가 끝날 때 남은 메시지를 최대 flush_timeout초까지만 기다려 보낸다.
+    """
+
+    # Bot API 메시지 최대 길이
+    MAX_MESSAGE_LENGTH = 4096
+    SEPARATOR = "\n\n"
+
+    def __init__(self, telegram=None, coalesce_window=1.0, chat_interval=1.0, max_retries=3, flush_timeout=10):
+        """
+        Args:
+            telegram (TelegramUtil, optional): 전송에 사용할 클라이언트 (기본값: 새 TelegramUtil)
+            coalesce_window (float): 첫 메시지 뒤 이어지는 메시지를 모아 합치는 시간(초)
+            chat_interval (float): 같은 채팅방에 연속으로 보낼 때 최소 간격(초)
+            max_retries (int): 메시지 하나당 최대 전송 시도 횟수
+            flush_timeout (float): 종료 시 남은 메시지를 기다리는 최대 시간(초)
+        """
+        self.telegram = telegram or TelegramUtil()
+        self.coalesce_window = coalesce_window
+        self.chat_interval = chat_interval
+        self.max_retries = max_retries
+        self.flush_timeout = flush_timeout
+        self.logger = LoggerUtil().get_logger()
+        self._queue = queue.Queue()
+        self._last_sent = {}  # 채팅방별 마지막 전송 시각
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self.sent_count = 0  # 실제로 보낸 Bot API 요청 수
+        atexit.register(self.close)
+
+    def notify(self, message, chat_id=None):
+        """메시지를 큐에 넣고 바로 반환 (chat_id 기본값: TELEGRAM_CHAT_ID)"""
+        self._enqueue(chat_id or self.telegram.chat_id, message)
+
+    def notify_test(self, message):
+        """테스트용 채팅방(TELEGRAM_CHAT_TEST_ID)으로 보낼 메시지를 큐에 넣음"""
+        self._enqueue(self.telegram.chat_test_id, message)
+
+    def _enqueue(self, chat_id, message):
+        with self._lock:
+            if self._closed:
+                self.logger.warning(f"종료된 알림기라 텔레그램 메시지를 보내지 않습니다: {message[:50]}")
+                return
+            # 스레드는 처음 알림이 들어올 때 시작
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='telegram-notifier', daemon=True)
+                self._thread.start()
+            self._queue.put((chat_id, message))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            # 이어서 들어오는 메시지를 coalesce_window 동안 모음
+            deadline = time.monotonic() + self.coalesce_window
+            stop = False
+            while True:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            for chat_id, text in self._coalesce(batch):
+                self._send(chat_id, text)
+            if stop:
+                return
+
+    def _coalesce(self, batch):
+        """채팅방별로 메시지를 순서대로 이어 붙이되 최대 길이를 넘지 않게 나눔"""
+        grouped = {}
+        for chat_id, message in batch:
+            grouped.setdefault(chat_id, []).append(message[:self.MAX_MESSAGE_LENGTH])
+
+        for chat_id, messages in grouped.items():
+            text = messages[0]
+            for message in messages[1:]:
+                if len(text) + len(self.SEPARATOR) + len(message) > self.MAX_MESSAGE_LENGTH:
+                    yield chat_id, text
+                    text = message
+                else:
+                    text += self.SEPARATOR + message
+            yield chat_id, text
+
+    def _send(self, chat_id, text):
+        for attempt in range(self.max_retries):
+            # 같은 채팅방에는 chat_interval 간격을 두고 전송
+            wait = self._last_sent.get(chat_id, 0) + self.chat_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                result = self.telegram.send_text(chat_id, text)
+            except Exception as e:
+                result = {'ok': False, 'description': str(e)}
+            self._last_sent[chat_id] = time.monotonic()
+            self.sent_count += 1
+
+            if result.get('ok'):
+                return True
+            # 429: 텔레그램이 알려준 시간만큼 기다렸다가 재시도
+            retry_after = (result.get('parameters') or {}).get('retry_after')
+            if result.get('error_code') == 429 and retry_after:
+                self._last_sent[chat_id] = time.monotonic() + retry_after - self.chat_interval
+            elif result.get('error_code') and result.get('error_code') < 500:
+                break
+            self.logger.warning(f"텔레그램 알림 전송 실패 ({attempt + 1}/{self.max_retries}): {result.get('description')}")
+
+        self.logger.error(f"텔레그램 알림을 보내지 못했습니다: {text[:50]}")
+        return False
+
+    def flush(self, timeout=None):
+        """큐에 있는 메시지를 모두 보내고 알림 스레드 종료 (최대 timeout초 대기)
+
+        Returns:
+            bool: 시간 안에 모두 보냈으면 True
+        """
+        timeout = self.flush_timeout if timeout is None else timeout
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return True
+        self._queue.put(None)
+        thread.join(timeout)
+        if thread.is_alive():
+            self.logger.error(f"텔레그램 알림을 {timeout}초 안에 모두 보내지 못했습니다. 남은 알림은 버립니다.")
+            return False
+        return True
+
+    def close(self):
+        """프로세스 종료 시(atexit) 호출되는 flush"""
+        if not self._closed:
+            self.flush()
@@ -1,7 +1,5 @@
 import os
-from urllib.request import urlopen
-import urllib.parse
-import requests
+from utils.http_client import HttpClient
 from dotenv import load_dotenv
 import json
 
@@ -9,19 +7,40 @@ import json
 load_dotenv()
 
 class TelegramUtil:
-    def __init__(self):
+    def __init__(self, api_url="https://api.telegram.org", timeout=(5, 30)):
+        """
+        Args:
+            api_url (str): Bot API 주소 (테스트할 때는 로컬 대역 서버 주소)
+            timeout (tuple): 요청별 (연결, 응답 대기) 타임아웃(초)
+        """
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
         self.chat_test_id = os.getenv('TELEGRAM_CHAT_TEST_ID')
+        self.base_url = f"{api_url.rstrip('/')}/bot{self.bot_token}"
+        self.timeout = timeout
+        # 호스트별 연결을 재사용하는 공용 HTTP 클라이언트
+        self.http = HttpClient()
+
+    def send_text(self, chat_id, message):
+        """메시지를 POST 본문으로 전송하고 Bot API 응답(JSON) 반환
+
+        실패(429 등)도 예외 대신 응답의 ok, error_code, parameters로 알려준다.
+        """
+        payload = {
+            "chat_id": chat_id,
+            "text": message,
+            "parse_mode": "html"
+        }
+        response = self.http.post(f"{self.base_url}/sendMessage", data=payload, timeout=self.timeout)
+        return response.json()
 
     def send_message(self, message):
         """일반 메시지 전송"""
-        message = urllib.parse.quote_plus(message)
-        urlopen(f"https://api.telegram.org/bot{self.bot_token}/sendMessage?chat_id={self.chat_id}&parse_mode=html&text={message}")
+        return self.send_text(self.chat_id, message)
 
     def send_photo(self, photo_path, caption=""):
         """이미지 전송"""
-        url = f"https://api.telegram.org/bot{self.bot_token}/sendPhoto"
+        url = f"{self.base_url}/sendPhoto"
         
         with open(photo_path, 'rb') as photo:
             payload = {
@@ -32,18 +51,17 @@ class TelegramUtil:
             files = {
                 "photo": photo
             }
-            response = requests.post(url, data=payload, files=files)
+            response = self.http.post(url, data=payload, files=files, timeout=self.timeout)
         
         return response.json()
 
     def send_test_message(self, message):
         """테스트용 채팅방으로 메시지 전송"""
-        message = urllib.parse.quote_plus(message)
-        urlopen(f"https://api.telegram.org/bot{self.bot_token}/sendMessage?chat_id={self.chat_test_id}&parse_mode=html&text={message}") 
+        return self.send_text(self.chat_test_id, message)
 
     def send_multiple_photo(self, photo_paths, caption=""):
         """여러 장의 이미지 한 번에 전송"""
-        url = f"https://api.telegram.org/bot{self.bot_token}/sendMediaGroup"
+        url = f"{self.base_url}/sendMediaGroup"
         
         media = []
         files = {}
@@ -70,7 +88,7 @@ class TelegramUtil:
             }
             
             # 요청 보내기
-            response = requests.post(url, data=payload, files=files)
+            response = self.http.post(url, data=payload, files=files, timeout=self.timeout)
             
             # 파일들 닫기
             for file in files.values():
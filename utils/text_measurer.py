@@ -0,0 +1,194 @@
+import threading
+from collections import OrderedDict
+from PIL import ImageFont
+
+def _pixel(value):
+    """26.6 고정소수점 값을 가장 가까운 픽셀로 반올림 (Pillow의 PIXEL 매크로와 동일)"""
+    return ((value + 32) & -64) >> 6
+
+class GlyphTable:
+    """폰트 하나(경로, 크기)의 글자별 advance/bbox와 글자 쌍 커닝 값 테이블
+
+    Pillow 기본 레이아웃은 26.6 고정소수점 펜 위치에 글자별 bbox를 더해 줄의 bbox를 구하므로,
+    처음 나온 글자와 커닝이 있는 글자 쌍만 폰트로 측정하고 이후에는 테이블 조회로 같은 값을 계산한다.
+    """
+
+    def __init__(self, font, has_kerning=None):
+        self.font = font
+        self.has_kerning = has_kerning
+        self.advances = {}
+        self.bboxes = {}
+        self.kerning = {}
+        self.glyph_misses = 0
+        self.pair_misses = 0
+
+    def _glyph(self, char):
+        advance = self.advances.get(char)
+        if advance is None:
+            advance = round(self.font.getlength(char) * 64)
+            self.advances[char] = advance
+            self.bboxes[char] = self.font.getbbox(char)
+            self.glyph_misses += 1
+        return advance
+
+    def _kern(self, pair):
+        kern = self.kerning.get(pair)
+        if kern is None:
+            if self.has_kerning is not None and not self.has_kerning(pair):
+                kern = 0
+            else:
+                kern = round(self.font.getlength(pair) * 64) - self._glyph(pair[0]) - self._glyph(pair[1])
+                self.pair_misses += 1
+            self.kerning[pair] = kern
+        return kern
+
+    def preload(self, chars):
+        """글자 목록의 advance/bbox를 미리 측정"""
+        for char in chars:
+            self._glyph(char)
+
+    def getbbox(self, text):
+        """font.getbbox(text)와 같은 (left, top, right, bottom) 반환"""
+        if not text:
+            return (0, 0, 0, 0)
+
+        advances = self.advances
+        bboxes = self.bboxes
+        kerning = self.kerning
+
+        first = text[0]
+        position = advances.get(first)
+        if position is None:
+            position = self._glyph(first)
+        left, top, right, bottom = bboxes[first]
+        previous = first
+        for char in text[1:]:
+            advance = advances.get(char)
+            if advance is None:
+                advance = self._glyph(char)
+            pair = previous + char
+            kern = kerning.get(pair)
+            if kern is None:
+                kern = self._kern(pair)
+            position += kern
+            offset = _pixel(position)
+            x0, y0, x1, y1 = bboxes[char]
+            if x0 + offset < left:
+                left = x0 + offset
+            if y0 < top:
+                top = y0
+            if x1 + offset > right:
+                right = x1 + offset
+            if y1 > bottom:
+                bottom = y1
+            position += advance
+            previous = char
+        return (left, top, max(right, _pixel(position)), bottom)
+
+    def getlength(self, text):
+        """font.getlength(text)와 같은 advance 합계 반환"""
+        position = 0
+        previous = None
+        for char in text:
+            position += self._glyph(char)
+            if previous is not None:
+                position += self._kern(previous + char)
+            previous = char
+        return position / 64
+
+class TextMeasurer:
+    """폰트별 GlyphTable을 공유하는 프로세스 전역 텍스트 측정기"""
+    _instance = None
+    _initialized = False
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(TextMeasurer, cls).__new__(cls)
+        return cls._instance
+
+    # 이 크기에서 커닝이 0인 글자 쌍은 더 작은 크기에서도 0이다
+    KERNING_REFERENCE_SIZE = 1024
+
+    def __init__(self, max_tables=256):
+        if not TextMeasurer._initialized:
+            self.max_tables = max_tables
+            self._tables = OrderedDict()
+            self._kerning_fonts = {}
+            self._kerning_pairs = {}
+            self._lock = threading.Lock()
+            self.exact_checks = 0
+            TextMeasurer._initialized = True
+
+    def get_table(self, font):
+        """폰트의 GlyphTable 반환 (없으면 생성), FreeType 폰트가 아니면 None"""
+        if not hasattr(font, 'path'):
+            return None
+
+        key = (font.path, font.size)
+        with self._lock:
+            table = self._tables.get(key)
+            if table is None:
+                table = GlyphTable(font, self._kerning_probe(font.path, font.size))
+                self._tables[key] = table
+            self._tables.move_to_end(key)
+            while len(self._tables) > self.max_tables:
+                self._tables.popitem(last=False)
+            return table
+
+    def _kerning_probe(self, font_path, font_size):
+        """폰트 파일 단위로 글자 쌍의 커닝 여부를 기준 크기에서 한 번만 확인하는 함수 반환"""
+        if font_size > self.KERNING_REFERENCE_SIZE:
+            return None
+
+        pairs = self._kerning_pairs.setdefault(font_path, {})
+
+        def has_kerning(pair):
+            kerned = pairs.get(pair)
+            if kerned is None:
+                reference = self._kerning_fonts.get(font_path)
+                if reference is None:
+                    reference = ImageFont.truetype(font_path, self.KERNING_REFERENCE_SIZE)
+                    self._kerning_fonts[font_path] = reference
+                kerned = reference.getlength(pair) != reference.getlength(pair[0]) + reference.getlength(pair[1])
+                pairs[pair] = kerned
+            return kerned
+
+        return has_kerning
+
+    def getbbox(self, font, text):
+        """테이블 조회로 계산한 텍스트 bbox"""
+        table = self.get_table(font)
+        if table is None:
+            return font.getbbox(text)
+        return table.getbbox(text)
+
+    def getlength(self, font, text):
+        """테이블 조회로 계산한 텍스트 advance 합계"""
+        table = self.get_table(font)
+        if table is None:
+            return font.getlength(text)
+        return table.getlength(text)
+
+    def get_width(self, font, text):
+        """텍스트 너비"""
+        bbox = self.getbbox(font, text)
+        return bbox[2] - bbox[0]
+
+    def get_exact_bbox(self, font, text):
+        """Pillow로 직접 측정한 bbox (최종 확인용)"""
+        self.exact_checks += 1
+        return font.getbbox(text)
+
+    def get_stats(self):
+        """테이블 수와 폰트 직접 측정 횟수 반환"""
+        with self._lock:
+            tables = list(self._tables.values())
+        return {
+            "tables": len(tables),
+            "glyphs": sum(len(table.advances) for table in tables),
+            "pairs": sum(len(table.kerning) for table in tables),
+            "glyph_misses": sum(table.glyph_misses for table in tables),
+            "pair_misses": sum(table.pair_misses for table in tables),
+            "reference_pairs": sum(len(pairs) for pairs in self._kerning_pairs.values()),
+            "exact_checks": self.exact_checks
+        }
@@ -0,0 +1,77 @@
+from utils.text_measurer import TextMeasurer
+
+class TextWrapper:
+    """실제 픽셀 너비를 기준으로 한 줄에 들어가는 만큼 어절을 채우는 줄바꿈기
+
+    문장은 마침표로 나누고, 어절(띄어쓰기) 단위로 줄을 바꾼다.
+    한 어절이 줄 너비보다 길면 글자(음절) 단위로 나누되, 닫는 문장부호로 줄이 시작되지 않게 한다.
+    """
+
+    # 줄의 맨 앞에 올 수 없는 문장부호
+    NO_LINE_START = set(',.!?%)]}」』’”…·~')
+
+    def __init__(self, measurer=None):
+        self.measurer = measurer or TextMeasurer()
+
+    def _width(self, font, text):
+        return self.measurer.get_width(font, text)
+
+    def _split_long_word(self, word, font, max_width):
+        """줄 너비보다 긴 어절을 글자 단위로 나누기"""
+        chunks = []
+        current = ''
+        for char in word:
+            candidate = current + char
+            if current and self._width(font, candidate) > max_width and char not in self.NO_LINE_START:
+                chunks.append(current)
+                current = char
+            else:
+                current = candidate
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _wrap_words(self, words, font, max_width):
+        """어절 목록을 줄 너비에 맞춰 앞에서부터 채우기"""
+        lines = []
+        current = ''
+        for word in words:
+            candidate = f"{current} {word}" if current else word
+            if self._width(font, candidate) <= max_width:
+                current = candidate
+                continue
+
+            if current:
+                lines.append(current)
+            if self._width(font, word) <= max_width:
+                current = word
+            else:
+                chunks = self._split_long_word(word, font, max_width)
+                lines.extend(chunks[:-1])
+                current = chunks[-1]
+        if current:
+            lines.append(current)
+        return lines
+
+    def wrap(self, text, font, max_width):
+        """텍스트를 줄 목록으로 나누기"""
+        # 마침표를 기준으로 문장을 나누기
+        sentences = text.split('.')
+        wrapped_lines = []
+
+        for i, sentence in enumerate(sentences):
+            words = sentence.split()
+            if not words:  # 빈 문장 제외
+                continue
+
+            # 마지막 문장이 아니면 마침표를 붙인 채로 줄 너비를 계산
+            if i < len(sentences) - 1:
+                words[-1] = words[-1] + '.'
+
+            wrapped_lines.extend(self._wrap_words(words, font, max_width))
+
+        return wrapped_lines
+
+    def fill(self, text, font, max_width):
+        """줄바꿈 문자로 연결된 텍스트 반환"""
+        return '\n'.join(self.wrap(text, font, max_width))